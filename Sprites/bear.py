@@ -2,29 +2,30 @@
 
 import pygame
 import os
-import random
 import math
 import sys
-from Sprites.powerup import Powerup
-
-class Bear(pygame.sprite.Sprite):
+from assets import ROOT_DIR, load_image, sound_bank
+from lanes import LANE_NAMES, bush_y_coordinates
+from pools import ObjectPool
+from rng import streams
+from timestep import REFERENCE_RATE, Interpolated
+from Sprites.powerup import powerup_pool
+
+class Bear(pygame.sprite.Sprite, Interpolated):
     def __init__(self, image_path, bush_level):
         super().__init__()
+        self.reinit(image_path, bush_level)
+
+    def reinit(self, image_path, bush_level):
+        """Puts the bear in its just-spawned state (also used to recycle it from the pool)."""
         try:
-            self.image = pygame.image.load(image_path).convert_alpha()
+            self.image = load_image(image_path, (60, 60))
         except pygame.error as e:
             print(f"Unable to load bear image at {image_path}: {e}")
             pygame.quit()
             sys.exit()
-        self.image = pygame.transform.scale(self.image, (60, 60))
         self.x = 820  # Start off-screen on the right
 
-        bush_y_coordinates = {
-            'bottom': 543,
-            'lower': 393,
-            'middle': 256,
-            'upper': 113
-        }
         self.bush_level = bush_y_coordinates.get(bush_level, 543)
         self.vx = 0.5
         self.bounce_height = 12
@@ -40,35 +41,24 @@ class Bear(pygame.sprite.Sprite):
         self.hit_count = 0
         self.teleporting = False
         self.descending_for_teleport = False
+        self.remember_position()
 
     def update(self, dt):
+        self.remember_position()
         if self.descending_for_teleport:
-            self.descend_for_teleport()
+            self.descend_for_teleport(dt)
         else:
             # Bear always moves towards the player
-            self.x -= self.vx
+            self.x -= self.vx * dt * REFERENCE_RATE  # vx is in pixels per 1/60 s
             self.bounce_logic(dt)
             self.rect.topleft = (self.x, self.y)
 
     def bounce_logic(self, dt):
         self.y = self.max_bounce_height + int(self.bounce_height * math.sin(self.x / 20))
 
-    def draw(self, screen, bushes):
-        bush_lines = {
-            'upper': (113, 150),
-            'middle': (256, 293),
-            'lower': (393, 430),
-            'bottom': (543, 580)
-        }
-
-        for level, (top, bottom) in bush_lines.items():
-            if self.rect.bottom > top and self.rect.top < bottom:
-                visible_height = top - self.rect.top
-                visible_rect = pygame.Rect(0, 0, self.rect.width, max(0, visible_height))
-                screen.blit(self.image, self.rect.topleft, visible_rect)
-                return
-
-        screen.blit(self.image, self.rect)
+    def draw(self, screen, alpha=1.0):
+        # The bush overlay hides the part of the bear behind the bush
+        screen.blit(self.image, self.rect if alpha >= 1 else self.draw_position(alpha))
 
     def on_hit(self, ammo_type):
         if ammo_type == "berry":
@@ -87,24 +77,19 @@ class Bear(pygame.sprite.Sprite):
         self.hit_count += 1
         if self.hit_count >= 3:
             self.hit_count = 0
-            if random.random() < 0.5:  # 50% chance to teleport
+            if streams.bear.random() < 0.5:  # 50% chance to teleport
                 self.start_teleport()
         return None
 
     def start_teleport(self):
         # Play teleportation sound
-        sound_path = os.path.join("D:/Projects/FoodThrowGame2/sound", "eat.mp3")
-        try:
-            teleport_sound = pygame.mixer.Sound(sound_path)
-            teleport_sound.play()
-        except pygame.error as e:
-            print(f"Unable to load sound at {sound_path}: {e}")
+        sound_bank.play("eat")
 
         self.descending_for_teleport = True
 
-    def descend_for_teleport(self):
+    def descend_for_teleport(self, dt):
         # Move the bear downward until it reaches the lowest bounce point
-        self.y = min(self.y + 5, self.bush_level)  # Adjust speed as needed
+        self.y = min(self.y + 5 * dt * REFERENCE_RATE, self.bush_level)  # Adjust speed as needed
         self.rect.y = self.y
         if self.y >= self.bush_level:
             # Immediately teleport after reaching the lowest point
@@ -113,20 +98,19 @@ class Bear(pygame.sprite.Sprite):
 
     def teleport(self):
         # Randomly select a new bush level
-        new_bush_level = random.choice(['upper', 'middle', 'lower', 'bottom'])
-        bush_y_coordinates = {
-            'upper': 113,
-            'middle': 256,
-            'lower': 393,
-            'bottom': 543
-        }
+        new_bush_level = streams.bear.choice(LANE_NAMES)
         self.bush_level = bush_y_coordinates[new_bush_level]
         self.max_bounce_height = self.bush_level - self.bounce_height
         self.y = self.max_bounce_height
         self.rect.y = self.y
+        self.remember_position()  # Appear in the new lane instead of gliding over to it
 
     def drop_powerup(self):
-        honey_image = os.path.join("D:/Projects/FoodThrowGame2/art", "honey.png")
-        if random.random() < 0.05:
-            return Powerup("honey", *self.rect.center, honey_image)
+        honey_image = os.path.join(ROOT_DIR, "art", "honey.png")
+        if streams.drops.random() < 0.05:
+            return powerup_pool.acquire("honey", *self.rect.center, honey_image)
         return None
+
+
+# Spawned bears are recycled through this pool
+bear_pool = ObjectPool(Bear)
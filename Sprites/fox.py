@@ -4,33 +4,34 @@ import pygame
 import os
 import sys
 import math
-import random
+from assets import ROOT_DIR, load_image, sound_bank
+from lanes import bush_y_coordinates
+from pools import ObjectPool
+from rng import streams
+from timestep import REFERENCE_RATE, Interpolated
 from Sprites.powerup import Powerup  # Import Powerup for spawning powerups
 
-class Fox(pygame.sprite.Sprite):
+class Fox(pygame.sprite.Sprite, Interpolated):
     def __init__(self, image_path, bush_level):
         super().__init__()
+        self.reinit(image_path, bush_level)
+
+    def reinit(self, image_path, bush_level):
+        """Puts the fox in its just-spawned state (also used to recycle it from the pool)."""
         try:
-            self.image = pygame.image.load(image_path).convert_alpha()
+            self.image = load_image(image_path, (60, 60))
         except pygame.error as e:
             print(f"Unable to load fox image at {image_path}: {e}")
             pygame.quit()
             sys.exit()
-        self.image = pygame.transform.scale(self.image, (60, 60))
         self.x = 820  # Start off-screen on the right
 
         # Map bush levels to specific y-coordinates
-        bush_y_coordinates = {
-            'bottom': 543,
-            'lower': 393,
-            'middle': 256,
-            'upper': 113
-        }
         self.bush_level = bush_y_coordinates.get(bush_level, 543)
         self.y = self.bush_level
 
         # Set random speed and corresponding bounce height
-        self.vx = random.choice([1, 2, 3, 4])  # Speed options for fox
+        self.vx = streams.fox_speed.choice([1, 2, 3, 4])  # Speed options for fox
         if self.vx == 1:
             self.bounce_height = 5  # Small hop for slow speed
         elif self.vx == 2:
@@ -52,8 +53,10 @@ class Fox(pygame.sprite.Sprite):
         self.vibration_amplitude = 5
         self.vibration_speed = 20
         self.original_x = self.x
+        self.remember_position()
 
     def update(self, dt):
+        self.remember_position()
         if self.is_hit:
             self.hit_timer -= dt
             # Vibrate in place
@@ -61,10 +64,10 @@ class Fox(pygame.sprite.Sprite):
             if self.hit_timer <= 0:
                 self.is_hit = False
                 self.is_fed = True  # Ensure fox remains fed after vibration
-                self.vx = random.choice([1, 2, 3, 4])
+                self.vx = streams.fox_speed.choice([1, 2, 3, 4])
                 self.x = self.original_x  # Reset position after vibration
         else:
-            self.x -= self.vx
+            self.x -= self.vx * dt * REFERENCE_RATE  # vx is in pixels per 1/60 s
             self.bounce_logic(dt)
             self.rect.topleft = (self.x, self.y)
             self.original_x = self.x  # Update original_x when moving
@@ -76,22 +79,9 @@ class Fox(pygame.sprite.Sprite):
     def bounce_logic(self, dt):
         self.y = self.max_bounce_height + int(self.bounce_height * math.sin(self.x / 20))
 
-    def draw(self, screen, bushes):
-        bush_lines = {
-            'upper': (113, 150),
-            'middle': (256, 293),
-            'lower': (393, 430),
-            'bottom': (543, 580)
-        }
-
-        for level, (top, bottom) in bush_lines.items():
-            if self.rect.bottom > top and self.rect.top < bottom:
-                visible_height = top - self.rect.top
-                visible_rect = pygame.Rect(0, 0, self.rect.width, max(0, visible_height))
-                screen.blit(self.image, self.rect.topleft, visible_rect)
-                return
-
-        screen.blit(self.image, self.rect)
+    def draw(self, screen, alpha=1.0):
+        # The bush overlay hides the part of the fox behind the bush
+        screen.blit(self.image, self.rect if alpha >= 1 else self.draw_position(alpha))
 
     def on_hit(self, ammo_type):
         if ammo_type == "berry" and not self.is_fed:
@@ -99,12 +89,7 @@ class Fox(pygame.sprite.Sprite):
             self.hit_timer = 2  # Fox stops and vibrates for 2 seconds
             self.vx = 0
             # Play eat2.mp3 sound
-            sound_path = os.path.join("D:/Projects/FoodThrowGame2/sound", "eat2.mp3")
-            try:
-                eat_sound = pygame.mixer.Sound(sound_path)
-                eat_sound.play()
-            except pygame.error as e:
-                print(f"Unable to load sound at {sound_path}: {e}")
+            sound_bank.play("eat2")
             if self.can_drop_powerup:
                 self.can_drop_powerup = False
                 return self.drop_powerup()
@@ -112,13 +97,17 @@ class Fox(pygame.sprite.Sprite):
 
     def drop_powerup(self):
         powerup_images = {
-            "apple": os.path.join("D:/Projects/FoodThrowGame2/art", "apple.png"),
-            "pineapple": os.path.join("D:/Projects/FoodThrowGame2/art", "pineapple.png"),
-            "banana": os.path.join("D:/Projects/FoodThrowGame2/art", "banana.png"),
-            "honey": os.path.join("D:/Projects/FoodThrowGame2/art", "honey.png"),
+            "apple": os.path.join(ROOT_DIR, "art", "apple.png"),
+            "pineapple": os.path.join(ROOT_DIR, "art", "pineapple.png"),
+            "banana": os.path.join(ROOT_DIR, "art", "banana.png"),
+            "honey": os.path.join(ROOT_DIR, "art", "honey.png"),
         }
 
         # Use weighted power-up drop logic
         return Powerup.spawn_weighted_for_fox((self.rect.x, self.rect.x + self.rect.width),
                                               (self.rect.y, self.rect.y + self.rect.height),
                                               powerup_images)
+
+
+# Spawned foxes are recycled through this pool
+fox_pool = ObjectPool(Fox)
@@ -1,12 +1,50 @@
 import pygame
-import random
+from assets import load_image
+from pools import ObjectPool
+from rng import streams
 
 class Powerup(pygame.sprite.Sprite):
+    color_shades = {
+        "banana": [(255, 255, 100), (255, 255, 0), (255, 200, 0), (255, 165, 0)],
+        "pineapple": [(50, 205, 50), (34, 139, 34), (255, 180, 0), (255, 165, 0)],
+        "apple": [(255, 50, 50), (255, 0, 0), (255, 150, 150), (255, 192, 203)],
+        "berry": [(255, 70, 70), (255, 0, 0), (200, 0, 0)],
+        "honey": [(255, 183, 76), (255, 165, 0), (234, 140, 30), (210, 105, 30)]
+    }
+
+    # Tinted flash frames shared by every powerup, keyed by (type, image path)
+    flash_frames = {}
+    # Fully transparent frame shown during the "off" half of the fade-out blink
+    blank_frame = None
+
+    @classmethod
+    def get_flash_frames(cls, type, image_path):
+        """Build the BLEND_ADD tinted frames for a powerup type once and share them."""
+        key = (type, image_path)
+        frames = cls.flash_frames.get(key)
+        if frames is None:
+            base = load_image(image_path, (50, 50))
+            frames = []
+            for shade in cls.color_shades.get(type, [(255, 255, 255)]):
+                frame = base.copy()
+                frame.fill(shade, special_flags=pygame.BLEND_ADD)
+                frames.append(frame)
+            cls.flash_frames[key] = frames
+        return frames
+
     def __init__(self, type, x, y, image_path, timer=5):
         super().__init__()
+        self.reinit(type, x, y, image_path, timer)
+
+    def reinit(self, type, x, y, image_path, timer=5):
+        """Sets up a freshly dropped powerup (also used to recycle one from the pool)."""
         self.type = type
-        self.original_image = pygame.image.load(image_path).convert_alpha()
-        self.image = pygame.transform.scale(self.original_image, (50, 50))
+        self.original_image_path = image_path
+        self.image = load_image(image_path, (50, 50))
+        self.frames = Powerup.get_flash_frames(type, image_path)
+        self.frame = self.image  # Frame shown while not blinked out
+        if Powerup.blank_frame is None:
+            Powerup.blank_frame = pygame.Surface((50, 50), pygame.SRCALPHA)
         self.rect = self.image.get_rect(center=(x, y))
         self.timer = timer
         self.flash_timer = 3
@@ -15,14 +53,6 @@ class Powerup(pygame.sprite.Sprite):
         self.color_change_interval = 0.1
         self.last_color_change_time = 0
         self.current_shade_index = 0
-
-        self.color_shades = {
-            "banana": [(255, 255, 100), (255, 255, 0), (255, 200, 0), (255, 165, 0)],
-            "pineapple": [(50, 205, 50), (34, 139, 34), (255, 180, 0), (255, 165, 0)],
-            "apple": [(255, 50, 50), (255, 0, 0), (255, 150, 150), (255, 192, 203)],
-            "berry": [(255, 70, 70), (255, 0, 0), (200, 0, 0)],
-            "honey": [(255, 183, 76), (255, 165, 0), (234, 140, 30), (210, 105, 30)]
-        }
         self.shades = self.color_shades.get(self.type, [(255, 255, 255)])
 
     def activate(self, player, active_powerups):
@@ -39,36 +69,44 @@ class Powerup(pygame.sprite.Sprite):
         elif self.type == "pineapple":
             player.triple_shot = True
 
-    def update(self):
-        self.timer -= 1 / 60
+    def update(self, dt=1 / 60):
+        self.timer -= dt
         if self.flashing and self.flash_timer > 0:
-            self.flash_timer -= 1 / 60
+            self.flash_timer -= dt
             if self.flash_timer <= 0:
                 self.flashing = False
             else:
                 self.flash_colors()
         elif self.flash_timer <= 0 and self.fade_timer > 0:
-            self.fade_timer -= 1 / 60
+            self.fade_timer -= dt
             self.fade_out()
         if self.timer <= 0:
             self.deactivate()
 
     def flash_colors(self):
         if pygame.time.get_ticks() - self.last_color_change_time >= self.color_change_interval * 1000:
-            self.image = pygame.transform.scale(self.original_image, (50, 50))
-            self.image.fill(self.shades[self.current_shade_index], special_flags=pygame.BLEND_ADD)
+            self.frame = self.frames[self.current_shade_index]
+            self.image = self.frame
             self.current_shade_index = (self.current_shade_index + 1) % len(self.shades)
             self.last_color_change_time = pygame.time.get_ticks()
 
     def fade_out(self):
+        # Blink by swapping frames; the flash frames are shared, so their alpha must not change
         if int(self.fade_timer * 10) % 2 == 0:
-            self.image.set_alpha(0)
+            self.image = Powerup.blank_frame
         else:
-            self.image.set_alpha(255)
+            self.image = self.frame
 
     def deactivate(self):
         self.kill()
 
+    def kill(self):
+        # Back to the pool once the powerup has left every group
+        was_alive = self.alive()
+        super().kill()
+        if was_alive:
+            powerup_pool.release(self)
+
     def click(self, player, hud):
         if self.type == "berry":
             player.berry_ammo += 5
@@ -80,10 +118,10 @@ class Powerup(pygame.sprite.Sprite):
 
     @staticmethod
     def spawn_random(x_range, y_range, powerup_images):
-        type = random.choice(list(powerup_images.keys()))
-        x = random.randint(*x_range)
-        y = random.randint(*y_range)
-        return Powerup(type, x, y, powerup_images[type])
+        type = streams.drops.choice(list(powerup_images.keys()))
+        x = streams.drops.randint(*x_range)
+        y = streams.drops.randint(*y_range)
+        return powerup_pool.acquire(type, x, y, powerup_images[type])
 
     @staticmethod
     def spawn_weighted_for_fox(x_range, y_range, powerup_images):
@@ -91,8 +129,12 @@ class Powerup(pygame.sprite.Sprite):
         probabilities = [0.4, 0.3, 0.15, 0.05]  # Drop rates specific to foxes
 
         # Select a powerup type based on the weighted probabilities
-        selected_type = random.choices(powerup_types, probabilities)[0]
-        x = random.randint(*x_range)
-        y = random.randint(*y_range)
+        selected_type = streams.drops.choices(powerup_types, probabilities)[0]
+        x = streams.drops.randint(*x_range)
+        y = streams.drops.randint(*y_range)
+
+        return powerup_pool.acquire(selected_type, x, y, powerup_images[selected_type])
+
 
-        return Powerup(selected_type, x, y, powerup_images[selected_type])
+# Dropped powerups are recycled through this pool
+powerup_pool = ObjectPool(Powerup)
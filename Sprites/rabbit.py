@@ -3,10 +3,13 @@
 import pygame
 import os
 import sys
-import random
-from Sprites.powerup import Powerup  # Import Powerup for powerup spawning
+from Sprites.powerup import powerup_pool  # Powerups are recycled through their pool
+from assets import ROOT_DIR, load_image, sound_bank
+from pools import ObjectPool
+from rng import streams
+from timestep import Interpolated
 
-class Rabbit(pygame.sprite.Sprite):
+class Rabbit(pygame.sprite.Sprite, Interpolated):
     def check_ammo_type(self, ammo_type):
         """
         Only allow 'carrot' ammo type to hit the rabbit.
@@ -16,16 +19,19 @@ class Rabbit(pygame.sprite.Sprite):
 
     def __init__(self, image_path):
         super().__init__()
+        self.reinit(image_path)
+
+    def reinit(self, image_path):
+        """Puts the rabbit in its just-spawned state (also used to recycle it from the pool)."""
         try:
-            self.image = pygame.image.load(image_path).convert_alpha()
+            self.image = load_image(image_path, (40, 40))
         except pygame.error as e:
             print(f"Unable to load rabbit image at {image_path}: {e}")
             pygame.quit()
             sys.exit()
-        self.image = pygame.transform.scale(self.image, (40, 40))
         self.x = 820  # Start off-screen on the right
         self.y = 90
-        self.vx = random.choice([40, 80])  # Set speed, with random choices
+        self.vx = streams.spawns.choice([40, 80])  # Set speed, with random choices
         self.vy = -10  # Initial upward speed for bouncing
         self.gravity = 3.5  # Gravity effect for bouncing
         self.initial_y = self.y
@@ -33,19 +39,16 @@ class Rabbit(pygame.sprite.Sprite):
         self.hit = False
         self.vibrate_timer = 0
         self.direction = -1  # Move left initially
-        sound_path = os.path.join("D:/Projects/FoodThrowGame2/sound", "eat.mp3")
-        try:
-            self.eat_sound = pygame.mixer.Sound(sound_path)
-        except pygame.error as e:
-            print(f"Unable to load sound at {sound_path}: {e}")
-            self.eat_sound = None
+        self.eat_channel = None  # Channel playing this rabbit's eat sound (the Sound itself is shared)
         self.rect = self.image.get_rect(topleft=(self.x, self.y))
         self.immune = False
         self.fed = False
         self.angry = False
         self.can_drop_powerup = True  # Flag to allow or prevent powerup drops
+        self.remember_position()
 
     def update(self, dt):
+        self.remember_position()
         if self.hit and self.vibrate_timer > 0 and not self.angry:
             if int(self.vibrate_timer * 10) % 2 == 0:
                 self.y += 2
@@ -57,23 +60,27 @@ class Rabbit(pygame.sprite.Sprite):
                 self.immune = True
                 self.fed = True  # Flag the rabbit as fed
                 self.y = self.initial_y
-                if self.eat_sound:
-                    self.eat_sound.stop()
+                # The channel may already have finished the eat sound and moved on to another effect
+                if self.eat_channel and self.eat_channel.get_sound() is sound_bank.get("eat"):
+                    self.eat_channel.stop()
+                self.eat_channel = None
                 self.can_drop_powerup = False  # Prevent further powerup drops
         else:
             self.x += self.vx * dt * self.direction
             self.bounce_logic(dt)
-
-            # Check if the rabbit has stopped moving left
-            if self.x < 0 and self.direction == -1:
-                self.direction = 1
-                self.angry = True
-                self.can_drop_powerup = False  # Prevent any further powerup drops
-            elif self.x > 800 and self.direction == 1:
-                self.reset()
+            self.check_edges()
 
         self.rect.topleft = (self.x, self.y)
 
+    def check_edges(self):
+        # Check if the rabbit has stopped moving left
+        if self.x < 0 and self.direction == -1:
+            self.direction = 1
+            self.angry = True
+            self.can_drop_powerup = False  # Prevent any further powerup drops
+        elif self.x > 800 and self.direction == 1:
+            self.reset()
+
     def bounce_logic(self, dt):
         self.vy += self.gravity * dt
         self.y += self.vy * dt
@@ -93,24 +100,16 @@ class Rabbit(pygame.sprite.Sprite):
         self.direction = -1
         self.can_drop_powerup = True  # Reset drop eligibility on respawn
 
-    def draw(self, screen, bushes):
-        rabbit_rect = pygame.Rect(self.x, self.y, self.image.get_width(), self.image.get_height())
-        for bush in bushes:
-            if rabbit_rect.colliderect(bush):
-                visible_height = bush.top - rabbit_rect.top
-                if visible_height > 0:
-                    visible_rect = pygame.Rect(self.x, self.y, self.image.get_width(), visible_height)
-                    screen.blit(self.image.subsurface(0, 0, self.image.get_width(), visible_height), (self.x, self.y))
-                    return
-        screen.blit(self.image, (self.x, self.y))
+    def draw(self, screen, alpha=1.0):
+        # The bush overlay hides the part of the rabbit behind the bush
+        screen.blit(self.image, self.draw_position(alpha))
 
     def on_hit(self):
         """Handle rabbit behavior when hit by ammo."""
         if not self.immune and not self.hit and self.direction == -1:
             self.hit = True
             self.vibrate_timer = 1.5  # Set vibration duration
-            if self.eat_sound:
-                self.eat_sound.play()
+            self.eat_channel = sound_bank.play("eat")
             return self.drop_powerup()  # Drop powerup if eligible
         return None
 
@@ -119,8 +118,12 @@ class Rabbit(pygame.sprite.Sprite):
 
     def drop_powerup(self):
         """Rabbit drops a berry powerup 50% of the time if eligible."""
-        powerup_image_path = os.path.join("D:/Projects/FoodThrowGame2/art", "berry.png")
+        powerup_image_path = os.path.join(ROOT_DIR, "art", "berry.png")
         if self.direction == -1 and self.can_drop_powerup:
-            if random.randint(1, 100) <= 50:  # 50% chance for berry ammo
-                return Powerup("berry", self.rect.centerx, self.rect.centery, powerup_image_path)
+            if streams.drops.randint(1, 100) <= 50:  # 50% chance for berry ammo
+                return powerup_pool.acquire("berry", self.rect.centerx, self.rect.centery, powerup_image_path)
         return None  # No drop if rabbit is not eligible or moving to the right
+
+
+# Spawned rabbits are recycled through this pool
+rabbit_pool = ObjectPool(Rabbit)
@@ -0,0 +1,456 @@
+# assets.py
+
+import os
+import sys
+import json
+import mmap
+import struct
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import pygame
+
+# The game's folder, where art/ and sound/ are, wherever it was installed
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Built offline by build_assets.py; the game falls back to the PNGs when it is missing
+ATLAS_INDEX = os.path.join(ROOT_DIR, "art", "atlas.json")
+PACK_PATH = os.path.join(ROOT_DIR, "art", "assets.pack")
+PACK_MAGIC = b"FTGPACK1"
+PIXEL_FORMATS = {"RGBA", "ARGB", "BGRA", "RGBX"}  # Both pygame.image.tobytes and frombuffer take these
+
+
+# Function to get the name an image is filed under in the atlas and the pack; case-insensitive,
+# like the Windows file system the game is made on (level 1 loads "L1C.png" for "l1c.png")
+def asset_name(path):
+    return os.path.basename(path).lower()
+
+# Function to get the pixel masks of a convert_alpha() surface on the current display
+def display_masks():
+    return list(pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha().get_masks())
+
+# Function to get the tobytes/frombuffer format string of 32-bit pixels with these masks
+# (None if there is none)
+def pixel_format(masks):
+    channels = dict(zip(masks, "RGBA"))
+    byte_order = range(4) if sys.byteorder == "little" else range(3, -1, -1)
+    pixel_format = "".join(channels.get(0xFF << 8 * i, "X") for i in byte_order)
+    return pixel_format if pixel_format in PIXEL_FORMATS else None
+
+
+class AssetCache:
+    """
+    Decodes and scales every (path, size) pair once and hands out shared surfaces.
+
+    Surfaces returned by the cache are shared between every caller, so they must be
+    treated as read-only (copy them first if you need to draw on them or change alpha).
+    Entries that belong to a loaded manifest are pinned; everything else is evicted in
+    least-recently-used order once the cache grows past max_bytes.
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.images = OrderedDict()  # (path, size, alpha) -> Surface, oldest first
+        self.sizes = {}  # (path, size, alpha) -> bytes held by the surface
+        self.total_bytes = 0
+        self.manifests = {}  # manifest name -> list of (path, size, alpha) keys
+        self.loaded_manifests = set()
+        self.pinned = {}  # key -> number of loaded manifests referencing it
+        self.hits = 0
+        self.misses = 0
+        self.atlas = {}  # (file name, size) -> subsurface of the atlas sheet
+        self.atlas_sheet = None
+        self.atlas_path = None
+        self.pack = {}  # (file name, size) -> (offset, length) of raw pixels in the pack
+        self.pack_surfaces = {}  # (file name, size) -> Surface wrapping the mapped pixels
+        self.pack_map = None
+        self.pack_format = None
+        self.pack_path = None
+
+    @staticmethod
+    def make_key(path, size=None, alpha=True):
+        if size is not None:
+            size = (int(size[0]), int(size[1]))
+        return (os.path.normpath(path), size, alpha)
+
+    def image(self, path, size=None, alpha=True):
+        """Return the shared surface for path scaled to size, decoding it on first use."""
+        key = self.make_key(path, size, alpha)
+        surface = self.peek(key)
+        if surface is not None:
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        if key[1] is None:
+            surface = self.decode(path, alpha)
+        else:
+            # Scale from the cached full-size surface so a PNG used at several sizes is decoded once
+            surface = pygame.transform.scale(self.image(path, alpha=alpha), key[1])
+        self.store(key, surface)
+        return surface
+
+    def peek(self, key):
+        """Return the surface for a cache key if it is available without decoding anything."""
+        surface = self.images.get(key)
+        if surface is not None:
+            self.images.move_to_end(key)
+            return surface
+
+        path, size, alpha = key
+        if alpha and size is not None and self.pack:
+            surface = self.from_pack((asset_name(path), size))
+            if surface is not None:
+                return surface
+
+        if alpha and size is not None and self.atlas:
+            # Pre-scaled variant from the atlas; it lives as long as the sheet, so it skips the LRU
+            return self.atlas.get((asset_name(path), size))
+        return None
+
+    def decode(self, path, alpha=True):
+        surface = pygame.image.load(path)
+        return surface.convert_alpha() if alpha else surface.convert()
+
+    def store(self, key, surface):
+        nbytes = surface.get_width() * surface.get_height() * surface.get_bytesize()
+        self.images[key] = surface
+        self.sizes[key] = nbytes
+        self.total_bytes += nbytes
+        self.evict()
+
+    def evict(self):
+        # Drop the least recently used unpinned surfaces until we are back under budget
+        for key in list(self.images):
+            if self.total_bytes <= self.max_bytes:
+                break
+            if key in self.pinned:
+                continue
+            del self.images[key]
+            self.total_bytes -= self.sizes.pop(key)
+
+    def load_atlas(self, index_path=ATLAS_INDEX):
+        """
+        Load the sprite atlas written by build_assets.py.
+
+        Sprites whose PNG changed after the atlas was built are skipped and keep loading from
+        the PNG. Returns False (and leaves the cache on plain PNGs) if there is no usable atlas.
+        """
+        if self.atlas_path == index_path:
+            return True
+        try:
+            with open(index_path) as index_file:
+                index = json.load(index_file)
+        except (OSError, ValueError):
+            return False
+
+        art_dir = os.path.dirname(index_path)
+        sheet_path = os.path.join(art_dir, index["image"])
+        try:
+            sheet = pygame.image.load(sheet_path).convert_alpha()
+        except pygame.error as e:
+            print(f"Unable to load sprite atlas at {sheet_path}: {e}")
+            return False
+
+        atlas = {}
+        for name, variants in index["sprites"].items():
+            source_path = os.path.join(art_dir, name)
+            if os.path.exists(source_path) and os.path.getmtime(source_path) != index["sources"].get(name):
+                continue  # Stale entry
+            for size_key, rect in variants.items():
+                width, height = (int(n) for n in size_key.split("x"))
+                atlas[(asset_name(name), (width, height))] = sheet.subsurface(rect)
+
+        self.atlas = atlas
+        self.atlas_sheet = sheet
+        self.atlas_path = index_path
+        return True
+
+    def load_pack(self, path=PACK_PATH):
+        """
+        Memory-map the raw pixel pack written by build_assets.py.
+
+        Only the header is parsed here; surfaces are wrapped around the mapped pixels the first
+        time they are asked for. Entries whose source PNG changed after the pack was built are
+        dropped and load from the PNG instead. Returns False if there is no usable pack,
+        including one built for a display with another pixel layout, whose pixels would be
+        converted on every blit. Call it once the display is open.
+        """
+        if self.pack_path == path:
+            return True
+        try:
+            with open(path, "rb") as pack_file:
+                # Copy-on-write: a caller drawing on a shared pack surface gets private copies of
+                # the pages it touches instead of a segfault (or a changed pack file)
+                pack_map = mmap.mmap(pack_file.fileno(), 0, access=mmap.ACCESS_COPY)
+        except (OSError, ValueError):
+            return False
+
+        try:
+            if pack_map[:len(PACK_MAGIC)] != PACK_MAGIC:
+                raise ValueError("bad magic")
+            header_start = len(PACK_MAGIC) + 4
+            (header_length,) = struct.unpack("<I", pack_map[len(PACK_MAGIC):header_start])
+            header = json.loads(pack_map[header_start:header_start + header_length])
+        except (ValueError, struct.error) as e:
+            print(f"Ignoring unreadable asset pack at {path}: {e}")
+            pack_map.close()
+            return False
+
+        try:
+            masks = display_masks()
+        except pygame.error:
+            masks = None  # No display to compare with
+        if header.get("masks") != masks or pixel_format(masks) is None:
+            print(f"Ignoring asset pack at {path}: it was built for another pixel format, run build_assets.py again")
+            pack_map.close()
+            return False
+
+        art_dir = os.path.dirname(path)
+        stale = set()
+        for name, (mtime, size) in header["sources"].items():
+            source_path = os.path.join(art_dir, name)
+            if os.path.exists(source_path) and (os.path.getmtime(source_path), os.path.getsize(source_path)) != (mtime, size):
+                stale.add(name)
+
+        self.pack = {}
+        for entry in header["entries"]:
+            if entry["name"] not in stale:
+                self.pack[(asset_name(entry["name"]), tuple(entry["size"]))] = (entry["offset"], entry["length"])
+        self.pack_surfaces = {}
+        self.pack_map = pack_map
+        self.pack_format = pixel_format(masks)
+        self.pack_path = path
+        return True
+
+    def from_pack(self, pack_key):
+        surface = self.pack_surfaces.get(pack_key)
+        if surface is None and pack_key in self.pack:
+            offset, length = self.pack[pack_key]
+            # frombuffer wraps the mapped pages directly; the surface keeps the mapping alive
+            surface = pygame.image.frombuffer(memoryview(self.pack_map)[offset:offset + length], pack_key[1], self.pack_format)
+            self.pack_surfaces[pack_key] = surface
+        return surface
+
+    def register_manifest(self, name, entries):
+        """
+        Register the assets a level needs.
+
+        :param name: Manifest name, usually the level name.
+        :param entries: Iterable of (path, size) or (path, size, alpha) tuples; size may be None.
+        """
+        keys = []
+        for entry in entries:
+            path, size = entry[0], entry[1]
+            alpha = entry[2] if len(entry) > 2 else True
+            keys.append(self.make_key(path, size, alpha))
+        self.manifests[name] = keys
+
+    def load_manifest(self, name):
+        """Decode every asset in the manifest and pin it until release_manifest is called."""
+        if name in self.loaded_manifests:
+            return
+        for path, size, alpha in self.manifests[name]:
+            self.image(path, size, alpha)
+        for key in self.manifests[name]:
+            self.pinned[key] = self.pinned.get(key, 0) + 1
+        self.loaded_manifests.add(name)
+
+    def release_manifest(self, name):
+        """Unpin a manifest's assets so they can be evicted when the cache is full."""
+        if name not in self.loaded_manifests:
+            return
+        self.loaded_manifests.discard(name)
+        for key in self.manifests[name]:
+            self.pinned[key] -= 1
+            if self.pinned[key] <= 0:
+                del self.pinned[key]
+        self.evict()
+
+    def clear(self):
+        self.images.clear()
+        self.sizes.clear()
+        self.pinned.clear()
+        self.loaded_manifests.clear()
+        self.total_bytes = 0
+        self.atlas = {}
+        self.atlas_sheet = None
+        self.atlas_path = None
+        # Surfaces still in use keep the mapping alive through their buffer, so just drop it
+        self.pack = {}
+        self.pack_surfaces = {}
+        self.pack_map = None
+        self.pack_path = None
+
+
+class SoundBank:
+    """
+    Sound effects decoded once at level load and triggered by name.
+
+    Building a pygame.mixer.Sound decodes the whole MP3, which stalls the frame it happens
+    in, so sprites ask the bank to play an already decoded effect instead.
+    """
+
+    def __init__(self):
+        self.sounds = {}  # effect name -> Sound, or None if it failed to load
+
+    def load(self, effects):
+        """
+        Decode every effect that is not loaded yet.
+
+        :param effects: Dict mapping effect names to sound file paths.
+        """
+        for name, path in effects.items():
+            if self.sounds.get(name) is not None:
+                continue
+            try:
+                self.sounds[name] = pygame.mixer.Sound(path)
+            except (pygame.error, OSError) as e:  # Missing files raise FileNotFoundError
+                print(f"Unable to load sound at {path}: {e}")
+                self.sounds[name] = None
+
+    def get(self, name):
+        return self.sounds.get(name)
+
+    def store(self, name, sound):
+        self.sounds[name] = sound
+
+    def play(self, name):
+        """Play an effect and return its Channel (None if the effect is missing or no channel was free)."""
+        sound = self.sounds.get(name)
+        if sound is None:
+            return None
+        return sound.play()
+
+
+# Worker side of the background loader: decode one PNG and scale it to every requested size
+def decode_scaled(path, sizes):
+    surface = pygame.image.load(path)
+    return {size: (surface if size is None else pygame.transform.scale(surface, size)) for size in sizes}
+
+
+class LoadJob:
+    """
+    One manifest being decoded by an AssetLoader.
+
+    The workers only decode and scale; converting to display format and storing in the
+    cache happens in poll(), which the caller runs from the main thread between frames.
+    """
+
+    def __init__(self, name, cache, sound_bank, image_futures, sound_futures):
+        self.name = name
+        self.cache = cache
+        self.sound_bank = sound_bank
+        self.image_futures = image_futures  # list of (path, [(size, alpha)], Future)
+        self.sound_futures = sound_futures  # list of (effect name, path, Future)
+        self.total = len(image_futures) + len(sound_futures)
+        self.completed = 0
+
+    def poll(self):
+        """Move finished work into the cache and sound bank. Returns progress from 0.0 to 1.0."""
+        pending_images = []
+        for path, variants, future in self.image_futures:
+            if not future.done():
+                pending_images.append((path, variants, future))
+                continue
+            try:
+                decoded = future.result()
+                for size, alpha in variants:
+                    surface = decoded[size]
+                    surface = surface.convert_alpha() if alpha else surface.convert()
+                    self.cache.store(self.cache.make_key(path, size, alpha), surface)
+            except (pygame.error, OSError) as e:  # Missing files raise FileNotFoundError
+                # Leave it uncached; loading the manifest reports the error the usual way
+                print(f"Unable to preload image at {path}: {e}")
+            self.completed += 1
+        self.image_futures = pending_images
+
+        pending_sounds = []
+        for name, path, future in self.sound_futures:
+            if not future.done():
+                pending_sounds.append((name, path, future))
+                continue
+            try:
+                self.sound_bank.store(name, future.result())
+            except (pygame.error, OSError) as e:
+                print(f"Unable to load sound at {path}: {e}")
+                self.sound_bank.store(name, None)
+            self.completed += 1
+        self.sound_futures = pending_sounds
+        return self.progress()
+
+    def progress(self):
+        return 1.0 if self.total == 0 else self.completed / self.total
+
+    def done(self):
+        return not self.image_futures and not self.sound_futures
+
+    def finish(self):
+        """Wait for anything still running, then pin the manifest like AssetCache.load_manifest."""
+        for _, _, future in self.image_futures + self.sound_futures:
+            future.exception()  # Blocks until the worker is finished
+        self.poll()
+        try:
+            self.cache.load_manifest(self.name)
+        except (pygame.error, OSError):
+            pass  # Reported by poll(); the level's own load_manifest reports it again the usual way
+
+
+class AssetLoader:
+    """Decodes the next scene's images and sounds on a worker thread pool."""
+
+    def __init__(self, cache, sound_bank, max_workers=4):
+        self.cache = cache
+        self.sound_bank = sound_bank
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="asset-loader")
+        self.jobs = {}
+
+    def preload(self, name, sounds=None):
+        """
+        Start decoding a registered manifest (and optional sound effects) in the background.
+
+        Calling it again for the same manifest returns the job that is already running.
+
+        :param name: Name of a manifest registered with the cache.
+        :param sounds: Dict mapping effect names to sound file paths.
+        """
+        job = self.jobs.get(name)
+        if job is not None and name not in self.cache.loaded_manifests:
+            return job
+
+        # Group by file so a PNG drawn at several sizes is decoded once
+        by_path = {}
+        for key in self.cache.manifests[name]:
+            if self.cache.peek(key) is None:
+                path, size, alpha = key
+                by_path.setdefault(path, []).append((size, alpha))
+        image_futures = []
+        for path, variants in by_path.items():
+            sizes = sorted({size for size, _ in variants}, key=lambda size: (size is not None, size))
+            image_futures.append((path, variants, self.executor.submit(decode_scaled, path, sizes)))
+
+        sound_futures = []
+        for effect, path in (sounds or {}).items():
+            if self.sound_bank.get(effect) is None:
+                sound_futures.append((effect, path, self.executor.submit(pygame.mixer.Sound, path)))
+
+        job = LoadJob(name, self.cache, self.sound_bank, image_futures, sound_futures)
+        self.jobs[name] = job
+        return job
+
+
+# Process-wide cache, sound bank and loader shared by main.py, the levels and the sprites
+cache = AssetCache()
+sound_bank = SoundBank()
+loader = AssetLoader(cache, sound_bank)
+
+
+def load_image(path, size=None, alpha=True):
+    return cache.image(path, size, alpha)
+
+
+def load_atlas(index_path=ATLAS_INDEX):
+    return cache.load_atlas(index_path)
+
+
+def load_pack(path=PACK_PATH):
+    return cache.load_pack(path)
@@ -1,80 +1,87 @@
 import pygame
-import random
+from assets import load_image
+from particles import ParticleSystem
+from rng import streams
 
-# Leaf class for level 2
-class Leaf:
-    def __init__(self, x, y, image):
-        self.x = x
-        self.y = y
-        self.original_image = pygame.transform.scale(image, (20, 20))  # Original image (20x20)
-        self.image = self.original_image  # This will be updated as the image rotates
-        self.speed_y = random.uniform(1, 2)  # Falling speed
-        self.sway_direction = random.choice([-1, 1])  # Random sway direction
-        self.sway_amount = 0
-        self.rotation_angle = 0  # Initialize rotation angle
+LEAF_SIZE = (20, 20)
+LEAF_ANGLE_STEP = 5  # Degrees a leaf turns per frame
 
-    def update(self, wind_is_blowing, wind_speed):
-        if wind_is_blowing:
-            self.x += wind_speed  # Apply wind speed if wind is blowing
-            self.y += self.speed_y  # Continue falling
-        else:
-            # Swaying logic: sway by 15 pixels to each side
-            self.sway_amount += self.sway_direction
-            if abs(self.sway_amount) > 15:
-                self.sway_direction *= -1  # Change direction at sway limit
-            self.x += self.sway_direction
-            self.y += self.speed_y  # Continue falling
+# Pre-rotated frames shared by every leaf
+class LeafFrameBank:
+    """
+    Every leaf image scaled once and rotated once per LEAF_ANGLE_STEP, so a spinning leaf
+    only moves an index instead of calling pygame.transform.rotate every frame.
+    """
+    def __init__(self, images, size=LEAF_SIZE, angle_step=LEAF_ANGLE_STEP):
+        self.angle_step = angle_step
+        self.frame_count = 360 // angle_step
+        self.frames = []  # One list of rotated surfaces per leaf image
+        self.offsets = []  # Matching (dx, dy) from the leaf's center to each frame's top left
+        for image in images:
+            if image.get_size() != tuple(size):
+                image = pygame.transform.scale(image, size)
+            rotated = [pygame.transform.rotate(image, i * angle_step) for i in range(self.frame_count)]
+            self.frames.append(rotated)
+            self.offsets.append([(-(frame.get_width() // 2), -(frame.get_height() // 2)) for frame in rotated])
 
-            # Rotate the leaf by incrementing the angle
-            self.rotation_angle += 5  # Rotate by 5 degrees per frame
-            if self.rotation_angle >= 360:
-                self.rotation_angle = 0  # Reset angle after a full spin
-            # Rotate the image using the rotation angle
-            self.image = pygame.transform.rotate(self.original_image, self.rotation_angle)
+    def random_variant(self):
+        return streams.weather.randrange(len(self.frames))
 
-    def draw(self, screen):
-        # Draw the rotated image at the leaf's position
-        rotated_rect = self.image.get_rect(center=(self.x, self.y))
-        screen.blit(self.image, rotated_rect.topleft)
+# Frame banks already built, per asset root
+leaf_frame_banks = {}
 
 # Function to load leaf images
 def create_leaf_images(root_dir):
-    # Load leaf images
-    leaf_images = [pygame.image.load(f"{root_dir}/art/leaf{i}.png").convert_alpha() for i in range(1, 3)]
+    # Load leaf images (decoded and scaled once by the asset cache)
+    leaf_images = [load_image(f"{root_dir}/art/leaf{i}.png", LEAF_SIZE) for i in range(1, 3)]
     return leaf_images  # Return the list of leaf surfaces
 
-# Function to create leaves
+# Function to get the shared frame bank, building it on first use
+def get_leaf_frame_bank(root_dir):
+    bank = leaf_frame_banks.get(root_dir)
+    if bank is None:
+        bank = LeafFrameBank(create_leaf_images(root_dir))
+        leaf_frame_banks[root_dir] = bank
+    return bank
+
+# Function to create the leaf particle system, with count leaves already falling
 def create_leaves(root_dir, count=1):
-    leaf_images = create_leaf_images(root_dir)
-    # Create and return individual leaf instances
-    return [Leaf(random.randint(0, 800), random.randint(-100, 0), random.choice(leaf_images)) for _ in range(count)]
+    bank = get_leaf_frame_bank(root_dir)
+    # Every rotated frame of every leaf image, drawn centered on the leaf's position
+    leaves = ParticleSystem([frame for frames in bank.frames for frame in frames],
+                            [offset for offsets in bank.offsets for offset in offsets],
+                            bank.frame_count)
+    for _ in range(count):
+        spawn_leaf(leaves, streams.weather.randint(0, 800), streams.weather.randint(-100, 0), bank.random_variant())
+    return leaves
+
+# Function to add a leaf with a random falling speed and sway direction
+def spawn_leaf(leaves, x, y, variant=0):
+    leaves.spawn(x, y, streams.weather.uniform(1, 2), streams.weather.choice([-1, 1]), variant=variant)
 
-# Function to update and draw leaves
-def update_and_draw_leaves(screen, leaves, root_dir, spawn_timer, wind_is_blowing, wind_speed, wind_spawn_timer):
+# Function to update and draw leaves (density scales how many are spawned, spin lets them rotate)
+def update_and_draw_leaves(screen, leaves, root_dir, spawn_timer, wind_is_blowing, wind_speed, wind_spawn_timer,
+                           density=1.0, spin=True):
     # Update and draw leaves
-    for leaf in leaves[:]:
-        leaf.update(wind_is_blowing, wind_speed)
-        leaf.draw(screen)
-        if leaf.y > 600:  # Remove leaves that fall off the bottom of the screen
-            leaves.remove(leaf)
+    leaves.update(wind_is_blowing, wind_speed, spin)
+    leaves.draw(screen)
+    leaves.remove_below(600)  # Remove leaves that fall off the bottom of the screen
 
     # Check whether to spawn a new leaf (randomly between 10 and 30 every 2 seconds)
     if spawn_timer[0] <= 0:
-        leaf_images = create_leaf_images(root_dir)
+        bank = get_leaf_frame_bank(root_dir)
         # Randomly determine how many leaves to spawn (between 10 and 30)
-        leaves_to_spawn = random.randint(10, 30)
+        leaves_to_spawn = round(streams.weather.randint(10, 30) * density)
         for _ in range(leaves_to_spawn):
-            new_leaf = Leaf(random.randint(0, 800), random.randint(-100, 0), random.choice(leaf_images))
-            leaves.append(new_leaf)
+            spawn_leaf(leaves, streams.weather.randint(0, 800), streams.weather.randint(-100, 0), bank.random_variant())
         spawn_timer[0] = 120  # 2 seconds at 60 FPS
 
     # Wind-based leaves: spawn 10 leaves per second on the left when wind is blowing
     if wind_is_blowing and wind_spawn_timer[0] <= 0:
-        leaf_images = create_leaf_images(root_dir)
+        bank = get_leaf_frame_bank(root_dir)
         # Spawn 10 individual leaves per second
-        for _ in range(10):
-            new_leaf = Leaf(-20, random.randint(0, 600), random.choice(leaf_images))  # Spawn just outside the left
-            leaves.append(new_leaf)
+        for _ in range(round(10 * density)):
+            spawn_leaf(leaves, -20, streams.weather.randint(0, 600), bank.random_variant())  # Spawn just outside the left
         wind_spawn_timer[0] = 6  # Set wind spawn timer to allow 10 leaves per second (60 FPS / 6)
 
     # Decrease spawn timers
@@ -85,14 +92,14 @@ def update_and_draw_leaves(screen, leaves, root_dir, spawn_timer, wind_is_blowin
 def wind_simulator(wind_timer, wind_duration, wind_speed):
     # Wind blows randomly every 10 to 15 seconds for 6 to 10 seconds
     if wind_timer[0] <= 0:
-        wind_duration[0] = random.randint(360, 600)  # Wind blows for 6 to 10 seconds
-        wind_timer[0] = random.randint(600, 900)  # Wind starts again in 10 to 15 seconds
-        wind_speed[0] = random.uniform(0.5, 1)  # Wind starts slow
+        wind_duration[0] = streams.weather.randint(360, 600)  # Wind blows for 6 to 10 seconds
+        wind_timer[0] = streams.weather.randint(600, 900)  # Wind starts again in 10 to 15 seconds
+        wind_speed[0] = streams.weather.uniform(0.5, 1)  # Wind starts slow
         return True
     elif wind_duration[0] > 0:
         # Gradually increase wind speed to up to 5x the base speed
         if wind_speed[0] < 5 * wind_speed[1]:
-            wind_speed[0] += random.uniform(0.05, 0.2)  # Wind speeds up at random intervals
+            wind_speed[0] += streams.weather.uniform(0.05, 0.2)  # Wind speeds up at random intervals
         wind_duration[0] -= 1  # Wind is still blowing
         return True
     else:
@@ -0,0 +1,31 @@
+# benchmarks/baseline.py
+#
+# Per-machine baseline files shared by the scenario and micro benchmarks.
+
+import os
+import json
+import platform
+import pygame
+
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines")
+
+
+# Function to get the default baseline file of this machine for a suite
+def default_path(suite):
+    return os.path.join(BASELINE_DIR, f"{platform.node()}-{suite}.json")
+
+# Function to read the results kept in a baseline file (nothing if there is none yet)
+def load(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path) as baseline_file:
+        return json.load(baseline_file)["results"]
+
+# Function to keep results as the baseline; results not in this run keep their old numbers
+def save(path, results):
+    saved = dict(load(path), **results)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w") as baseline_file:
+        json.dump({"machine": platform.node(), "python": platform.python_version(), "pygame": pygame.version.ver,
+                   "results": saved}, baseline_file, indent=2, sort_keys=True)
+    print(f"Saved the baseline to {path}")
@@ -0,0 +1,293 @@
+# benchmarks/micro.py
+#
+# Microbenchmarks: times the hot functions of the game one at a time, each on fixed inputs
+# like the ones it gets in play, so a change to one of them can be judged by its own cost
+# instead of by a frame rate that everything else moves too. Run it from where the game runs:
+#
+#     python -m benchmarks.micro                          # every function, compared with the baseline
+#     python -m benchmarks.micro ammo_update fox_bounce   # only these
+#     python -m benchmarks.micro --save                   # and keep the results as the new baseline
+#     python -m benchmarks.micro --repeat 50              # timed repeats of each (default 25)
+#
+# Baselines are per machine, in benchmarks/baselines/<host name>-micro.json (or --baseline PATH).
+# Every function is called untimed first (caches filling, first blits), then timed over
+# repeats of many calls with the garbage collector off. The time per call of the fastest
+# repeat, the one least disturbed by the rest of the machine, is compared with the
+# baseline; one more than --tolerance (default 0.10, i.e. 10%) slower is a regression and
+# makes the exit status 1. Shared and laptop CPUs change speed from run to run, so compare
+# runs made on the same quiet machine, and run again before trusting a single regression.
+
+import gc
+import os
+import sys
+import time
+import statistics
+import importlib
+import pygame
+from benchmarks import baseline as baselines
+from fonts import get_font
+from headless import use_dummy_drivers
+from lanes import RABBIT_Y
+from rng import streams
+from text_cache import TextCache
+from timestep import REFERENCE_RATE
+
+TARGET_TIME = 0.01  # Seconds a repeat should take when the calls per repeat are picked automatically
+NOISE_FLOOR = 0.05  # Microseconds; smaller differences are never a regression
+DISPLAY_SIZE = (1920, 1080)  # Full screen on a common monitor, for the presenter
+
+
+class Microbenchmark:
+    """
+    One function timed on its own.
+
+    :param name: Name on the command line and in the baselines.
+    :param setup: Builds the inputs and returns a function of no arguments that makes one
+                  call of what is measured. It is called again before every repeat, so calls
+                  that change their inputs (particles falling, timers running down) start
+                  every repeat from the same state.
+    :param number: Calls per repeat (None picks enough for a repeat to take TARGET_TIME).
+    """
+
+    def __init__(self, name, setup, number=None):
+        self.name = name
+        self.setup = setup
+        self.number = number
+
+    def run(self, repeat=25):
+        """
+        :param repeat: Timed repeats.
+        :return: Dict of the microseconds per call over the repeats ("min", "median", "mean",
+                 "stdev") and the calls per repeat.
+        """
+        number = self.number or self.calibrate()
+        self.time_repeat(number)  # Warm up
+        times = [self.time_repeat(number) / number * 1e6 for _ in range(repeat)]
+        return {"min": min(times), "median": statistics.median(times), "mean": statistics.mean(times),
+                "stdev": statistics.stdev(times) if repeat > 1 else 0.0, "number": number}
+
+    def calibrate(self):
+        number = 1
+        while self.time_repeat(number) < TARGET_TIME:
+            number *= 2
+        return number
+
+    def time_repeat(self, number):
+        call = self.setup()
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            for _ in range(number):
+                call()
+            return time.perf_counter() - start
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+
+# The level every benchmark takes its assets and surfaces from; imported once the drivers are chosen
+level1 = None
+
+
+# Function to load an image from the game's art folder
+def art(name, size=None):
+    return level1.load_image(os.path.join(level1.root_dir, "art", name), size)
+
+# Function to get the game surface, showing level 1's background
+def game_surface():
+    level1.game_surface.blit(art("background1.png", (level1.GAME_WIDTH, level1.GAME_HEIGHT)), (0, 0))
+    return level1.game_surface
+
+# Function to time one step of a shot thrown upwards at an angle
+def ammo_update():
+    shot = level1.Ammo()
+    shot.fire(100, 300, art("carrot.png", (25, 25)), "carrot", speed=5, angle=15)
+    dt = 1 / REFERENCE_RATE
+    return lambda: shot.update(dt)
+
+# Function to time a fox's hop
+def fox_bounce():
+    streams.reseed(1)
+    fox = level1.Fox(os.path.join(level1.root_dir, "art", "fox.png"), "middle")
+    fox.x = 400
+    dt = 1 / REFERENCE_RATE
+    return lambda: fox.bounce_logic(dt)
+
+# Function to time drawing a full field of rabbits between ticks and the bushes in front of them
+def rabbits_and_bushes():
+    streams.reseed(1)
+    screen = game_surface()
+    static_layer = level1.build_static_layer(screen.get_size(), (139, 69, 19),
+                                             [(art("background1.png", screen.get_size()), (0, 0))])
+    bush_overlay = level1.BushOverlay(static_layer)
+    rabbits = []
+    for i in range(10):  # As many as level 1 allows at once
+        rabbit = level1.Rabbit(os.path.join(level1.root_dir, "art", "rabbit.png"))
+        rabbit.x = 60 + 70 * i
+        rabbit.y = rabbit.initial_y = RABBIT_Y[i % len(RABBIT_Y)] - i % 3 * 10
+        rabbit.prev_x, rabbit.prev_y = rabbit.x + 1, rabbit.y + 1
+        rabbits.append(rabbit)
+    alpha = 0.5
+
+    def draw():
+        for rabbit in rabbits:
+            rabbit.draw(screen, alpha)
+        bush_overlay.draw(screen)
+    return draw
+
+# Function to time a frame of the news ticker over the bear HUD
+def news_ticker():
+    screen = game_surface()
+    font = level1.get_sysfont("Arial", 24, bold=True)
+    hud_rect = pygame.Rect(320, 10, 160, 50)  # Where level 1 puts the bear HUD
+    level1.draw_news_ticker(screen, level1.news_headlines, font, level1.RED, hud_rect)
+    level1.draw_news_ticker.current_headline = 0  # Every repeat scrolls the same stretch of text
+    level1.draw_news_ticker.x = hud_rect.right
+    return lambda: level1.draw_news_ticker(screen, level1.news_headlines, font, level1.RED, hud_rect)
+
+# Function to time drawing the ammo HUD with berries selected
+def ammo_hud():
+    screen = game_surface()
+    ammo_sprites = [art("carrot.png", (25, 25)), art("berry.png", (25, 25)), art("honey.png", (25, 25))]
+    ammo_counts = [5, 12, 3]
+    return lambda: level1.draw_ammo_hud(screen, ammo_counts, ammo_sprites, 1)
+
+# Function to time a highlighted menu option, as every menu frame draws it. The menus' render_text_with_outline
+# is TextCache.render behind a quality check; main.py itself is not imported, since that starts the game
+def outlined_text():
+    text_cache = TextCache()
+    menu_font = get_font("freesansbold", 50)
+    return lambda: text_cache.render("START GAME", menu_font, (0, 191, 255), (0, 0, 0), 1.2)
+
+# Function to time the same option when it is not in the cache (a new color of the flashing highlight)
+def outlined_text_uncached():
+    text_cache = TextCache()
+    menu_font = get_font("freesansbold", 50)
+
+    def render():
+        text_cache.clear()
+        return text_cache.render("START GAME", menu_font, (0, 191, 255), (0, 0, 0), 1.2)
+    return render
+
+# Function to make a leaf system with count leaves spread over the screen
+def falling_leaves(count=400):
+    autumn = importlib.import_module("autumn")
+    streams.reseed(1)
+    bank = autumn.get_leaf_frame_bank(level1.root_dir)
+    leaves = autumn.create_leaves(level1.root_dir, 0)
+    for _ in range(count):
+        autumn.spawn_leaf(leaves, streams.weather.randint(0, 800), streams.weather.randint(0, 600), bank.random_variant())
+    return autumn, leaves
+
+# Function to time moving and spinning a screenful of leaves while the wind is still
+def leaves_update():
+    autumn, leaves = falling_leaves()
+    return lambda: leaves.update(False, 0)
+
+# Function to time a frame of level 2's leaves in the wind, spawning included
+def leaves_update_and_draw():
+    autumn, leaves = falling_leaves()
+    screen = game_surface()
+    spawn_timer, wind_spawn_timer = [60], [0]
+    return lambda: autumn.update_and_draw_leaves(screen, leaves, level1.root_dir, spawn_timer, True, 3.0,
+                                                 wind_spawn_timer)
+
+# Function to time a frame of level 3's snow in the wind, spawning included
+def snow_update_and_draw():
+    winter = importlib.import_module("winter")
+    streams.reseed(1)
+    snowflakes = winter.create_snow(level1.root_dir, 0)
+    for _ in range(400):
+        winter.spawn_snow(snowflakes, streams.weather.randint(0, 800), streams.weather.randint(0, 600))
+    screen = game_surface()
+    spawn_timer, wind_spawn_timer = [60], [0]
+    return lambda: winter.update_and_draw_snow(screen, snowflakes, level1.root_dir, spawn_timer, True, 3.0,
+                                               wind_spawn_timer)
+
+# Function to time showing a frame in full screen
+def present_fullscreen(smooth=False):
+    presenter = level1.Presenter((level1.GAME_WIDTH, level1.GAME_HEIGHT), smooth)
+    display = pygame.Surface(DISPLAY_SIZE)
+    surface = game_surface()
+    return lambda: presenter.present(surface, display)
+
+
+MICROBENCHMARKS = [
+    Microbenchmark("ammo_update", ammo_update),
+    Microbenchmark("fox_bounce", fox_bounce),
+    Microbenchmark("rabbits_and_bushes", rabbits_and_bushes),
+    Microbenchmark("news_ticker", news_ticker, number=120),  # Headlines scroll on, so a fixed stretch
+    Microbenchmark("ammo_hud", ammo_hud),
+    Microbenchmark("outlined_text", outlined_text),
+    Microbenchmark("outlined_text_uncached", outlined_text_uncached),
+    Microbenchmark("leaves_update", leaves_update, number=120),
+    Microbenchmark("leaves_update_and_draw", leaves_update_and_draw, number=120),  # Two seconds of play
+    Microbenchmark("snow_update_and_draw", snow_update_and_draw, number=120),
+    Microbenchmark("present_fullscreen", present_fullscreen),
+    Microbenchmark("present_fullscreen_smooth", lambda: present_fullscreen(smooth=True)),
+]
+
+
+# Function to compare results with a baseline
+def find_regressions(results, baseline, tolerance):
+    """
+    :return: Descriptions of the functions whose fastest call got slower than the tolerance allows.
+    """
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        if result["min"] > base["min"] * (1 + tolerance) and result["min"] - base["min"] > NOISE_FLOOR:
+            regressions.append(f"{name}: {base['min']:.2f} us -> {result['min']:.2f} us "
+                               f"(+{(result['min'] / base['min'] - 1) * 100:.0f}%)")
+    return regressions
+
+# Function to print a table of the time per call, before (the baseline) and after
+def print_results(results, baseline):
+    print(f"{'function':<28}{'before us':>11}{'after us':>11}{'change':>9}{'median us':>11}{'stdev us':>10}{'calls':>8}")
+    for name, result in results.items():
+        base = baseline.get(name)
+        before = f"{base['min']:>11.2f}" if base else f"{'-':>11}"
+        change = f"{(result['min'] / base['min'] - 1) * 100:>+8.0f}%" if base else f"{'':>9}"
+        print(f"{name:<28}{before}{result['min']:>11.2f}{change}{result['median']:>11.2f}{result['stdev']:>10.2f}"
+              f"{result['number']:>8}")
+
+
+if __name__ == "__main__":
+    use_dummy_drivers()
+    arguments = sys.argv[1:]
+    baseline_path = baselines.default_path("micro")
+    if "--baseline" in arguments:
+        baseline_path = arguments.pop(arguments.index("--baseline") + 1)
+    tolerance = 0.10
+    if "--tolerance" in arguments:
+        tolerance = float(arguments.pop(arguments.index("--tolerance") + 1))
+    repeat = 25
+    if "--repeat" in arguments:
+        repeat = int(arguments.pop(arguments.index("--repeat") + 1))
+    names = [argument for argument in arguments if not argument.startswith("--")]
+    unknown = set(names) - {benchmark.name for benchmark in MICROBENCHMARKS}
+    if unknown:
+        print(f"Unknown functions: {', '.join(sorted(unknown))}")
+        sys.exit(2)
+
+    baseline = baselines.load(baseline_path)
+
+    level1 = importlib.import_module("levels.level1")
+    level1.open_display()
+    results = {}
+    for benchmark in MICROBENCHMARKS:
+        if not names or benchmark.name in names:
+            results[benchmark.name] = benchmark.run(repeat)
+
+    print_results(results, baseline)
+    regressions = find_regressions(results, baseline, tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+
+    if "--save" in arguments:
+        baselines.save(baseline_path, results)
+    pygame.quit()
+    sys.exit(1 if regressions else 0)
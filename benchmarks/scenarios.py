@@ -0,0 +1,202 @@
+# benchmarks/scenarios.py
+#
+# Scenario benchmarks: plays levels 1 to 3 headless through canned scenarios, drawing
+# every frame, and reports the 50th, 95th and 99th percentile frame time and the most
+# entities that were on screen at once. Run it from where the game runs:
+#
+#     python -m benchmarks.scenarios                    # every scenario, compared with the baseline
+#     python -m benchmarks.scenarios stream bear_fight  # only these
+#     python -m benchmarks.scenarios --save             # and keep the results as the new baseline
+#     python -m benchmarks.scenarios --repeat 5         # best of 5 runs of each (default 3)
+#
+# Baselines are per machine, in benchmarks/baselines/<host name>-scenarios.json (or --baseline PATH).
+# A percentile more than --tolerance (default 0.15, i.e. 15%) slower than the baseline is
+# a regression and makes the exit status 1. Every scenario is seeded and scripted, so it
+# plays out the same every run; if the peak entity counts differ from the baseline, the
+# workload itself changed and the times are not comparable.
+
+import sys
+import pygame
+from benchmarks import baseline as baselines
+from headless import LevelRun, patrol_input, use_dummy_drivers
+from inputs import ScriptedInput, key_press
+from lanes import PLAYER_Y
+from quality import governor
+
+PERCENTILES = [50, 95, 99]
+WARMUP_FRAMES = 60  # Left out of the statistics (first draws of every sprite, caches filling)
+NOISE_FLOOR = 0.05  # Milliseconds; smaller differences are never a regression
+
+
+class Scenario:
+    """
+    A seeded, scripted run of one level.
+
+    :param name: Name on the command line and in the baselines.
+    :param level: Module name of the level in levels/.
+    :param ticks: Frames to run.
+    :param input_source: What the player does (nothing by default).
+    :param on_attempt: Changes the level's state at the start of every attempt (see LevelRun).
+    :param settings: Module globals of the level to set for the run, such as bear_spawn_interval.
+    :param seed: Seed for the random streams.
+    """
+
+    def __init__(self, name, level, ticks, input_source=None, on_attempt=None, settings=None, seed=1):
+        self.name = name
+        self.level = level
+        self.ticks = ticks
+        self.input_source = input_source
+        self.on_attempt = on_attempt
+        self.settings = settings or {}
+        self.seed = seed
+
+    def run(self, repeat=1):
+        """
+        :param repeat: Runs to make; each percentile is the fastest of them, the one least
+                       disturbed by whatever else the machine was doing.
+        :return: Dict of the percentile frame times in milliseconds ("p50", ...), the number of
+                 frames measured and the peak entity counts.
+        """
+        results = [self.run_once() for _ in range(repeat)]
+        result = results[0]
+        for p in PERCENTILES:
+            result[f"p{p}"] = min(other[f"p{p}"] for other in results)
+        return result
+
+    def run_once(self):
+        governor.reset()  # Every scenario at full quality
+        run = LevelRun(self.ticks, self.input_source, render_interval=1, seed=self.seed, level=self.level,
+                       on_attempt=self.on_attempt, measure=True)
+        saved = {name: getattr(run.level, name) for name in self.settings}
+        for name, value in self.settings.items():
+            setattr(run.level, name, value)
+        try:
+            run.run()
+        finally:
+            for name, value in saved.items():
+                setattr(run.level, name, value)
+
+        frame_times = sorted(run.frame_times[WARMUP_FRAMES:])
+        result = {f"p{p}": percentile(frame_times, p) * 1000 for p in PERCENTILES}
+        result["frames"] = len(frame_times)
+        result["peaks"] = run.peaks
+        return result
+
+
+# Function to get the p-th percentile of sorted values (nearest rank)
+def percentile(values, p):
+    if not values:
+        return 0.0
+    rank = max(1, -(-len(values) * p // 100))  # Ceiling of len * p / 100
+    return values[rank - 1]
+
+# Function to make a player who walks down and up the bushes, throwing every interval ticks
+def thrower_input(ticks, interval=31, throws_per_bush=4, setup=(), bush_count=len(PLAYER_Y)):
+    """
+    :param ticks: Length of the script.
+    :param setup: Keys pressed before the first throw (such as selecting an ammo type).
+    :return: ScriptedInput
+    """
+    script = [(tick, key_press(key)) for tick, key in enumerate(setup)]
+    moves = [pygame.K_s] * (bush_count - 1) + [pygame.K_w] * (bush_count - 1)
+    tick = len(script)
+    throws = 0
+    while tick < ticks:
+        script.append((tick, key_press(pygame.K_SPACE)))
+        throws += 1
+        if throws % throws_per_bush == 0:
+            script.append((tick + 1, key_press(moves[throws // throws_per_bush % len(moves)])))
+        tick += interval
+    return ScriptedInput(script)
+
+# Function to give the player plenty of berries and honey and the pineapple triple shot
+def arm_for_bear(state):
+    state["ammo_counts"][1] = 999
+    state["ammo_counts"][2] = 999  # Five or more honey makes the bear sure to come
+    state["powerup_counts"]["pineapple"] = 10 ** 6
+
+# Function to make the wind blow at its strongest the whole time
+def full_wind(state):
+    state["wind_timer"][0] = 10 ** 9  # No new gust, which would start slow
+    state["wind_duration"][0] = 10 ** 9
+    state["wind_speed"][0] = 5 * state["wind_speed"][1]
+
+
+SCENARIOS = [
+    # Rabbits and foxes coming in non-stop while the player throws carrots and berries
+    Scenario("stream", "level1", 3600, patrol_input(interval=16)),
+    # The bear from 2 seconds in, fought with honey thrown three at a time
+    Scenario("bear_fight", "level1", 3600, thrower_input(3600, setup=[pygame.K_a]), on_attempt=arm_for_bear,
+             settings={"bear_spawn_interval": 2.0}),
+    # Level 2 with the wind at full strength, blowing in extra leaves
+    Scenario("leaf_storm", "level2", 3600, on_attempt=full_wind),
+    # Level 3 with the wind at full strength, blowing in extra snow
+    Scenario("blizzard", "level3", 3600, on_attempt=full_wind),
+]
+
+
+# Function to compare results with a baseline
+def find_regressions(results, baseline, tolerance):
+    """
+    :return: Descriptions of the percentiles that got slower than the tolerance allows.
+    """
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        if result["peaks"] != base["peaks"]:
+            print(f"{name}: peak entity counts differ from the baseline ({base['peaks']}), the workload changed")
+        for p in PERCENTILES:
+            key = f"p{p}"
+            if result[key] > base[key] * (1 + tolerance) and result[key] - base[key] > NOISE_FLOOR:
+                regressions.append(f"{name} {key}: {base[key]:.2f} ms -> {result[key]:.2f} ms "
+                                   f"(+{(result[key] / base[key] - 1) * 100:.0f}%)")
+    return regressions
+
+# Function to print a table of results
+def print_results(results, baseline):
+    print(f"{'scenario':<12}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}  peak entities")
+    for name, result in results.items():
+        peaks = ", ".join(f"{kind} {count}" for kind, count in result["peaks"].items())
+        print(f"{name:<12}{result['p50']:>9.2f}{result['p95']:>9.2f}{result['p99']:>9.2f}  {peaks}")
+        base = baseline.get(name)
+        if base:
+            print(f"{'  baseline':<12}{base['p50']:>9.2f}{base['p95']:>9.2f}{base['p99']:>9.2f}")
+
+
+if __name__ == "__main__":
+    use_dummy_drivers()
+    arguments = sys.argv[1:]
+    baseline_path = baselines.default_path("scenarios")
+    if "--baseline" in arguments:
+        baseline_path = arguments.pop(arguments.index("--baseline") + 1)
+    tolerance = 0.15
+    if "--tolerance" in arguments:
+        tolerance = float(arguments.pop(arguments.index("--tolerance") + 1))
+    repeat = 3
+    if "--repeat" in arguments:
+        repeat = int(arguments.pop(arguments.index("--repeat") + 1))
+    names = [argument for argument in arguments if not argument.startswith("--")]
+    unknown = set(names) - {scenario.name for scenario in SCENARIOS}
+    if unknown:
+        print(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+        sys.exit(2)
+
+    baseline = baselines.load(baseline_path)
+
+    results = {}
+    for scenario in SCENARIOS:
+        if not names or scenario.name in names:
+            print(f"Running {scenario.name}...")
+            results[scenario.name] = scenario.run(repeat)
+
+    print_results(results, baseline)
+    regressions = find_regressions(results, baseline, tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+
+    if "--save" in arguments:
+        baselines.save(baseline_path, results)
+    pygame.quit()
+    sys.exit(1 if regressions else 0)
@@ -0,0 +1,185 @@
+# build_assets.py
+#
+# Offline asset build step. Run it after changing anything in art/:
+#
+#     python build_assets.py            # build everything
+#     python build_assets.py atlas      # only the sprite atlas
+#     python build_assets.py pack       # only the raw pixel pack
+#
+# The atlas packs every sprite, at every size the game draws it, into art/atlas.png and
+# writes the rectangle of each variant to art/atlas.json. At startup the asset cache serves
+# those variants as subsurfaces of the atlas, so nothing is scaled at runtime.
+#
+# The pack (art/assets.pack) stores the same sprites plus the full-screen images as
+# already decoded pixels in display format. The game memory-maps it and wraps the pixels
+# with pygame.image.frombuffer, so startup does no PNG decompression at all. The pixel
+# layout is that of the display the pack is built on; the game ignores a pack whose
+# layout differs from its own display's, so build it on the machine that plays.
+
+import os
+import sys
+import json
+import struct
+import pygame
+from assets import ATLAS_INDEX, PACK_MAGIC, PACK_PATH, display_masks, pixel_format
+
+root_dir = os.path.dirname(os.path.abspath(__file__))
+art_dir = os.path.join(root_dir, "art")
+
+ATLAS_IMAGE = os.path.join(art_dir, "atlas.png")
+ATLAS_WIDTH = 512
+ATLAS_PADDING = 1  # Transparent gap between sprites
+
+# Every sprite and the sizes it is drawn at
+ATLAS_SPRITES = {
+    "player1.png": [(60, 60)],
+    "player2.png": [(60, 60)],
+    "fox.png": [(60, 60)],
+    "bear.png": [(60, 60), (30, 30)],  # Creature, bear HUD icon
+    "rabbit.png": [(40, 40)],
+    "clock.png": [(40, 40)],
+    "apple.png": [(40, 40), (50, 50)],  # Powerup HUD, powerup drop
+    "banana.png": [(40, 40), (50, 50)],
+    "pineapple.png": [(40, 40), (50, 50)],
+    "honey.png": [(25, 25), (30, 30), (50, 50)],  # Ammo, controls icon, powerup drop
+    "berry.png": [(25, 25), (30, 30), (50, 50)],
+    "carrot.png": [(25, 25), (30, 30)],
+    "leaf1.png": [(20, 20)],
+    "leaf2.png": [(20, 20)],
+}
+
+PACK_ALIGN = 64
+
+# Full-screen images that only go in the pack (too big for the atlas)
+PACK_IMAGES = {
+    "splash.png": [(800, 600)],
+    "background1.png": [(800, 600)],
+    "background2.png": [(800, 600)],
+    "background3.png": [(800, 600)],
+    "gameover.png": [(800, 600)],
+    "l1c.png": [(800, 600)],
+}
+
+
+def size_key(size):
+    return f"{size[0]}x{size[1]}"
+
+
+# Function to place rectangles on shelves, tallest first
+def pack_shelves(sizes, width, padding):
+    """
+    Simple shelf packer.
+
+    :param sizes: List of (key, (w, h)) pairs.
+    :param width: Width of the atlas.
+    :param padding: Gap left around every rectangle.
+    :return: Dict of key -> (x, y, w, h) and the total height used.
+    """
+    placements = {}
+    x = y = shelf_height = 0
+    for key, (w, h) in sorted(sizes, key=lambda item: (-item[1][1], -item[1][0])):
+        if x + w + padding > width:
+            x = 0
+            y += shelf_height + padding
+            shelf_height = 0
+        placements[key] = (x, y, w, h)
+        x += w + padding
+        shelf_height = max(shelf_height, h)
+    return placements, y + shelf_height
+
+
+# Function to build the atlas image and its index
+def build_atlas(sprites=ATLAS_SPRITES, image_path=ATLAS_IMAGE, index_path=ATLAS_INDEX):
+    sources = {}
+    variants = []
+    for name, sizes in sprites.items():
+        source = pygame.image.load(os.path.join(art_dir, name))
+        sources[name] = source
+        for size in sizes:
+            variants.append(((name, size), size))
+
+    placements, height = pack_shelves(variants, ATLAS_WIDTH, ATLAS_PADDING)
+    atlas = pygame.Surface((ATLAS_WIDTH, height), pygame.SRCALPHA)
+    atlas.fill((0, 0, 0, 0))
+
+    index = {"image": os.path.basename(image_path), "sprites": {}, "sources": {}}
+    for (name, size), rect in placements.items():
+        # Same nearest-neighbour scale the game used at runtime, so sprites look identical
+        atlas.blit(pygame.transform.scale(sources[name], size), rect[:2])
+        index["sprites"].setdefault(name, {})[size_key(size)] = list(rect)
+    for name in sprites:
+        index["sources"][name] = os.path.getmtime(os.path.join(art_dir, name))
+
+    pygame.image.save(atlas, image_path)
+    with open(index_path, "w") as index_file:
+        json.dump(index, index_file, indent=2, sort_keys=True)
+    print(f"Packed {len(placements)} sprites into {image_path} ({ATLAS_WIDTH}x{height})")
+
+
+# Function to build the memory-mappable raw pixel pack
+def build_pack(path=PACK_PATH):
+    """
+    Layout: magic, little-endian uint32 header length, JSON header, then the pixel data of
+    every entry, each aligned to PACK_ALIGN bytes. The header lists name, size, offset and
+    length of every entry, the mtime and byte size of every source PNG, which the loader
+    uses to spot a stale pack, and the pixel masks of the display.
+    """
+    images = dict(ATLAS_SPRITES)
+    images.update(PACK_IMAGES)
+
+    masks = display_masks()
+    pack_format = pixel_format(masks)
+    if pack_format is None:
+        print(f"Cannot build a pack for a display with pixel masks {masks}")
+        return
+
+    blobs = []
+    header = {"format": pack_format, "masks": masks, "entries": [], "sources": {}}
+    for name, sizes in images.items():
+        source_path = os.path.join(art_dir, name)
+        source = pygame.image.load(source_path)
+        header["sources"][name] = [os.path.getmtime(source_path), os.path.getsize(source_path)]
+        for size in sizes:
+            scaled = pygame.transform.scale(source, size).convert_alpha()
+            blobs.append(pygame.image.tobytes(scaled, pack_format))
+            header["entries"].append({"name": name, "size": list(size), "length": len(blobs[-1])})
+
+    # Offsets depend on the header length, which depends on the offsets; settle it by iterating
+    header_bytes = b""
+    while True:
+        offset = len(PACK_MAGIC) + 4 + len(header_bytes)
+        for entry, blob in zip(header["entries"], blobs):
+            offset += -offset % PACK_ALIGN
+            entry["offset"] = offset
+            offset += len(blob)
+        new_header_bytes = json.dumps(header, sort_keys=True).encode("utf-8")
+        if len(new_header_bytes) == len(header_bytes):
+            break
+        header_bytes = new_header_bytes
+
+    with open(path, "wb") as pack_file:
+        pack_file.write(PACK_MAGIC)
+        pack_file.write(struct.pack("<I", len(header_bytes)))
+        pack_file.write(header_bytes)
+        for entry, blob in zip(header["entries"], blobs):
+            pack_file.write(b"\0" * (entry["offset"] - pack_file.tell()))
+            pack_file.write(blob)
+    print(f"Packed {len(blobs)} images into {path} ({os.path.getsize(path) // 1024} KiB)")
+
+
+if __name__ == "__main__":
+    targets = sys.argv[1:] or ["atlas", "pack"]
+    if "pack" in targets:
+        # convert_alpha() needs a display; a hidden window has the pixel layout of this
+        # machine's display, and the dummy driver stands in on a machine without one
+        try:
+            pygame.display.init()
+            pygame.display.set_mode((1, 1), pygame.HIDDEN)
+        except pygame.error:
+            pygame.display.quit()
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            pygame.display.init()
+            pygame.display.set_mode((1, 1))
+        build_pack()
+    if "atlas" in targets:
+        build_atlas()
@@ -0,0 +1,96 @@
+# collisions.py
+
+# Which ammo types each kind of creature can be hit by; anything else flies straight past
+# and is never even tested against it
+CREATURE_HITS = {
+    "rabbit": ("carrot",),
+    "fox": ("berry",),
+    "bear": ("carrot", "berry", "honey"),  # Carrots are swallowed without doing damage
+}
+
+
+class AmmoIndex:
+    """
+    Grid of the ammo in flight, bucketed by ammo type, so a creature is only tested against
+    shots in the cells it overlaps and of the types that can hit it.
+
+    Shots are moved between cells incrementally as they fly (most frames a shot stays in
+    the same cells and nothing happens), and removed as soon as they hit something.
+
+    :param cell_size: Width and height of a grid cell in pixels.
+    """
+
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self.cells = {}  # (ammo type, column, row) -> set of ammo
+        self.ammo_cells = {}  # ammo -> keys of the cells it is in
+        self.fire_order = {}  # ammo -> when it was added, so the oldest shot hits first
+        self.next_order = 0
+
+    def __len__(self):
+        return len(self.ammo_cells)
+
+    def __contains__(self, ammo):
+        return ammo in self.ammo_cells
+
+    def cell_keys(self, ammo_type, rect):
+        cell_size = self.cell_size
+        return [
+            (ammo_type, column, row)
+            for column in range(rect.left // cell_size, (rect.right - 1) // cell_size + 1)
+            for row in range(rect.top // cell_size, (rect.bottom - 1) // cell_size + 1)
+        ]
+
+    def add(self, ammo):
+        self.fire_order[ammo] = self.next_order
+        self.next_order += 1
+        keys = self.cell_keys(ammo.type, ammo.rect)
+        self.ammo_cells[ammo] = keys
+        for key in keys:
+            self.cells.setdefault(key, set()).add(ammo)
+
+    def move(self, ammo):
+        """Call after the ammo's rect changed."""
+        keys = self.cell_keys(ammo.type, ammo.rect)
+        old_keys = self.ammo_cells[ammo]
+        if keys == old_keys:
+            return
+        for key in old_keys:
+            self.cells[key].discard(ammo)
+        for key in keys:
+            self.cells.setdefault(key, set()).add(ammo)
+        self.ammo_cells[ammo] = keys
+
+    def remove(self, ammo):
+        for key in self.ammo_cells.pop(ammo):
+            self.cells[key].discard(ammo)
+        del self.fire_order[ammo]
+
+    def hits(self, rect, creature):
+        """
+        :return: Every ammo of a type that hits this creature and overlaps rect, oldest first.
+        """
+        found = set()
+        for ammo_type in CREATURE_HITS[creature]:
+            for key in self.cell_keys(ammo_type, rect):
+                for ammo in self.cells.get(key, ()):
+                    if ammo.rect.colliderect(rect):
+                        found.add(ammo)
+        return sorted(found, key=self.fire_order.get)
+
+    def first_hit(self, rect, creature):
+        """
+        Finds the shot that hits rect first.
+
+        :param rect: The creature's rect.
+        :param creature: Kind of creature, a key of CREATURE_HITS.
+        :return: The earliest fired ammo of a type that hits this creature and overlaps rect,
+                 or None.
+        """
+        first = None
+        for ammo_type in CREATURE_HITS[creature]:
+            for key in self.cell_keys(ammo_type, rect):
+                for ammo in self.cells.get(key, ()):
+                    if (first is None or self.fire_order[ammo] < self.fire_order[first]) and ammo.rect.colliderect(rect):
+                        first = ammo
+        return first
@@ -0,0 +1,9 @@
+# conftest.py
+#
+# Lets the tests import the game's modules from the repository root and keeps pygame
+# from opening windows or sound devices while they run.
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
@@ -0,0 +1,226 @@
+# creature_store.py
+#
+# Optional structure-of-arrays storage for the level 1 creatures, for stress levels with
+# hundreds of them. Needs NumPy; without it the level keeps updating creatures one by one.
+
+import pygame
+from pools import ObjectPool
+from timestep import REFERENCE_RATE
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# How each kind of creature moves while nothing special is happening to it
+GRAVITY_HOP = 0  # Walks in its direction and bounces under gravity (rabbits)
+SINE_HOP = 1  # Walks left with a sine shaped hop over its bush (foxes, bears)
+MOTIONS = {"rabbit": GRAVITY_HOP, "fox": SINE_HOP, "bear": SINE_HOP}
+
+# When a creature is busy with something the vectorized step does not model (eating,
+# vibrating, descending to teleport), its own update() runs instead until it is done
+BUSY = {
+    "rabbit": lambda rabbit: rabbit.hit and rabbit.vibrate_timer > 0 and not rabbit.angry,
+    "fox": lambda fox: fox.is_hit,
+    "bear": lambda bear: bear.descending_for_teleport,
+}
+
+# Columns of the store; a creature view reads and writes these instead of instance attributes
+COLUMNS = ["x", "y", "prev_x", "prev_y", "vx", "vy", "direction", "gravity", "initial_y",
+           "bounce_height", "max_bounce_height", "original_x", "width", "height"]
+
+SINE_STEPS = 4096  # Entries in the sine lookup table (a power of two)
+
+
+class StoredAttribute:
+    """Attribute of a creature view that lives in a column of its store."""
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, view, owner=None):
+        if view is None:
+            return self
+        return view.store.columns[self.name][view.slot]
+
+    def __set__(self, view, value):
+        view.store.columns[self.name][view.slot] = value
+
+
+class CreatureView:
+    """
+    Mixed in front of Rabbit, Fox or Bear by CreatureStore.view_class. The creature keeps
+    its behaviour (on_hit, reset, teleport, drops), but its position, speed and bounce live
+    in the store's arrays and are advanced by CreatureStore.step, so update() does nothing.
+    """
+
+    store = None
+    kind = None
+    slot = None
+
+    x = StoredAttribute()
+    y = StoredAttribute()
+    prev_x = StoredAttribute()
+    prev_y = StoredAttribute()
+    vx = StoredAttribute()
+    vy = StoredAttribute()
+    direction = StoredAttribute()
+    gravity = StoredAttribute()
+    initial_y = StoredAttribute()
+    bounce_height = StoredAttribute()
+    max_bounce_height = StoredAttribute()
+    original_x = StoredAttribute()
+
+    def reinit(self, *args, **kwargs):
+        if self.slot is None:
+            self.slot = self.store.allocate(self)
+        super().reinit(*args, **kwargs)
+        self.store.refresh(self)
+
+    @property
+    def rect(self):
+        columns, slot = self.store.columns, self.slot
+        return pygame.Rect(round(columns["x"][slot]), round(columns["y"][slot]),
+                           columns["width"][slot], columns["height"][slot])
+
+    @rect.setter
+    def rect(self, rect):
+        # Only the size is kept; the position always follows x and y
+        self.store.columns["width"][self.slot], self.store.columns["height"][self.slot] = rect.size
+
+    def update(self, dt):
+        pass
+
+    def on_hit(self, *args):
+        powerup = super().on_hit(*args)
+        self.store.refresh(self)
+        return powerup
+
+
+class StorePool(ObjectPool):
+    """
+    ObjectPool of creature views: acquiring one also gives it a slot in the store and
+    releasing it frees the slot, so the level spawns and removes creatures exactly as it
+    does with the plain pools.
+    """
+
+    def __init__(self, store, view_class):
+        super().__init__(view_class, name=f"{view_class.kind} (store)")
+        self.store = store
+
+    def release(self, obj):
+        if obj in self.in_use:
+            self.store.free(obj)
+        super().release(obj)
+
+    def release_all(self):
+        for obj in self.in_use:
+            self.store.free(obj)
+        super().release_all()
+
+
+class CreatureStore:
+    """
+    Positions, speeds, bounce parameters and state flags of every creature in NumPy arrays,
+    advanced for all creatures at once by step(). Hop arcs use a sine lookup table.
+
+    Only the rare per-creature events (a rabbit reaching the edge of the screen, a creature
+    that is eating or teleporting) go back to Python.
+
+    :param capacity: Initial number of slots; the arrays grow when they run out.
+    """
+
+    def __init__(self, capacity=256):
+        self.columns = {name: numpy.zeros(capacity) for name in COLUMNS}
+        self.motion = numpy.zeros(capacity, dtype=numpy.int8)
+        self.active = numpy.zeros(capacity, dtype=bool)
+        self.busy = numpy.zeros(capacity, dtype=bool)
+        self.views = [None] * capacity
+        self.free_slots = list(range(capacity - 1, -1, -1))
+        self.sine_table = numpy.sin(numpy.arange(SINE_STEPS) * (2 * numpy.pi / SINE_STEPS))
+        self.view_classes = {}
+
+    def __len__(self):
+        return int(self.active.sum())
+
+    def view_class(self, cls, kind):
+        """
+        :param cls: Rabbit, Fox or Bear.
+        :param kind: "rabbit", "fox" or "bear".
+        :return: Subclass of cls whose instances live in this store.
+        """
+        if cls not in self.view_classes:
+            self.view_classes[cls] = type(cls.__name__, (CreatureView, cls), {"store": self, "kind": kind})
+        return self.view_classes[cls]
+
+    def pool(self, cls, kind):
+        """Pool handing out creatures of class cls that live in this store."""
+        return StorePool(self, self.view_class(cls, kind))
+
+    def allocate(self, view):
+        if not self.free_slots:
+            self.grow()
+        slot = self.free_slots.pop()
+        self.views[slot] = view
+        self.motion[slot] = MOTIONS[view.kind]
+        self.active[slot] = True
+        return slot
+
+    def free(self, view):
+        self.active[view.slot] = False
+        self.busy[view.slot] = False
+        self.views[view.slot] = None
+        self.free_slots.append(view.slot)
+        view.slot = None
+
+    def grow(self):
+        capacity = len(self.active)
+        for name, column in self.columns.items():
+            self.columns[name] = numpy.concatenate([column, numpy.zeros(capacity)])
+        self.motion = numpy.concatenate([self.motion, numpy.zeros(capacity, dtype=numpy.int8)])
+        self.active = numpy.concatenate([self.active, numpy.zeros(capacity, dtype=bool)])
+        self.busy = numpy.concatenate([self.busy, numpy.zeros(capacity, dtype=bool)])
+        self.views.extend([None] * capacity)
+        self.free_slots.extend(range(2 * capacity - 1, capacity - 1, -1))
+
+    def refresh(self, view):
+        """Call after something may have made the creature busy (or done)."""
+        self.busy[view.slot] = BUSY[view.kind](view)
+
+    def sine(self, angles):
+        index = numpy.rint(angles * (SINE_STEPS / (2 * numpy.pi))).astype(numpy.intp)
+        return self.sine_table[index & (SINE_STEPS - 1)]
+
+    def step(self, dt):
+        """Advances every creature by one tick (dt seconds)."""
+        columns = self.columns
+        x, y, vx, vy = columns["x"], columns["y"], columns["vx"], columns["vy"]
+        columns["prev_x"][:] = x
+        columns["prev_y"][:] = y
+        moving = self.active & ~self.busy
+
+        # Rabbits: walk in their direction and bounce under gravity
+        rabbits = moving & (self.motion == GRAVITY_HOP)
+        x[rabbits] += vx[rabbits] * dt * columns["direction"][rabbits]
+        vy[rabbits] += columns["gravity"][rabbits] * dt
+        y[rabbits] += vy[rabbits] * dt
+        landed = rabbits & (y >= columns["initial_y"])
+        y[landed] = columns["initial_y"][landed]
+        vy[landed] = -10
+
+        # Foxes and bears: walk left, hopping over their bush
+        hoppers = moving & (self.motion == SINE_HOP)
+        x[hoppers] -= vx[hoppers] * (dt * REFERENCE_RATE)
+        y[hoppers] = columns["max_bounce_height"][hoppers] + numpy.trunc(
+            columns["bounce_height"][hoppers] * self.sine(x[hoppers] / 20))
+        columns["original_x"][hoppers] = x[hoppers]
+
+        # Rabbits at the edge of the screen turn around or start over
+        for slot in numpy.flatnonzero(rabbits & ((x < 0) | (x > 800))):
+            self.views[slot].check_edges()
+
+        # Busy creatures run their own update until they are done
+        for slot in numpy.flatnonzero(self.busy & self.active):
+            view = self.views[slot]
+            super(CreatureView, view).update(dt)
+            self.refresh(view)
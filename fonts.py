@@ -0,0 +1,69 @@
+# fonts.py
+
+import pygame
+
+# Font name -> file path from pygame.font.match_font (None means pygame's default font)
+font_paths = {}
+# (path, size) -> Font
+fonts = {}
+# (name, size, bold, italic) -> Font from pygame.font.SysFont
+sysfonts = {}
+# (text, name, max_width, max_height, initial_size, min_size) -> fitting size
+fitting_sizes = {}
+
+
+# Function to resolve a font name to a file once; match_font runs a system font lookup
+def get_font_path(name):
+    if name not in font_paths:
+        font_paths[name] = pygame.font.match_font(name) if name else None
+    return font_paths[name]
+
+
+# Function to get a shared Font for a font name and size
+def get_font(name, size):
+    path = get_font_path(name)
+    font = fonts.get((path, size))
+    if font is None:
+        font = pygame.font.Font(path, size)
+        fonts[(path, size)] = font
+    return font
+
+
+# Function to get a shared SysFont (same arguments as pygame.font.SysFont)
+def get_sysfont(name, size, bold=False, italic=False):
+    key = (name, size, bold, italic)
+    font = sysfonts.get(key)
+    if font is None:
+        font = pygame.font.SysFont(name, size, bold=bold, italic=italic)
+        sysfonts[key] = font
+    return font
+
+
+# Function to find the largest font size that fits text inside a box
+def fit_font(text, name, max_width, max_height, initial_size=24, min_size=12):
+    """
+    Returns the largest size from min_size to initial_size at which text fits inside the box
+    with a 10 pixel margin (or min_size if none does). It binary searches the size with
+    Font.size, which measures without rendering, and memoizes the answer per (text, box).
+
+    :param text: The text to fit.
+    :param name: Font name as passed to pygame.font.match_font.
+    :param max_width: Width of the box.
+    :param max_height: Height of the box.
+    :return: A shared Font at the fitting size.
+    """
+    key = (text, name, max_width, max_height, initial_size, min_size)
+    size = fitting_sizes.get(key)
+    if size is None:
+        size = min_size
+        low, high = min_size, initial_size
+        while low <= high:
+            middle = (low + high) // 2
+            width, height = get_font(name, middle).size(text)
+            if width <= max_width - 10 and height <= max_height - 10:
+                size = middle
+                low = middle + 1
+            else:
+                high = middle - 1
+        fitting_sizes[key] = size
+    return get_font(name, size)
@@ -0,0 +1,163 @@
+# headless.py
+#
+# Runs level 1 with no window, no sound and no frame cap, to measure what the simulation
+# itself costs and to soak it for hours of game time on a machine without a display:
+#
+#     python headless.py                  # 10 simulated minutes, nothing drawn, nobody playing
+#     python headless.py 216000 --patrol  # an hour at 60 ticks per second, with a scripted player
+#     python headless.py --render         # draw every frame too (to the dummy display)
+#     python headless.py --seed 1234      # roll the same random numbers as an earlier run
+#
+# Every frame runs exactly one tick of the same spawn, update and collision code the game
+# runs, as fast as the machine allows. When the level ends (game over or clock clicked)
+# the run starts it over until it has run the ticks it was asked for.
+
+import os
+import sys
+import time
+import importlib
+import pygame
+from inputs import NullInput, ScriptedInput, key_press
+from lanes import PLAYER_Y
+from rng import streams
+
+# Events from the window that still reach the level while something else plays it
+WINDOW_EVENTS = (pygame.QUIT, pygame.WINDOWEXPOSED)
+
+
+# Function to make SDL use its dummy video and audio drivers; call it before level 1 is
+# imported, which initializes pygame
+def use_dummy_drivers():
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+
+class LevelRun:
+    """
+    Plays a level in place of a player; the level checks its autoplay global and takes its
+    frame pacing and input from here. Every frame is exactly one tick (levels 2 and 3,
+    which have no fixed timestep, update once per frame and always draw).
+
+    :param ticks: Simulation ticks to run, over as many attempts at the level as it takes.
+    :param input_source: Where the player's input comes from (NullInput by default).
+    :param render_interval: Draw a frame every this many ticks (0 never draws, so only the
+                            simulation is measured; more than 1 fast-forwards).
+    :param frame_rate: Cap on the drawn frames per second (None runs flat out).
+    :param seed: Seed for the random streams (None picks a fresh one).
+    :param level: Module name of the level in levels/.
+    :param on_attempt: Called with a dict of the level's state (ammo counts, wind) at the
+                       start of every attempt, to set up a scenario by changing it.
+    :param measure: Keep the time of every frame and the most entities seen at once.
+    """
+
+    def __init__(self, ticks, input_source=None, render_interval=0, frame_rate=None, seed=None,
+                 level="level1", on_attempt=None, measure=False):
+        self.level = importlib.import_module("levels." + level)
+        self.ticks = ticks
+        self.input_source = input_source or NullInput()
+        self.render_interval = render_interval
+        self.frame_rate = frame_rate
+        self.seed = seed
+        self.clock = pygame.time.Clock()
+        self.tick = 0  # Ticks run so far, counted by the level
+        self.attempts = 0
+        self.game_overs = 0
+        self.completions = 0
+        self.elapsed = 0.0  # Wall clock seconds the ticks took
+        self.on_attempt = on_attempt
+        self.measure = measure
+        self.frame_times = []  # Seconds per frame, when measuring
+        self.peaks = {}  # Most entities of each kind at once, when measuring
+        self.frame_start = None
+
+    @property
+    def finished(self):
+        return self.tick >= self.ticks
+
+    def begin_attempt(self, state):
+        """Called by the level once it has set up an attempt."""
+        self.frame_start = None  # The set up is not a frame
+        if self.on_attempt:
+            self.on_attempt(state)
+
+    def events(self, tick):
+        if self.measure:
+            now = time.perf_counter()
+            if self.frame_start is not None:
+                self.frame_times.append(now - self.frame_start)
+            self.frame_start = now
+        window_events = [event for event in pygame.event.get() if event.type in WINDOW_EVENTS]
+        return window_events + self.input_source.events(tick)
+
+    def checksum(self, tick, value):
+        self.input_source.checksum(tick, value)
+
+    def count_entities(self, **counts):
+        """Called by the level after every tick with the number of each kind of entity."""
+        if self.measure:
+            for name, count in counts.items():
+                if count > self.peaks.get(name, 0):
+                    self.peaks[name] = count
+
+    def render_frame(self, tick):
+        """True if the level should draw after this tick; waits out the frame cap first."""
+        if not self.render_interval or tick % self.render_interval:
+            return False
+        if self.frame_rate:
+            self.clock.tick(self.frame_rate)
+        return True
+
+    def run(self):
+        # Open the display and load the assets before the clock starts
+        if getattr(self.level, "display_surface", False) is None:
+            self.level.open_display()
+        self.seed = streams.reseed(self.seed)
+        self.level.autoplay = self
+        start = time.perf_counter()
+        try:
+            while not self.finished:
+                self.attempts += 1
+                self.level.start_level()
+        finally:
+            self.level.autoplay = None
+        self.elapsed = time.perf_counter() - start
+        return self
+
+    def report(self):
+        simulated = self.tick / getattr(self.level, "tick_rate", 60)  # Levels 2 and 3 step once per 1/60 s
+        print(f"{self.tick} ticks ({simulated / 60:.1f} simulated minutes) in {self.elapsed:.2f} s: "
+              f"{self.elapsed * 1000 / max(self.tick, 1):.3f} ms per tick, {simulated / max(self.elapsed, 1e-9):.0f}x real time")
+        print(f"{self.attempts} attempts, {self.game_overs} game overs, {self.completions} completions, seed {self.seed}")
+
+
+# Function to make a player who walks down and up the bushes, throwing carrots and berries
+def patrol_input(bush_count=len(PLAYER_Y), interval=30):
+    """
+    :param bush_count: Bushes to walk between.
+    :param interval: Ticks between actions.
+    :return: ScriptedInput that repeats the patrol forever.
+    """
+    moves = [pygame.K_s] * (bush_count - 1) + [pygame.K_w] * (bush_count - 1)
+    script = []
+    for i, move in enumerate(moves):
+        tick = i * 2 * interval
+        script.append((tick, key_press(pygame.K_SPACE)))  # Carrot
+        script.append((tick + interval // 2, key_press(pygame.K_d)))
+        script.append((tick + interval, key_press(pygame.K_SPACE)))  # Berry, while there are any
+        script.append((tick + interval + interval // 2, key_press(pygame.K_a)))
+        script.append((tick + 2 * interval - 1, key_press(move)))
+    return ScriptedInput(script, period=len(moves) * 2 * interval)
+
+
+if __name__ == "__main__":
+    use_dummy_drivers()
+    arguments = sys.argv[1:]
+    seed = None
+    if "--seed" in arguments:
+        seed = int(arguments.pop(arguments.index("--seed") + 1))
+    counts = [argument for argument in arguments if not argument.startswith("--")]
+    ticks = int(counts[0]) if counts else 10 * 60 * 60
+    run = LevelRun(ticks, patrol_input() if "--patrol" in arguments else None,
+                   render_interval=1 if "--render" in arguments else 0, seed=seed)
+    run.run().report()
+    pygame.quit()
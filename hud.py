@@ -0,0 +1,97 @@
+# hud.py
+
+import pygame
+
+
+class Panel:
+    """
+    One HUD panel (the ammo boxes, the powerup timers, the bear health bar...).
+
+    The panel owns a rectangle of the HUD layer and only redraws it when the values it is
+    bound to change. render(surface, *values) draws the panel with its top left corner at
+    (0, 0) of surface.
+
+    :param rect: Where the panel goes on the game surface.
+    :param render: Function that draws the panel.
+    :param refresh_interval: Minimum seconds between redraws, for counters that do not need
+                             to be shown the instant they change (0 redraws on every change).
+    """
+
+    def __init__(self, rect, render, refresh_interval=0):
+        self.rect = pygame.Rect(rect)
+        self.render = render
+        self.refresh_interval = refresh_interval
+        self.surface = None  # The panel's area of the HUD layer, set by the HUD
+        self.visible = True
+        self.state = None
+        self.values = None
+        self.last_refresh = None
+
+    def update(self, *values, key=None):
+        """
+        Binds the panel to new values and redraws it if what it shows has changed.
+
+        :param values: Passed on to render.
+        :param key: Hashable summary of what the panel shows, when comparing the values
+                    themselves would redraw too often (defaults to the values).
+        :return: True if the panel was redrawn.
+        """
+        state = values if key is None else key
+        if state == self.state:
+            return False
+        now = pygame.time.get_ticks() / 1000
+        if self.last_refresh is not None and now - self.last_refresh < self.refresh_interval:
+            return False
+        self.state = state
+        self.values = values
+        self.last_refresh = now
+        self.redraw()
+        return self.visible
+
+    def redraw(self):
+        self.surface.fill((0, 0, 0, 0))
+        if self.visible and self.values is not None:
+            self.render(self.surface, *self.values)
+
+
+class HUD:
+    """
+    Retained-mode HUD: every panel draws into its own area of one transparent layer, so the
+    whole HUD is a single blit per frame and nothing is redrawn while the bound values stay
+    the same.
+
+    The layer can hold partly transparent pixels (antialiased text, soft sprite edges), so
+    it must be drawn over what is under it, never over its own last draw. changed tells the
+    dirty renderer whether the HUD looks different from last frame.
+
+    :param panels: Dict of panel name -> Panel. Panels must not overlap.
+    """
+
+    def __init__(self, panels):
+        self.panels = panels
+        self.rect = pygame.Rect(list(panels.values())[0].rect).unionall([panel.rect for panel in panels.values()])
+        self.layer = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        self.layer.fill((0, 0, 0, 0))
+        for panel in panels.values():
+            panel.surface = self.layer.subsurface(panel.rect.move(-self.rect.x, -self.rect.y))
+        self.changed = True  # Since the last draw
+
+    def update(self, name, *values, key=None):
+        redrawn = self.panels[name].update(*values, key=key)
+        self.changed = self.changed or redrawn
+        return redrawn
+
+    def show(self, name, visible=True):
+        panel = self.panels[name]
+        if panel.visible != visible:
+            panel.visible = visible
+            panel.redraw()
+            self.changed = True
+
+    def set_refresh_interval(self, refresh_interval):
+        for panel in self.panels.values():
+            panel.refresh_interval = refresh_interval
+
+    def draw(self, screen):
+        screen.blit(self.layer, self.rect.topleft)
+        self.changed = False
@@ -0,0 +1,183 @@
+# inputs.py
+#
+# Where a level gets its input from. Every input source hands the level the events to
+# handle before a given simulation tick, with mouse positions already in game surface
+# coordinates: the player at the window, nobody, a script, or a recording of an earlier
+# attempt being played again (see headless.py and replay.py).
+
+import json
+import zlib
+import pygame
+
+CHECKSUM_INTERVAL = 60  # Ticks between the game state checksums a recording keeps
+
+
+class InputSource:
+    """Base of the input sources: no events, and checksums of the game state are ignored."""
+
+    def events(self, tick):
+        """
+        :param tick: Ticks the attempt has run so far.
+        :return: Events to handle before the next tick.
+        """
+        return []
+
+    def checksum(self, tick, value):
+        """Called by the level with a checksum of its state every CHECKSUM_INTERVAL ticks."""
+
+
+class LiveInput(InputSource):
+    """
+    The player at the window: pygame's event queue.
+
+    :param to_game: Converts a position in the window to the game surface.
+    """
+
+    def __init__(self, to_game):
+        self.to_game = to_game
+
+    def events(self, tick):
+        events = pygame.event.get()
+        for i, event in enumerate(events):
+            if event.type == pygame.MOUSEBUTTONDOWN:
+                events[i] = click(self.to_game(event.pos), event.button)
+        return events
+
+
+class NullInput(InputSource):
+    """A player who never touches anything."""
+
+
+class ScriptedInput(InputSource):
+    """
+    Plays a fixed script of events, each before the tick it is listed at.
+
+    :param script: (tick, event) pairs.
+    :param period: Start the script over every this many ticks (None plays it once).
+    """
+
+    def __init__(self, script, period=None):
+        self.script = {}
+        for tick, event in script:
+            self.script.setdefault(tick, []).append(event)
+        self.period = period
+
+    def events(self, tick):
+        if self.period:
+            tick %= self.period
+        return self.script.get(tick, [])
+
+
+class Recording:
+    """
+    Everything needed to play an attempt at a level again exactly as it went: the seed of
+    the random streams, the settings that change the simulation, the key presses and clicks
+    by tick, and a checksum of the game state every CHECKSUM_INTERVAL ticks to prove that
+    a replay really did the same.
+
+    Saved as JSON; key presses are [tick, key] and clicks [tick, x, y, button].
+
+    :param level: Name of the level, "level1".
+    :param seed: Seed of the random streams at the start of the attempt.
+    :param settings: Settings the simulation depends on, such as tick_rate.
+    """
+
+    def __init__(self, level, seed, settings, events=None, checksums=None, ticks=0):
+        self.level = level
+        self.seed = seed
+        self.settings = settings
+        self.events = events if events is not None else []
+        self.checksums = checksums if checksums is not None else {}
+        self.ticks = ticks  # Length of the attempt
+
+    def save(self, path):
+        with open(path, "w") as recording_file:
+            json.dump({"level": self.level, "seed": self.seed, "settings": self.settings, "ticks": self.ticks,
+                       "events": self.events, "checksums": sorted(self.checksums.items())},
+                      recording_file, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as recording_file:
+            data = json.load(recording_file)
+        return cls(data["level"], data["seed"], data["settings"], data["events"],
+                   {tick: value for tick, value in data["checksums"]}, data["ticks"])
+
+
+class InputRecorder(InputSource):
+    """
+    Passes the events of another input source on to the level, writing down the ones that
+    change the game (presses of the keys in keys, and mouse clicks) in a Recording along
+    with the level's checksums.
+
+    :param source: Input source being recorded.
+    :param recording: Recording to write to.
+    :param keys: Keys that play the game; window keys such as Alt+Enter are not recorded.
+    """
+
+    def __init__(self, source, recording, keys):
+        self.source = source
+        self.recording = recording
+        self.keys = keys
+
+    def events(self, tick):
+        events = self.source.events(tick)
+        for event in events:
+            if event.type == pygame.KEYDOWN and event.key in self.keys:
+                self.recording.events.append([tick, event.key])
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                self.recording.events.append([tick, *event.pos, event.button])
+        return events
+
+    def checksum(self, tick, value):
+        self.recording.checksums[tick] = value
+
+    def save(self, path, ticks):
+        """Writes the recording of an attempt that ran ticks ticks to path."""
+        self.recording.ticks = ticks
+        self.recording.save(path)
+        print(f"Recorded {ticks} ticks to {path}")
+
+
+class ReplayInput(InputSource):
+    """
+    Plays the input of a Recording back and compares the level's checksums with the
+    recorded ones; mismatch is the first tick where they differed (None while they agree).
+    """
+
+    def __init__(self, recording):
+        self.recording = recording
+        self.script = {}
+        for entry in recording.events:
+            if len(entry) == 2:
+                event = key_press(entry[1])
+            else:
+                event = click(entry[1:3], entry[3])
+            self.script.setdefault(entry[0], []).append(event)
+        self.checked = 0
+        self.mismatch = None
+
+    def events(self, tick):
+        return self.script.get(tick, [])
+
+    def checksum(self, tick, value):
+        expected = self.recording.checksums.get(tick)
+        if expected is None:
+            return
+        self.checked += 1
+        if value != expected and self.mismatch is None:
+            self.mismatch = tick
+            print(f"Replay differs from the recording at tick {tick}")
+
+
+# Function to sum up a list of numbers describing the game state as a checksum
+def state_checksum(values):
+    return zlib.crc32(repr([float(value) for value in values]).encode("ascii"))
+
+# Function to make a key press event
+def key_press(key, mod=0):
+    return pygame.event.Event(pygame.KEYDOWN, key=key, mod=mod, unicode="")
+
+# Function to make a mouse click event at a point of the game surface
+def click(pos, button=1):
+    return pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=tuple(pos), button=button)
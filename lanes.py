@@ -0,0 +1,50 @@
+# lanes.py
+#
+# Geometry of the four bush lanes in level 1, shared by the player, the creatures, the
+# ammo and the bush overlay so it is only written down once.
+
+import pygame
+
+GAME_WIDTH, GAME_HEIGHT = 800, 600
+
+LANE_NAMES = ["upper", "middle", "lower", "bottom"]
+BUSH_TOPS = [113, 256, 393, 543]  # Where the bush of each lane starts
+BUSH_HEIGHT = 37
+PLAYER_Y = [52, 196, 333, 483]  # Player stands just above the bush
+RABBIT_Y = [90, 235, 370, 520]
+
+# Everything of a creature below the top of its bush is hidden; creatures are at most this tall
+OCCLUSION_DEPTH = 60
+
+# Lane name -> top of its bush
+bush_y_coordinates = dict(zip(LANE_NAMES, BUSH_TOPS))
+
+bush_rects = [pygame.Rect(0, top, GAME_WIDTH, BUSH_HEIGHT) for top in BUSH_TOPS]
+
+
+# Function to get the top of the first bush below a y coordinate (None if there is none)
+def bush_top_below(y):
+    for top in BUSH_TOPS:
+        if top > y:
+            return top
+    return None
+
+
+class BushOverlay:
+    """
+    The bushes as a foreground layer: strips of the background from the top of each bush
+    down OCCLUSION_DEPTH pixels, drawn after the creatures so they appear to stand behind
+    the bushes. Creatures blit unclipped and the overlay hides whatever is below the bush
+    line. The strips are subsurfaces of the background, so they cost no extra memory.
+
+    :param background: The level's static layer.
+    """
+
+    def __init__(self, background):
+        self.strips = []
+        for top in BUSH_TOPS:
+            height = min(OCCLUSION_DEPTH, background.get_height() - top)
+            self.strips.append((background.subsurface(0, top, background.get_width(), height), (0, top)))
+
+    def draw(self, screen):
+        screen.blits(self.strips, doreturn=0)
@@ -2,12 +2,25 @@ import sys
 import pygame
 import os
 import time
-import random
 import math
-from Sprites.rabbit import Rabbit
-from Sprites.fox import Fox
-from Sprites.bear import Bear
-from Sprites.powerup import Powerup
+from Sprites.rabbit import Rabbit, rabbit_pool
+from Sprites.fox import Fox, fox_pool
+from Sprites.bear import Bear, bear_pool
+from Sprites.powerup import powerup_pool
+from assets import ROOT_DIR, cache, load_atlas, load_image, load_pack, sound_bank
+from levels.manifests import level_sounds
+from fonts import get_sysfont
+from hud import HUD, Panel
+from renderer import DirtyRenderer, TrackingSurface, build_static_layer
+from presentation import Presenter
+from quality import governor
+from timestep import REFERENCE_RATE, FixedTimestep
+from rng import streams
+from inputs import CHECKSUM_INTERVAL, InputRecorder, LiveInput, Recording, state_checksum
+from collisions import AmmoIndex
+from projectiles import Projectile, ProjectileBuffer
+from lanes import BushOverlay, LANE_NAMES, PLAYER_Y, RABBIT_Y, bush_top_below
+import creature_store
 
 # Initialize Pygame
 pygame.init()
@@ -15,7 +28,16 @@ pygame.init()
 # Constants
 GAME_WIDTH, GAME_HEIGHT = 800, 600  # Internal resolution
 FPS = 60
+dirty_rendering = False  # Only redraw and update the parts of the window that changed (set from config.ini)
+vectorized_creatures = False  # Move every creature at once from NumPy arrays (set from config.ini)
+smooth_scaling = False  # Scale the game to the window with smoothscale (set from config.ini)
+tick_rate = 60  # Simulation ticks per second, independent of the frame rate (set from config.ini)
+record_input = False  # Save the input of every attempt to recordings/ for replay.py (set from config.ini)
+autoplay = None  # LevelRun playing the level in place of the player (see headless.py)
 hit_flash_duration = 0.2  # Flash duration in seconds (moved to global scope)
+bear_spawn_interval = 30.0  # Seconds between attempts to spawn the bear
+AMMO_TYPES = ["carrot", "berry", "honey"]  # In ammo selection order
+GAME_KEYS = (pygame.K_w, pygame.K_s, pygame.K_a, pygame.K_d, pygame.K_SPACE)  # Keys that play the game (and are recorded)
 
 # Colors
 WHITE = (255, 255, 255)
@@ -26,17 +48,19 @@ BLACK = (0, 0, 0)
 # Initialize display
 is_fullscreen = False  # Flag to track full-screen mode
 display_flags = pygame.RESIZABLE
-display_surface = pygame.display.set_mode((GAME_WIDTH, GAME_HEIGHT), display_flags)
-pygame.display.set_caption("Level 1")
+display_surface = None  # Opened by open_display() when the level first starts, not on import
 
 # Create game surface for internal rendering
-game_surface = pygame.Surface((GAME_WIDTH, GAME_HEIGHT))
+game_surface = TrackingSurface((GAME_WIDTH, GAME_HEIGHT))
+
+# Scales game_surface to the window, full screen or resized
+presenter = Presenter((GAME_WIDTH, GAME_HEIGHT))
 
 # Clock for controlling frame rate
 clock = pygame.time.Clock()
 
 # Root directory for assets
-root_dir = "D:/Projects/FoodThrowGame2"
+root_dir = ROOT_DIR
 
 # Define news headlines for the news ticker
 news_headlines = [
@@ -50,21 +74,26 @@ news_headlines = [
     "- Farm Donates Unlimited Carrots to Feed Rabbits -"
 ]
 
-# Powerup images (for permanent HUD, excluding honey)
-try:
-    powerup_images = {
-        "apple": pygame.image.load(os.path.join(root_dir, "art", "apple.png")).convert_alpha(),
-        "banana": pygame.image.load(os.path.join(root_dir, "art", "banana.png")).convert_alpha(),
-        "pineapple": pygame.image.load(os.path.join(root_dir, "art", "pineapple.png")).convert_alpha()
-    }
-except pygame.error as e:
-    print(f"Unable to load powerup images: {e}")
-    pygame.quit()
-    sys.exit()
-
-# Resize powerup images to fit HUD boxes
-for key in powerup_images:
-    powerup_images[key] = pygame.transform.scale(powerup_images[key], (40, 40))
+# Powerup images (for permanent HUD, excluding honey), loaded by open_display()
+powerup_images = {}
+
+# Function to open the window and load what needs a display to convert images against
+def open_display():
+    global display_surface
+    display_surface = pygame.display.set_mode((GAME_WIDTH, GAME_HEIGHT), display_flags)
+    pygame.display.set_caption("Level 1")
+    load_pack()
+    load_atlas()
+
+    # Resized to fit HUD boxes
+    try:
+        powerup_images["apple"] = load_image(os.path.join(root_dir, "art", "apple.png"), (40, 40))
+        powerup_images["banana"] = load_image(os.path.join(root_dir, "art", "banana.png"), (40, 40))
+        powerup_images["pineapple"] = load_image(os.path.join(root_dir, "art", "pineapple.png"), (40, 40))
+    except pygame.error as e:
+        print(f"Unable to load powerup images: {e}")
+        pygame.quit()
+        sys.exit()
 
 # Clock sprite class
 class ClockSprite(pygame.sprite.Sprite):
@@ -72,42 +101,25 @@ class ClockSprite(pygame.sprite.Sprite):
         super().__init__()
         clock_image_path = os.path.join(root_dir, "art", "clock.png")
         try:
-            self.image = pygame.image.load(clock_image_path).convert_alpha()
+            self.image = load_image(clock_image_path, (40, 40))
         except pygame.error as e:
             print(f"Unable to load clock image at {clock_image_path}: {e}")
             pygame.quit()
             sys.exit()
-        self.image = pygame.transform.scale(self.image, (40, 40))
         self.rect = self.image.get_rect(center=(x, y))
 
 # Ammo class
-class Ammo:
-    def __init__(self, x, y, image, bushes, is_berry=False, speed=2, angle=0):
-        self.x = x
-        self.y = y
-        self.image = image
-        self.speed = speed
-        self.angle = math.radians(angle)
-        self.rect = self.image.get_rect(topleft=(self.x, self.y))
-        self.is_berry = is_berry
-        self.bushes = bushes
+class Ammo(Projectile):
+    def fire(self, x, y, image, ammo_type="carrot", speed=2, angle=0):
+        super().fire(x, y, image, ammo_type, speed, angle)
+        self.is_berry = ammo_type == "berry"
         if self.is_berry:
             self.adjust_hitbox()
 
     def adjust_hitbox(self):
-        for bush in self.bushes:
-            if bush.top > self.y:
-                self.rect.height = bush.top - self.y
-                break
-
-    def update(self):
-        self.x += self.speed * math.cos(self.angle)
-        self.y -= self.speed * math.sin(self.angle)
-        self.rect.x = self.x
-        self.rect.y = self.y
-
-    def draw(self, screen):
-        screen.blit(self.image, (self.x, self.y))
+        bush_top = bush_top_below(self.y)
+        if bush_top is not None:
+            self.rect.height = bush_top - self.y
 
 # Player class
 class Player:
@@ -115,16 +127,14 @@ class Player:
         self.original_image_path = image_path
         self.throwing_image_path = os.path.join(root_dir, "art", "player2.png")
         try:
-            self.image = pygame.image.load(self.original_image_path).convert_alpha()
+            self.image = load_image(self.original_image_path, (60, 60))
         except pygame.error as e:
             print(f"Unable to load player image at {self.original_image_path}: {e}")
             pygame.quit()
             sys.exit()
-        self.image = pygame.transform.scale(self.image, (60, 60))
         self.x = x
-        self.bushes = [52, 196, 333, 483]
         self.bush_index = 0
-        self.y = self.bushes[self.bush_index]
+        self.y = PLAYER_Y[self.bush_index]
         self.rect = self.image.get_rect(topleft=(self.x, self.y))
         self.is_throwing = False
         self.base_speed = 5
@@ -140,36 +150,34 @@ class Player:
     def move_up(self):
         if self.bush_index > 0:
             self.bush_index -= 1
-            self.y = self.bushes[self.bush_index]
+            self.y = PLAYER_Y[self.bush_index]
             self.rect.topleft = (self.x, self.y)
 
     def move_down(self):
-        if self.bush_index < len(self.bushes) - 1:
+        if self.bush_index < len(PLAYER_Y) - 1:
             self.bush_index += 1
-            self.y = self.bushes[self.bush_index]
+            self.y = PLAYER_Y[self.bush_index]
             self.rect.topleft = (self.x, self.y)
 
     def throw_ammo(self):
         if not self.is_throwing:
             try:
-                self.image = pygame.image.load(self.throwing_image_path).convert_alpha()
+                self.image = load_image(self.throwing_image_path, (60, 60))
             except pygame.error as e:
                 print(f"Unable to load throwing player image at {self.throwing_image_path}: {e}")
                 pygame.quit()
                 sys.exit()
-            self.image = pygame.transform.scale(self.image, (60, 60))
             self.rect = self.image.get_rect(topleft=(self.x, self.y))
             self.is_throwing = True
             pygame.time.set_timer(pygame.USEREVENT + 1, 500)
 
     def reset_sprite(self):
         try:
-            self.image = pygame.image.load(self.original_image_path).convert_alpha()
+            self.image = load_image(self.original_image_path, (60, 60))
         except pygame.error as e:
             print(f"Unable to load player image at {self.original_image_path}: {e}")
             pygame.quit()
             sys.exit()
-        self.image = pygame.transform.scale(self.image, (60, 60))
         self.rect = self.image.get_rect(topleft=(self.x, self.y))
         self.is_throwing = False
 
@@ -188,12 +196,10 @@ def toggle_fullscreen():
         display_surface = pygame.display.set_mode((GAME_WIDTH, GAME_HEIGHT), pygame.RESIZABLE)
 
 # Function to draw Ammo HUD on top left
-def draw_ammo_hud(screen, ammo_counts, ammo_sprites, selected_ammo):
+def draw_ammo_hud(screen, ammo_counts, ammo_sprites, selected_ammo, start_x=10, start_y=10):
     box_size = (80, 50)
     box_padding = 10  # Adjusted padding for consistent spacing
-    start_x = 10
-    start_y = 10
-    font = pygame.font.SysFont(None, 30)
+    font = get_sysfont(None, 30)
     shades_of_dark_brown = [(101, 67, 33), (139, 69, 19), (160, 82, 45)]
 
     for i in range(3):
@@ -214,12 +220,11 @@ def draw_ammo_hud(screen, ammo_counts, ammo_sprites, selected_ammo):
         screen.blit(sprite, sprite_rect)
 
 # Function to draw Permanent Powerup HUD on top right
-def draw_permanent_powerup_hud(screen, powerup_counts):
+def draw_permanent_powerup_hud(screen, powerup_counts, end_x=GAME_WIDTH - 10, start_y=10):
     box_size = (80, 50)
     box_padding = 10  # Adjusted padding for consistent spacing
-    font = pygame.font.SysFont(None, 30)
-    start_x = GAME_WIDTH - box_size[0] - 10
-    start_y = 10
+    font = get_sysfont(None, 30)
+    start_x = end_x - box_size[0]
     powerup_order = ["apple", "banana", "pineapple"]
 
     for i, powerup_type in enumerate(powerup_order):
@@ -239,9 +244,8 @@ def draw_permanent_powerup_hud(screen, powerup_counts):
         counter_rect = counter_text.get_rect(center=(box_rect.x + 60, box_rect.y + box_size[1] // 2))
         screen.blit(counter_text, counter_rect)
 
-def draw_bear_hud(screen, health, bear_hit_timer, hud_rect):
-    hud_width, hud_height = hud_rect.width, hud_rect.height
-
+# Function to get the bear HUD background color, which flashes yellow when the bear is hit
+def get_bear_hud_color(bear_hit_timer):
     # Create a list of yellow shades for flashing effect
     yellow_shades = [(255, 255, 0), (255, 223, 0), (255, 191, 0), (255, 159, 0)]
     num_shades = len(yellow_shades)
@@ -251,9 +255,12 @@ def draw_bear_hud(screen, health, bear_hit_timer, hud_rect):
         # Calculate the index of the shade to use
         index = int((hit_flash_duration - bear_hit_timer) / hit_flash_duration * num_shades)
         index = min(index, num_shades - 1)
-        hud_color = yellow_shades[index]
-    else:
-        hud_color = BLACK
+        return yellow_shades[index]
+    return BLACK
+
+def draw_bear_hud(screen, health, bear_hit_timer, hud_rect):
+    hud_width, hud_height = hud_rect.width, hud_rect.height
+    hud_color = get_bear_hud_color(bear_hit_timer)
 
     pygame.draw.rect(screen, hud_color, hud_rect)
     pygame.draw.rect(screen, RED, hud_rect, 2)  # Red outline
@@ -265,12 +272,11 @@ def draw_bear_hud(screen, health, bear_hit_timer, hud_rect):
 
     bear_sprite_path = os.path.join(root_dir, "art", "bear.png")
     try:
-        bear_sprite = pygame.image.load(bear_sprite_path).convert_alpha()
+        bear_sprite = load_image(bear_sprite_path, (30, 30))
     except pygame.error as e:
         print(f"Unable to load bear image at {bear_sprite_path}: {e}")
         pygame.quit()
         sys.exit()
-    bear_sprite = pygame.transform.scale(bear_sprite, (30, 30))
     screen.blit(bear_sprite, (hud_rect.x + hud_width - 40, hud_rect.y + 10))
 
 # Function to draw News Ticker
@@ -335,36 +341,8 @@ def display_swirling_effect():
         game_surface.fill(BLACK)
         game_surface.blit(scaled_surface, rect)
 
-        # Blit to display_surface with scaling if in full-screen
-        if is_fullscreen:
-            # Get current display resolution
-            display_info = pygame.display.Info()
-            display_width, display_height = display_info.current_w, display_info.current_h
-
-            # Calculate scaling while preserving aspect ratio
-            scale_x = display_width / GAME_WIDTH
-            scale_y = display_height / GAME_HEIGHT
-            scale = min(scale_x, scale_y)
-
-            # New size
-            new_width = int(GAME_WIDTH * scale)
-            new_height = int(GAME_HEIGHT * scale)
-
-            # Scale the game_surface
-            scaled_display_surface = pygame.transform.scale(game_surface, (new_width, new_height))
-
-            # Calculate position to center
-            x_pos = (display_width - new_width) // 2
-            y_pos = (display_height - new_height) // 2
-
-            # Fill display_surface
-            display_surface.fill(BLACK)
-
-            # Blit scaled_surface
-            display_surface.blit(scaled_display_surface, (x_pos, y_pos))
-        else:
-            # Blit game_surface directly to display_surface
-            display_surface.blit(game_surface, (0, 0))
+        # Scale game_surface to fit the window (letterboxed)
+        presenter.present(game_surface, display_surface)
 
         pygame.display.flip()
         clock.tick(FPS)
@@ -374,8 +352,7 @@ def display_game_over_screen():
     # Load game over background image
     gameover_background_path = os.path.join(root_dir, "art", "gameover.png")
     try:
-        gameover_background = pygame.image.load(gameover_background_path).convert_alpha()
-        gameover_background = pygame.transform.scale(gameover_background, (GAME_WIDTH, GAME_HEIGHT))
+        gameover_background = load_image(gameover_background_path, (GAME_WIDTH, GAME_HEIGHT))
     except pygame.error as e:
         print(f"Unable to load gameover background image at {gameover_background_path}: {e}")
         # If background image is essential, exit; otherwise, proceed without it
@@ -383,8 +360,8 @@ def display_game_over_screen():
 
     # Define fonts
     try:
-        font_large = pygame.font.SysFont(None, 80, bold=True)
-        font_small = pygame.font.SysFont(None, 40)
+        font_large = get_sysfont(None, 80, bold=True)
+        font_small = get_sysfont(None, 40)
     except Exception as e:
         print(f"Font initialization error: {e}")
         pygame.quit()
@@ -481,36 +458,8 @@ def display_game_over_screen():
         # Draw "PRESS ANY KEY TO RESTART" text
         game_surface.blit(press_key_surface, press_key_rect)
 
-        # Blit to display_surface with scaling if in full-screen
-        if is_fullscreen:
-            # Get current display resolution
-            display_info = pygame.display.Info()
-            display_width, display_height = display_info.current_w, display_info.current_h
-
-            # Calculate scaling while preserving aspect ratio
-            scale_x = display_width / GAME_WIDTH
-            scale_y = display_height / GAME_HEIGHT
-            scale = min(scale_x, scale_y)
-
-            # New size
-            new_width = int(GAME_WIDTH * scale)
-            new_height = int(GAME_HEIGHT * scale)
-
-            # Scale the game_surface
-            scaled_surface = pygame.transform.scale(game_surface, (new_width, new_height))
-
-            # Calculate position to center
-            x_pos = (display_width - new_width) // 2
-            y_pos = (display_height - new_height) // 2
-
-            # Fill display_surface
-            display_surface.fill(BLACK)
-
-            # Blit scaled_surface
-            display_surface.blit(scaled_surface, (x_pos, y_pos))
-        else:
-            # Blit game_surface directly to display_surface
-            display_surface.blit(game_surface, (0, 0))
+        # Scale game_surface to fit the window (letterboxed)
+        presenter.present(game_surface, display_surface)
 
         # Update the display
         pygame.display.flip()
@@ -521,8 +470,7 @@ def display_level1_complete_screen():
     # Load level 1 complete assets
     level1complete_image_path = os.path.join(root_dir, "art", "L1C.png")
     try:
-        level1complete_image = pygame.image.load(level1complete_image_path).convert_alpha()
-        level1complete_image = pygame.transform.scale(level1complete_image, (GAME_WIDTH, GAME_HEIGHT))
+        level1complete_image = load_image(level1complete_image_path, (GAME_WIDTH, GAME_HEIGHT))
     except pygame.error as e:
         print(f"Unable to load Level 1 Complete image at {level1complete_image_path}: {e}")
         pygame.quit()
@@ -538,8 +486,8 @@ def display_level1_complete_screen():
         print(f"Unable to load or play music at {track8_path}: {e}")
         # Proceed without music if not essential
 
-    font_large = pygame.font.SysFont(None, 50, bold=True)
-    font_small = pygame.font.SysFont(None, 40)
+    font_large = get_sysfont(None, 50, bold=True)
+    font_small = get_sysfont(None, 40)
     text_message = "CONGRATULATIONS! LEVEL 1 COMPLETE"
     press_key_message = "PRESS ANY KEY TO CONTINUE"
 
@@ -607,78 +555,59 @@ def display_level1_complete_screen():
         game_surface.blit(text_surface, text_rect)
         game_surface.blit(press_key_surface, press_key_rect)
 
-        # Blit to display_surface with scaling if in full-screen
-        if is_fullscreen:
-            # Get current display resolution
-            display_info = pygame.display.Info()
-            display_width, display_height = display_info.current_w, display_info.current_h
-
-            # Calculate scaling while preserving aspect ratio
-            scale_x = display_width / GAME_WIDTH
-            scale_y = display_height / GAME_HEIGHT
-            scale = min(scale_x, scale_y)
-
-            # New size
-            new_width = int(GAME_WIDTH * scale)
-            new_height = int(GAME_HEIGHT * scale)
-
-            # Scale the game_surface
-            scaled_surface = pygame.transform.scale(game_surface, (new_width, new_height))
-
-            # Calculate position to center
-            x_pos = (display_width - new_width) // 2
-            y_pos = (display_height - new_height) // 2
-
-            # Fill display_surface
-            display_surface.fill(BLACK)
-
-            # Blit scaled_surface
-            display_surface.blit(scaled_surface, (x_pos, y_pos))
-        else:
-            # Blit game_surface directly to display_surface
-            display_surface.blit(game_surface, (0, 0))
+        # Scale game_surface to fit the window (letterboxed)
+        presenter.present(game_surface, display_surface)
 
         # Update the display
         pygame.display.flip()
         clock.tick(FPS)
 
 # Function to get adjusted mouse position
-def get_game_surface_mouse_pos():
-    mouse_x, mouse_y = pygame.mouse.get_pos()
-
-    if is_fullscreen:
-        # Get current display resolution
-        display_info = pygame.display.Info()
-        display_width, display_height = display_info.current_w, display_info.current_h
-
-        # Calculate scaling while preserving aspect ratio
-        scale_x = display_width / GAME_WIDTH
-        scale_y = display_height / GAME_HEIGHT
-        scale = min(scale_x, scale_y)
-
-        # New size
-        new_width = int(GAME_WIDTH * scale)
-        new_height = int(GAME_HEIGHT * scale)
-
-        # Calculate position to center
-        x_pos = (display_width - new_width) // 2
-        y_pos = (display_height - new_height) // 2
-
-        # Adjust mouse position
-        adjusted_x = (mouse_x - x_pos) / scale
-        adjusted_y = (mouse_y - y_pos) / scale
-
-        # Ensure the adjusted coordinates are within game_surface bounds
-        adjusted_x = max(0, min(adjusted_x, GAME_WIDTH))
-        adjusted_y = max(0, min(adjusted_y, GAME_HEIGHT))
-
-        return adjusted_x, adjusted_y
-    else:
-        # Mouse coordinates are already in game_surface coordinates
-        return mouse_x, mouse_y
+def get_game_surface_mouse_pos(pos=None):
+    # Undo the window scaling and letterbox
+    return presenter.to_game(pos or pygame.mouse.get_pos())
+
+# Function to sum up the simulated state for comparing a replay with its recording
+def get_state_checksum(player, ammo_counts, powerup_counts, rabbits, foxes, bear, fired_ammo, powerups):
+    values = [player.y, player.cooldown, *ammo_counts, *powerup_counts.values()]
+    for creature in rabbits + foxes + ([bear] if bear else []):
+        values += [creature.x, creature.y]
+    if bear:
+        values.append(bear.health)
+    for ammo in fired_ammo:
+        values += [ammo.x, ammo.y]
+    for powerup in powerups:
+        values += [powerup.rect.x, powerup.rect.y]
+    return state_checksum(values)
 
 # Function to start the level
 def start_level():
+    if display_surface is None:
+        open_display()
+
+    # Decode everything the level draws up front so spawns never touch the disk
+    try:
+        cache.load_manifest("level1")
+    except (pygame.error, OSError) as e:
+        print(f"Unable to preload level 1 assets: {e}")
+        pygame.quit()
+        sys.exit()
+    sound_bank.load(level_sounds["level1"])
+
+    # Sprites left over from a previous attempt go back to their pools
+    for pool in (rabbit_pool, fox_pool, bear_pool, powerup_pool):
+        pool.release_all()
+
+    # Where spawned creatures come from
+    store = None
+    spawn_pools = {"rabbit": rabbit_pool, "fox": fox_pool, "bear": bear_pool}
+    if vectorized_creatures:
+        if creature_store.numpy is not None:
+            store = creature_store.CreatureStore()
+            spawn_pools = {"rabbit": store.pool(Rabbit, "rabbit"), "fox": store.pool(Fox, "fox"), "bear": store.pool(Bear, "bear")}
+        else:
+            print("NumPy is not installed; creatures are updated one by one.")
+
     # Stop current music and play track2.mp3
     track2_path = os.path.join(root_dir, "sound", "track2.mp3")
     try:
@@ -691,13 +620,22 @@ def start_level():
 
     background_image_path = os.path.join(root_dir, "art", "background1.png")
     try:
-        background_image = pygame.image.load(background_image_path).convert_alpha()
-        background_image = pygame.transform.scale(background_image, (GAME_WIDTH, GAME_HEIGHT))
+        background_image = load_image(background_image_path, (GAME_WIDTH, GAME_HEIGHT))
     except pygame.error as e:
         print(f"Unable to load background image at {background_image_path}: {e}")
         pygame.quit()
         sys.exit()
 
+    # Brown fill and background image, composited once
+    static_layer = build_static_layer((GAME_WIDTH, GAME_HEIGHT), (139, 69, 19), [(background_image, (0, 0))])
+
+    # Bushes drawn in front of the creatures
+    bush_overlay = BushOverlay(static_layer)
+
+    renderer = None
+    if dirty_rendering:
+        renderer = DirtyRenderer(game_surface, static_layer)
+
     player_image_path = os.path.join(root_dir, "art", "player1.png")
     try:
         player = Player(40, player_image_path)
@@ -709,35 +647,33 @@ def start_level():
     # Initialize Ammo
     carrot_image_path = os.path.join(root_dir, "art", "carrot.png")
     try:
-        carrot_image = pygame.image.load(carrot_image_path).convert_alpha()
+        carrot_image = load_image(carrot_image_path, (25, 25))
     except pygame.error as e:
         print(f"Unable to load carrot image at {carrot_image_path}: {e}")
         pygame.quit()
         sys.exit()
-    carrot_image = pygame.transform.scale(carrot_image, (25, 25))
 
     berry_image_path = os.path.join(root_dir, "art", "berry.png")
     try:
-        berry_image = pygame.image.load(berry_image_path).convert_alpha()
+        berry_image = load_image(berry_image_path, (25, 25))
     except pygame.error as e:
         print(f"Unable to load berry image at {berry_image_path}: {e}")
         pygame.quit()
         sys.exit()
-    berry_image = pygame.transform.scale(berry_image, (25, 25))
 
     honey_image_path = os.path.join(root_dir, "art", "honey.png")
     try:
-        honey_image = pygame.image.load(honey_image_path).convert_alpha()
+        honey_image = load_image(honey_image_path, (25, 25))
     except pygame.error as e:
         print(f"Unable to load honey image at {honey_image_path}: {e}")
         pygame.quit()
         sys.exit()
-    honey_image = pygame.transform.scale(honey_image, (25, 25))
 
     ammo_counts = [5, 5, 0]  # Initial ammo counts for carrot, berry, and honey
     ammo_sprites = [carrot_image, berry_image, honey_image]
     selected_ammo = 0
-    fired_ammo = []
+    ammo_index = AmmoIndex()  # Where the shots in fired_ammo are, for collision tests
+    fired_ammo = ProjectileBuffer(64, game_surface.get_rect(), Ammo, ammo_index)
     last_fire_time = 0
     rabbit_spawn_timer = 0.75  # Halved to double the spawn rate
     max_rabbits = 10  # Increased to allow up to 10 rabbits on screen
@@ -750,15 +686,7 @@ def start_level():
     bear_hit_timer = 0  # Timer for HUD flash effect on hit
     
 
-    bushes = [
-        pygame.Rect(0, 113, GAME_WIDTH, 37),
-        pygame.Rect(0, 256, GAME_WIDTH, 37),
-        pygame.Rect(0, 393, GAME_WIDTH, 37),
-        pygame.Rect(0, 543, GAME_WIDTH, 37)
-    ]
-
-    rabbit_spawn_positions = [90, 235, 370, 520]
-    fox_spawn_positions = [113, 256, 393, 543]
+    rabbit_spawn_positions = RABBIT_Y
 
     powerups = pygame.sprite.Group()
     active_powerups = pygame.sprite.Group()
@@ -766,7 +694,7 @@ def start_level():
     powerup_counts = {"apple": 0, "banana": 0, "pineapple": 0}
 
     # Initialize font for the news ticker
-    ticker_font = pygame.font.SysFont("Arial", 24, bold=True)
+    ticker_font = get_sysfont("Arial", 24, bold=True)
     ticker_color = RED  # Mechanical red letters
 
     # Define the HUD rectangle (where the bear HUD appears)
@@ -778,6 +706,22 @@ def start_level():
     hud_y = 10
     hud_rect = pygame.Rect(hud_x, hud_y, hud_width, hud_height)
 
+    # HUD panels, redrawn only when what they show changes
+    powerup_order = ["apple", "banana", "pineapple"]
+    hud = HUD({
+        "ammo": Panel((10, 10, left_hud_x - 20, 50),
+                      lambda surface, counts, selected: draw_ammo_hud(surface, counts, ammo_sprites, selected, 0, 0)),
+        "powerups": Panel((right_hud_x + 10, 10, GAME_WIDTH - 20 - right_hud_x, 50),
+                          lambda surface, counts: draw_permanent_powerup_hud(surface, counts, GAME_WIDTH - 20 - right_hud_x, 0)),
+        "bear": Panel(hud_rect,
+                      lambda surface, health, hit_timer: draw_bear_hud(surface, health, hit_timer, surface.get_rect())),
+    })
+    hud.show("bear", False)
+
+    # Start at the quality the governor has settled on
+    hud.set_refresh_interval(governor.tier.hud_refresh_interval)
+    presenter.smooth = smooth_scaling and governor.tier.smooth_scaling
+
     # Scrolling speed for the news ticker
     ticker_scroll_speed = 2
 
@@ -785,15 +729,49 @@ def start_level():
     clock_dropped = False
 
     # Initialize bear spawn timer
-    bear_spawn_timer = 30.0  # Initial timer set to 30 seconds (adjust as needed)
+    bear_spawn_timer = bear_spawn_interval
+
+    # The simulation runs in fixed ticks; frames draw the latest state in between
+    timestep = FixedTimestep(tick_rate)
+    dt = timestep.step  # Seconds per tick
+    tick = 0  # Ticks this attempt has run
+
+    # Input comes from the player at the window, or from whatever autoplay plays in their place
+    if autoplay:
+        input_source = autoplay  # It seeds the random streams once for the whole run
+    else:
+        streams.reseed()  # Fresh dice for every attempt
+        input_source = LiveInput(get_game_surface_mouse_pos)
+
+    # Write the attempt down for replay.py
+    recorder = None
+    if record_input and not autoplay:
+        recording = Recording("level1", streams.seed, {"tick_rate": tick_rate, "vectorized_creatures": vectorized_creatures})
+        recorder = input_source = InputRecorder(input_source, recording, GAME_KEYS)
+        recording_path = os.path.join(root_dir, "recordings", time.strftime("level1-%Y%m%d-%H%M%S.json"))
+        os.makedirs(os.path.dirname(recording_path), exist_ok=True)
+
+    if autoplay:
+        autoplay.begin_attempt({"ammo_counts": ammo_counts, "powerup_counts": powerup_counts})
 
     # Main game loop
     running = True
     while running:
-        dt = clock.tick(FPS) / 1000  # Delta time in seconds
+        if autoplay:
+            # No frame cap: every frame is exactly one tick, run as fast as the machine goes
+            if autoplay.finished:
+                return
+            frame_time = timestep.step
+        else:
+            frame_time = clock.tick(FPS) / 1000  # Seconds since the last frame
+            if governor.record(clock.get_rawtime()):  # Step the quality down (or back up) to hold the frame rate
+                hud.set_refresh_interval(governor.tier.hud_refresh_interval)
+                presenter.smooth = smooth_scaling and governor.tier.smooth_scaling
 
-        for event in pygame.event.get():
+        for event in input_source.events(tick):
             if event.type == pygame.QUIT:
+                if recorder:
+                    recorder.save(recording_path, tick)
                 pygame.quit()
                 sys.exit()
             elif event.type == pygame.KEYDOWN:
@@ -815,15 +793,13 @@ def start_level():
                     # Fire only if there’s sufficient ammo for the selected type and cooldown is not active
                     if (ammo_counts[selected_ammo] > 0 or selected_ammo == 0) and player.cooldown <= 0:
                         ammo_speed = 2 if powerup_counts["banana"] <= 0 else 6
-                        is_berry = selected_ammo == 1  # Index 1 corresponds to berries
+                        ammo_type = AMMO_TYPES[selected_ammo]
                         if powerup_counts["pineapple"] > 0:
                             angles = [0, 45, -45]
                             for angle in angles:
-                                ammo = Ammo(player.x + 60, player.y + 20, ammo_sprites[selected_ammo], bushes, is_berry=is_berry, speed=ammo_speed, angle=angle)
-                                fired_ammo.append(ammo)
+                                fired_ammo.fire(player.x + 60, player.y + 20, ammo_sprites[selected_ammo], ammo_type, speed=ammo_speed, angle=angle)
                         else:
-                            ammo = Ammo(player.x + 60, player.y + 20, ammo_sprites[selected_ammo], bushes, is_berry=is_berry, speed=ammo_speed)
-                            fired_ammo.append(ammo)
+                            fired_ammo.fire(player.x + 60, player.y + 20, ammo_sprites[selected_ammo], ammo_type, speed=ammo_speed)
                         player.throw_ammo()
                         if selected_ammo != 0:
                             ammo_counts[selected_ammo] -= 1
@@ -834,9 +810,11 @@ def start_level():
             elif event.type == pygame.USEREVENT + 1:
                 player.reset_sprite()
                 pygame.time.set_timer(pygame.USEREVENT + 1, 0)
+            elif event.type == pygame.WINDOWEXPOSED and renderer:
+                renderer.invalidate()  # The window contents were lost
             elif event.type == pygame.MOUSEBUTTONDOWN:
-                # Use adjusted mouse position for accurate collision detection
-                mouse_pos = get_game_surface_mouse_pos()
+                # The input source already turned the position into game surface coordinates
+                mouse_pos = event.pos
                 # Check for clock sprite clicks
                 for clock_sprite in clocks:
                     if clock_sprite.rect.collidepoint(mouse_pos):
@@ -846,6 +824,13 @@ def start_level():
                         # Stop the music
                         pygame.mixer.music.stop()
 
+                        if recorder:
+                            recorder.save(recording_path, tick + 1)  # The winning click came with this tick's events
+                        if autoplay:
+                            autoplay.tick += 1  # The tick the click came with counts as run
+                            autoplay.completions += 1
+                            return  # The run carries on with a new attempt
+
                         # Display swirling effect
                         display_swirling_effect()
 
@@ -868,258 +853,282 @@ def start_level():
 
         # Only update game state if running
         if running:
-            # Handle Powerup durations and effects
-            for powerup_type in powerup_counts:
-                if powerup_counts[powerup_type] > 0:
-                    powerup_counts[powerup_type] -= dt
-                    if powerup_type == "apple" and powerup_counts["apple"] > 0:
-                        for powerup in powerups:
-                            direction_x = player.x - powerup.rect.x
-                            direction_y = player.y - powerup.rect.y
-                            distance = math.sqrt(direction_x**2 + direction_y**2)
-                            if distance > 0:
-                                move_x = (direction_x / distance) * 5
-                                move_y = (direction_y / distance) * 5
-                                powerup.rect.x += move_x
-                                powerup.rect.y += move_y
-                            if powerup.rect.colliderect(player.rect):
-                                if powerup.type == "berry":
-                                    ammo_counts[1] += 5
-                                elif powerup.type == "honey":
-                                    ammo_counts[2] += 1
-                                else:
-                                    powerup_counts[powerup.type] += 5
-                                powerup.kill()
-
-            # Render game elements onto game_surface
-            game_surface.fill((139, 69, 19))  # Fill with brown color (background)
-            game_surface.blit(background_image, (0, 0))  # Draw background image
-            player.draw(game_surface)
-
-            # Handle Rabbit Spawning
-            if rabbit_spawn_timer <= 0 and len(rabbits) < max_rabbits:
-                rabbit_image_path = os.path.join(root_dir, "art", "rabbit.png")
-                try:
-                    new_rabbit = Rabbit(rabbit_image_path)
-                except pygame.error as e:
-                    print(f"Unable to load rabbit image at {rabbit_image_path}: {e}")
-                    pygame.quit()
-                    sys.exit()
-                chosen_y = random.choice(rabbit_spawn_positions)
-                new_rabbit.y = chosen_y
-                new_rabbit.initial_y = chosen_y
-                rabbits.append(new_rabbit)
-                rabbit_spawn_timer = 0.75  # Reset spawn timer to the new interval
-            rabbit_spawn_timer -= dt
-
-            # Handle Fox Spawning
-            if fox_spawn_timer <= 0:
-                fox_image_path = os.path.join(root_dir, "art", "fox.png")
-                try:
-                    new_fox = Fox(fox_image_path, random.choice(['upper', 'middle', 'lower', 'bottom']))
-                except pygame.error as e:
-                    print(f"Unable to load fox image at {fox_image_path}: {e}")
-                    pygame.quit()
-                    sys.exit()
-                foxes.append(new_fox)
-                fox_spawn_timer = 0.75  # Reset spawn timer
-            fox_spawn_timer -= dt
-
-            # Modified Bear Spawning Logic
-            if not bear_spawned:
-                bear_spawn_timer -= dt
-                if bear_spawn_timer <= 0:
-                    honey_count = ammo_counts[2]  # Use the current honey ammo count
-                    spawn_chance = min(honey_count * 20, 100)  # 20% per honey, up to 100%
-
-                    # Generate a random number to determine if the bear spawns
-                    random_number = random.randint(1, 100)
-                    print(f"Bear spawn attempt: Spawn chance = {spawn_chance}%, Random number = {random_number}")
-
-                    if random_number <= spawn_chance:
-                        bear_image_path = os.path.join(root_dir, "art", "bear.png")
-                        try:
-                            bear = Bear(bear_image_path, random.choice(['upper', 'middle', 'lower', 'bottom']))
-                        except pygame.error as e:
-                            print(f"Unable to load bear image at {bear_image_path}: {e}")
-                            pygame.quit()
-                            sys.exit()
-                        bear_spawned = True
-                        pygame.mixer.music.stop()
-                        track6_path = os.path.join(root_dir, "sound", "track6.mp3")
-                        try:
-                            pygame.mixer.music.load(track6_path)
-                            pygame.mixer.music.play(-1)
-                        except pygame.error as e:
-                            print(f"Unable to load or play music at {track6_path}: {e}")
-                            pygame.quit()
-                            sys.exit()
-                    else:
-                        print("Bear did not spawn this attempt.")
-
-                    # Reset the bear spawn timer for the next attempt
-                    bear_spawn_timer = 30.0  # Set to 30 seconds
-
-            if bear_spawned:
-                bear.update(dt)
-                bear.draw(game_surface, bushes)
-                draw_bear_hud(game_surface, bear.health, bear_hit_timer, hud_rect)
-                bear_health = bear.health
-
-                if bear_hit_timer > 0:
-                    bear_hit_timer -= dt
-
-                # Check if bear reaches or passes the player's x-coordinate for game over
-                if bear.rect.x <= player.rect.x:
-                    # Display game over screen
-                    running = False  # Exit the game loop
-                    pygame.time.wait(1000)  # Freeze for 1 second
-                    display_game_over_screen()  # Call the game over screen function
-                    return  # Exit the function after game over
-
-                # Check if bear's health has reached 0
-                if bear_health <= 0 and not clock_dropped:
-                    # Stop bear-related music and resume track2.mp3
-                    pygame.mixer.music.stop()
+            # Catch the simulation up with the time that passed, in fixed ticks
+            for _ in range(timestep.advance(frame_time)):
+                # Handle Powerup durations and effects
+                for powerup_type in powerup_counts:
+                    if powerup_counts[powerup_type] > 0:
+                        powerup_counts[powerup_type] -= dt
+                        if powerup_type == "apple" and powerup_counts["apple"] > 0:
+                            for powerup in powerups:
+                                direction_x = player.x - powerup.rect.x
+                                direction_y = player.y - powerup.rect.y
+                                distance = math.sqrt(direction_x**2 + direction_y**2)
+                                if distance > 0:
+                                    move_x = (direction_x / distance) * 5 * dt * REFERENCE_RATE
+                                    move_y = (direction_y / distance) * 5 * dt * REFERENCE_RATE
+                                    powerup.rect.x += move_x
+                                    powerup.rect.y += move_y
+                                if powerup.rect.colliderect(player.rect):
+                                    if powerup.type == "berry":
+                                        ammo_counts[1] += 5
+                                    elif powerup.type == "honey":
+                                        ammo_counts[2] += 1
+                                    else:
+                                        powerup_counts[powerup.type] += 5
+                                    powerup.kill()
+
+                # Handle Rabbit Spawning
+                if rabbit_spawn_timer <= 0 and len(rabbits) < max_rabbits:
+                    rabbit_image_path = os.path.join(root_dir, "art", "rabbit.png")
                     try:
-                        track2_path = os.path.join(root_dir, "sound", "track2.mp3")
-                        pygame.mixer.music.load(track2_path)
-                        pygame.mixer.music.play(-1)
+                        new_rabbit = spawn_pools["rabbit"].acquire(rabbit_image_path)
                     except pygame.error as e:
-                        print(f"Unable to load or play music at {track2_path}: {e}")
+                        print(f"Unable to load rabbit image at {rabbit_image_path}: {e}")
                         pygame.quit()
                         sys.exit()
-
-                    # Remove bear HUD by resetting bear_spawned and hiding bear HUD
-                    bear_spawned = False
-
-                    # Drop the clock sprite at bear's last position
-                    clock_sprite = ClockSprite(bear.rect.x, bear.rect.y)
-                    clocks.add(clock_sprite)
-
-                    clock_dropped = True  # Ensure clock is dropped only once
-
-                # Decrease bear_hit_timer
-                if bear_hit_timer > 0:
-                    bear_hit_timer -= dt
-            else:
-                # Draw the news ticker when the bear HUD is not active and game is not complete
-                if not clock_dropped:
-                    draw_news_ticker(game_surface, news_headlines, ticker_font, ticker_color, hud_rect, scroll_speed=ticker_scroll_speed)
-
-            # Update and draw Rabbits
-            for rabbit in rabbits[:]:
-                rabbit.update(dt)
-                rabbit.draw(game_surface, bushes)
-                if not rabbit.fed:  # Only check collision if rabbit is not fed
-                    for ammo in fired_ammo[:]:
-                        # Only process collision if the ammo is not honey
-                        if selected_ammo == 0 and hasattr(rabbit, 'check_ammo_type') and rabbit.check_ammo_type("carrot") and ammo.rect.colliderect(rabbit.rect):
-                            rabbit.on_hit()
+                    chosen_y = streams.spawns.choice(rabbit_spawn_positions)
+                    new_rabbit.y = chosen_y
+                    new_rabbit.initial_y = chosen_y
+                    new_rabbit.remember_position()
+                    rabbits.append(new_rabbit)
+                    rabbit_spawn_timer = 0.75  # Reset spawn timer to the new interval
+                rabbit_spawn_timer -= dt
+
+                # Handle Fox Spawning
+                if fox_spawn_timer <= 0:
+                    fox_image_path = os.path.join(root_dir, "art", "fox.png")
+                    try:
+                        new_fox = spawn_pools["fox"].acquire(fox_image_path, streams.spawns.choice(LANE_NAMES))
+                    except pygame.error as e:
+                        print(f"Unable to load fox image at {fox_image_path}: {e}")
+                        pygame.quit()
+                        sys.exit()
+                    foxes.append(new_fox)
+                    fox_spawn_timer = 0.75  # Reset spawn timer
+                fox_spawn_timer -= dt
+
+                # Modified Bear Spawning Logic
+                if not bear_spawned:
+                    bear_spawn_timer -= dt
+                    if bear_spawn_timer <= 0:
+                        honey_count = ammo_counts[2]  # Use the current honey ammo count
+                        spawn_chance = min(honey_count * 20, 100)  # 20% per honey, up to 100%
+
+                        # Generate a random number to determine if the bear spawns
+                        random_number = streams.spawns.randint(1, 100)
+                        print(f"Bear spawn attempt: Spawn chance = {spawn_chance}%, Random number = {random_number}")
+
+                        if random_number <= spawn_chance:
+                            bear_image_path = os.path.join(root_dir, "art", "bear.png")
+                            try:
+                                bear = spawn_pools["bear"].acquire(bear_image_path, streams.spawns.choice(LANE_NAMES))
+                            except pygame.error as e:
+                                print(f"Unable to load bear image at {bear_image_path}: {e}")
+                                pygame.quit()
+                                sys.exit()
+                            bear_spawned = True
+                            pygame.mixer.music.stop()
+                            track6_path = os.path.join(root_dir, "sound", "track6.mp3")
+                            try:
+                                pygame.mixer.music.load(track6_path)
+                                pygame.mixer.music.play(-1)
+                            except pygame.error as e:
+                                print(f"Unable to load or play music at {track6_path}: {e}")
+                                # Proceed without music if not essential
+                        else:
+                            print("Bear did not spawn this attempt.")
+
+                        # Reset the bear spawn timer for the next attempt
+                        bear_spawn_timer = bear_spawn_interval
+
+                # With the creature store every creature moves here, in one step, and their own update() does nothing
+                if store is not None:
+                    store.step(dt)
+
+                if bear_spawned:
+                    bear.update(dt)
+                    bear_health = bear.health
+
+                    if bear_hit_timer > 0:
+                        bear_hit_timer -= dt
+
+                    # Check if bear reaches or passes the player's x-coordinate for game over
+                    if bear.rect.x <= player.rect.x:
+                        # Display game over screen
+                        running = False  # Exit the game loop
+                        if recorder:
+                            recorder.save(recording_path, tick + 1)  # The attempt ended in the middle of this tick
+                        if autoplay:
+                            autoplay.tick += 1  # This tick was run, if not to the end
+                            autoplay.game_overs += 1
+                            return  # The run carries on with a new attempt
+                        pygame.time.wait(1000)  # Freeze for 1 second
+                        display_game_over_screen()  # Call the game over screen function
+                        return  # Exit the function after game over
+
+                    # Check if bear's health has reached 0
+                    if bear_health <= 0 and not clock_dropped:
+                        # Stop bear-related music and resume track2.mp3
+                        pygame.mixer.music.stop()
+                        try:
+                            track2_path = os.path.join(root_dir, "sound", "track2.mp3")
+                            pygame.mixer.music.load(track2_path)
+                            pygame.mixer.music.play(-1)
+                        except pygame.error as e:
+                            print(f"Unable to load or play music at {track2_path}: {e}")
+                            # Proceed without music if not essential
+
+                        # Remove bear HUD by resetting bear_spawned and hiding bear HUD
+                        bear_spawned = False
+                        hud.show("bear", False)
+
+                        # Drop the clock sprite at bear's last position
+                        clock_sprite = ClockSprite(bear.rect.x, bear.rect.y)
+                        clocks.add(clock_sprite)
+
+                        clock_dropped = True  # Ensure clock is dropped only once
+                        spawn_pools["bear"].release(bear)
+
+                    # Decrease bear_hit_timer
+                    if bear_hit_timer > 0:
+                        bear_hit_timer -= dt
+
+                # Update Rabbits, keeping the ones still on screen in place
+                kept = 0
+                for rabbit in rabbits:
+                    rabbit.update(dt)
+                    if not rabbit.fed:  # Only check collision if rabbit is not fed
+                        # Only carrots hit rabbits
+                        ammo = ammo_index.first_hit(rabbit.rect, "rabbit")
+                        if ammo:
+                            # on_hit rolls a drop of its own that the level never shows; hand it straight back
+                            powerup_pool.release(rabbit.on_hit())
                             powerup = rabbit.drop_powerup()
                             if powerup:
                                 powerups.add(powerup)
-                            fired_ammo.remove(ammo)
-                            break
-                if rabbit.x < -40 or rabbit.x > GAME_WIDTH + 40:
-                    rabbits.remove(rabbit)
-
-            # Update and draw Foxes
-            for fox in foxes[:]:
-                fox.update(dt)
-                fox.draw(game_surface, bushes)
-                if not fox.is_fed:  # Only check collision if fox is not fed
-                    for ammo in fired_ammo[:]:
-                        if ammo.is_berry and ammo.rect.colliderect(fox.rect):
-                            if not fox.is_hit:
-                                powerup = fox.on_hit("berry")
-                                if powerup:
-                                    powerups.add(powerup)
-                                fired_ammo.remove(ammo)
-                                break  # Exit the inner loop after handling collision
-                if fox.x < -40:
-                    foxes.remove(fox)
-
-            # Update and draw Ammo
-            for ammo in fired_ammo[:]:
-                ammo.update()
-                ammo.draw(game_surface)
-
-                # Skip collision detection if the bear is teleporting
-                if bear_spawned and ammo.rect.colliderect(bear.rect) and not bear.descending_for_teleport:
-                    if ammo.is_berry or selected_ammo == 2:  # Assuming index 2 is honey
-                        if ammo.is_berry:
-                            bear.on_hit("berry")
-                        elif selected_ammo == 2:
-                            bear.on_hit("honey")
-
-                        # Play eat3.mp3 sound when the bear is hit
-                        sound_path = os.path.join(root_dir, "sound", "eat3.mp3")
-                        try:
-                            hit_sound = pygame.mixer.Sound(sound_path)
-                            hit_sound.play()
-                        except pygame.error as e:
-                            print(f"Unable to load sound at {sound_path}: {e}")
+                            fired_ammo.kill(ammo)
+                    if -40 <= rabbit.x <= GAME_WIDTH + 40:
+                        rabbits[kept] = rabbit
+                        kept += 1
+                    else:
+                        spawn_pools["rabbit"].release(rabbit)
+                del rabbits[kept:]
+
+                # Update Foxes
+                kept = 0
+                for fox in foxes:
+                    fox.update(dt)
+                    if not fox.is_fed and not fox.is_hit:  # Only check collision if fox is not fed
+                        # Only berries hit foxes
+                        ammo = ammo_index.first_hit(fox.rect, "fox")
+                        if ammo:
+                            powerup = fox.on_hit("berry")
+                            if powerup:
+                                powerups.add(powerup)
+                            fired_ammo.kill(ammo)
+                    if fox.x >= -40:
+                        foxes[kept] = fox
+                        kept += 1
+                    else:
+                        spawn_pools["fox"].release(fox)
+                del foxes[kept:]
 
-                        # Set bear_hit_timer for HUD flash
-                        bear_hit_timer = hit_flash_duration  # Reset the hit timer
+                # Update Ammo (eaten and off-screen shots are dropped in the same pass)
+                fired_ammo.update(dt)
 
-                        fired_ammo.remove(ammo)
-                    else:
-                        fired_ammo.remove(ammo)
-                elif ammo.x > GAME_WIDTH:
-                    fired_ammo.remove(ammo)
+                if bear_spawned:
+                    for ammo in ammo_index.hits(bear.rect, "bear"):
+                        # Skip collision detection if the bear is teleporting
+                        if bear.descending_for_teleport:
+                            break
+                        if ammo.type != "carrot":  # Carrots are swallowed without doing damage
+                            powerup_pool.release(bear.on_hit(ammo.type))  # The bear's drop is never shown either
+
+                            # Play eat3.mp3 sound when the bear is hit
+                            sound_bank.play("eat3")
+
+                            # Set bear_hit_timer for HUD flash
+                            bear_hit_timer = hit_flash_duration  # Reset the hit timer
+
+                        fired_ammo.kill(ammo)
+
+                # Update Power-ups and Clock sprites
+                powerups.update(dt)
+                active_powerups.update(dt)
+                clocks.update()
+
+                # Update cooldown timer
+                if player.cooldown > 0:
+                    player.cooldown -= dt
+
+                tick += 1
+                if autoplay:
+                    autoplay.tick += 1
+                    autoplay.count_entities(rabbits=len(rabbits), foxes=len(foxes), bears=int(bear_spawned),
+                                            ammo=len(fired_ammo), powerups=len(powerups))
+                if tick % CHECKSUM_INTERVAL == 0:
+                    input_source.checksum(tick, get_state_checksum(player, ammo_counts, powerup_counts, rabbits, foxes,
+                                                                   bear if bear_spawned else None, fired_ammo, powerups))
+
+            if autoplay and not autoplay.render_frame(tick):
+                continue  # Simulation only, or fast-forwarding
+
+            # Render game elements onto game_surface, moving things drawn between their last two ticks
+            alpha = 1.0 if autoplay else timestep.alpha  # Autoplay frames end on whole ticks
+            if renderer:
+                # Only clears where something was drawn last frame, and under the HUD so its
+                # translucent pixels are never drawn over themselves
+                renderer.begin_frame(restore=[hud.rect])
+            else:
+                game_surface.blit(static_layer, (0, 0))  # Draw background
+            player.draw(game_surface)
 
-            # Update and draw Power-ups
-            powerups.update()
-            active_powerups.update()
-            powerups.draw(game_surface)
+            if bear_spawned:
+                bear.draw(game_surface, alpha)
+                hud.show("bear")
+                hud.update("bear", bear.health, bear_hit_timer, key=(bear.health, get_bear_hud_color(bear_hit_timer)))
+            elif not clock_dropped:
+                # Draw the news ticker when the bear HUD is not active and game is not complete
+                draw_news_ticker(game_surface, news_headlines, ticker_font, ticker_color, hud_rect, scroll_speed=ticker_scroll_speed)
+
+            # Draw Rabbits and Foxes
+            for rabbit in rabbits:
+                rabbit.draw(game_surface, alpha)
+            for fox in foxes:
+                fox.draw(game_surface, alpha)
+
+            # Draw the bushes over the creatures
+            if renderer:
+                with game_surface.untracked():  # Only changes pixels inside the creatures' own rectangles
+                    bush_overlay.draw(game_surface)
+            else:
+                bush_overlay.draw(game_surface)
 
-            # Update and draw Clock sprites
-            clocks.update()
+            # Draw Ammo, Power-ups and Clock sprites
+            fired_ammo.draw(game_surface, alpha)
+            powerups.draw(game_surface)
             clocks.draw(game_surface)
 
             # Draw HUDs
-            draw_ammo_hud(game_surface, ammo_counts, ammo_sprites, selected_ammo)
-            draw_permanent_powerup_hud(game_surface, powerup_counts)
-
-            # Update cooldown timer
-            if player.cooldown > 0:
-                player.cooldown -= dt  # dt is the frame time
-
-            # Blit to display_surface with scaling if in full-screen
-            if is_fullscreen:
-                # Get current display resolution
-                display_info = pygame.display.Info()
-                display_width, display_height = display_info.current_w, display_info.current_h
-
-                # Calculate scaling while preserving aspect ratio
-                scale_x = display_width / GAME_WIDTH
-                scale_y = display_height / GAME_HEIGHT
-                scale = min(scale_x, scale_y)
-
-                # New size
-                new_width = int(GAME_WIDTH * scale)
-                new_height = int(GAME_HEIGHT * scale)
-
-                # Scale the game_surface
-                scaled_surface = pygame.transform.scale(game_surface, (new_width, new_height))
-
-                # Calculate position to center
-                x_pos = (display_width - new_width) // 2
-                y_pos = (display_height - new_height) // 2
-
-                # Fill display_surface
-                display_surface.fill(BLACK)
-
-                # Blit scaled_surface
-                display_surface.blit(scaled_surface, (x_pos, y_pos))
+            hud.update("ammo", tuple(ammo_counts), selected_ammo)
+            hud.update("powerups", powerup_counts,
+                       key=tuple((int(max(0, powerup_counts[powerup_type])), powerup_counts[powerup_type] > 0) for powerup_type in powerup_order))
+            if renderer and not hud.changed:
+                with game_surface.untracked():  # Same pixels as last frame over the restored background
+                    hud.draw(game_surface)
             else:
-                # Blit game_surface directly to display_surface
-                display_surface.blit(game_surface, (0, 0))
+                hud.draw(game_surface)
 
             # Update the display
-            pygame.display.flip()
+            if renderer and presenter.unscaled(display_surface):
+                renderer.present(display_surface)  # Only the areas that changed
+            else:
+                # Scale game_surface to fit the window (letterboxed)
+                presenter.present(game_surface, display_surface)
+                pygame.display.flip()
+                if renderer:
+                    renderer.skip_present()
 
 # Main game loop function
 def main():
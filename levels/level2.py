@@ -1,19 +1,27 @@
 import pygame
 import sys
-import random
 import os
 import importlib
+from assets import ROOT_DIR, cache, load_image
+import levels.manifests  # Registers the level asset manifests
+from fonts import get_sysfont
+from hud import HUD, Panel
+from renderer import build_static_layer
+from projectiles import ProjectileBuffer
 from autumn import create_leaves, update_and_draw_leaves, wind_simulator
+from quality import governor
+from rng import streams
+
+AMMO_TYPES = ["carrot", "berry", "honey"]  # In ammo selection order
+autoplay = None  # LevelRun playing the level in place of the player (see headless.py)
 
 class Player:
     def __init__(self, x, y, image_path):
         self.x = x
         self.y = y
         self.image_path = image_path
-        self.image = pygame.image.load(image_path).convert_alpha()
-        self.image = pygame.transform.scale(self.image, (60, 60))  # Adjust the size as needed
-        self.throwing_image = pygame.image.load(os.path.join("D:/Projects/FoodThrowGame2/art", "player2.png")).convert_alpha()
-        self.throwing_image = pygame.transform.scale(self.throwing_image, (60, 60))  # Adjust the size
+        self.image = load_image(image_path, (60, 60))  # Adjust the size as needed
+        self.throwing_image = load_image(os.path.join(ROOT_DIR, "art", "player2.png"), (60, 60))  # Adjust the size
 
     def draw(self, screen):
         screen.blit(self.image, (self.x, self.y))
@@ -31,35 +39,18 @@ class Player:
         pygame.time.set_timer(pygame.USEREVENT, 500)  # Reset the sprite after 0.5 seconds
 
     def reset_sprite(self):
-        self.image = pygame.image.load(self.image_path).convert_alpha()
-        self.image = pygame.transform.scale(self.image, (60, 60))
-
-
-class Ammo:
-    def __init__(self, x, y, image):
-        self.x = x
-        self.y = y
-        self.image = image
-        self.speed = 1  # Ammo movement speed
-
-    def update(self):
-        self.x += self.speed  # Move the ammo from left to right
-
-    def draw(self, screen):
-        screen.blit(self.image, (self.x, self.y))
+        self.image = load_image(self.image_path, (60, 60))
 
 
-def draw_hud(screen, ammo_counts, ammo_sprites, selected_ammo):
+def draw_hud(screen, ammo_counts, ammo_sprites, selected_ammo, start_x=10, start_y=10):
     box_size = (80, 50)  # Box dimensions (Width, Height)
     box_padding = 15
-    start_x = 10
-    start_y = 10
-    font = pygame.font.SysFont(None, 30)
+    font = get_sysfont(None, 30)
     shades_of_dark_brown = [(101, 67, 33), (139, 69, 19), (160, 82, 45)]  # Colors for selected ammo boxes
 
     for i in range(3):
         if i != selected_ammo:
-            box_color = (0, 0, 0, 0)  # Transparent for unselected boxes
+            box_color = (0, 0, 0)  # Black for unselected boxes
         else:
             box_color = shades_of_dark_brown[i]  # Brown shades for selected ammo box
 
@@ -77,18 +68,29 @@ def draw_hud(screen, ammo_counts, ammo_sprites, selected_ammo):
 
 
 def start_level():
-    root_dir = "D:/Projects/FoodThrowGame2"
+    root_dir = ROOT_DIR
     pygame.init()
     window_size = (800, 600)
     screen = pygame.display.set_mode(window_size)
     pygame.display.set_caption("Level 2")
     brown = (139, 69, 19)
     background_image_path = os.path.join(root_dir, "art", "background2.png")
-    background_image = pygame.image.load(background_image_path)
+    background_image = load_image(background_image_path, window_size)
+    static_layer = build_static_layer(window_size, brown, [(background_image, (0, 0))])
     pygame.mixer.init()
+
+    # Swap the previous level's pinned assets for ours
+    for name in list(cache.loaded_manifests):
+        cache.release_manifest(name)
+    cache.load_manifest("level2")
+
     track3_path = os.path.join(root_dir, "sound", "track3.mp3")  # Correct track3 music
-    pygame.mixer.music.load(track3_path)
-    pygame.mixer.music.play(-1)
+    try:
+        pygame.mixer.music.load(track3_path)
+        pygame.mixer.music.play(-1)
+    except pygame.error as e:
+        print(f"Unable to load or play music at {track3_path}: {e}")
+        # Proceed without music if not essential
 
     clock = pygame.time.Clock()
     FPS = 60
@@ -97,38 +99,54 @@ def start_level():
     player = Player(40, 480, player_image_path)
 
     # Load ammo images
-    carrot_image = pygame.image.load(os.path.join(root_dir, "art", "carrot.png")).convert_alpha()
-    carrot_image = pygame.transform.scale(carrot_image, (25, 25))
+    carrot_image = load_image(os.path.join(root_dir, "art", "carrot.png"), (25, 25))
 
-    berry_image = pygame.image.load(os.path.join(root_dir, "art", "berry.png")).convert_alpha()
-    berry_image = pygame.transform.scale(berry_image, (25, 25))
+    berry_image = load_image(os.path.join(root_dir, "art", "berry.png"), (25, 25))
 
-    honey_image = pygame.image.load(os.path.join(root_dir, "art", "honey.png")).convert_alpha()
-    honey_image = pygame.transform.scale(honey_image, (25, 25))
+    honey_image = load_image(os.path.join(root_dir, "art", "honey.png"), (25, 25))
 
     # Create initial leaves
-    leaves = []
+    leaves = create_leaves(root_dir, count=0)
 
     # Initialize wind variables
-    wind_timer = [random.randint(600, 900)]
+    wind_timer = [streams.weather.randint(600, 900)]
     wind_duration = [0]
-    wind_speed = [0, random.uniform(1, 2)]  # [current_speed, base_speed]
+    wind_speed = [0, streams.weather.uniform(1, 2)]  # [current_speed, base_speed]
 
     # Initialize spawn timer for individual leaves
-    spawn_timer = [random.randint(20, 100)]
+    spawn_timer = [streams.weather.randint(20, 100)]
     wind_spawn_timer = [120]
 
     # Ammo and HUD setup
     ammo_counts = [5, 5, 5]
     ammo_sprites = [carrot_image, berry_image, honey_image]
     selected_ammo = 0
-    fired_ammo = []
+    fired_ammo = ProjectileBuffer(64, screen.get_rect())
+    hud = HUD({
+        "ammo": Panel((10, 10, 3 * 80 + 2 * 15, 50),
+                      lambda surface, counts, selected: draw_hud(surface, counts, ammo_sprites, selected, 0, 0)),
+    })
+    hud.set_refresh_interval(governor.tier.hud_refresh_interval)
+
+    tick = 0  # Frames this attempt has run
+    if autoplay:
+        autoplay.begin_attempt({"ammo_counts": ammo_counts, "wind_timer": wind_timer,
+                                "wind_duration": wind_duration, "wind_speed": wind_speed})
 
     running = True
     while running:
-        clock.tick(FPS)
+        if autoplay:
+            # No frame cap, as fast as the machine goes
+            if autoplay.finished:
+                return
+            events = autoplay.events(tick)
+        else:
+            clock.tick(FPS)
+            if governor.record(clock.get_rawtime()):  # Step the quality down (or back up) to hold the frame rate
+                hud.set_refresh_interval(governor.tier.hud_refresh_interval)
+            events = pygame.event.get()
 
-        for event in pygame.event.get():
+        for event in events:
             if event.type == pygame.QUIT:
                 running = False
             elif event.type == pygame.KEYDOWN:
@@ -142,8 +160,7 @@ def start_level():
                     selected_ammo = (selected_ammo + 1) % 3
                 elif event.key == pygame.K_SPACE and ammo_counts[selected_ammo] > 0:
                     ammo_image = ammo_sprites[selected_ammo]
-                    ammo = Ammo(player.x + 60, player.y + 20, ammo_image)
-                    fired_ammo.append(ammo)
+                    fired_ammo.fire(player.x + 60, player.y + 20, ammo_image, AMMO_TYPES[selected_ammo], speed=1)
                     player.throw_ammo()
                     ammo_counts[selected_ammo] -= 1
                 elif event.key == pygame.K_x:
@@ -158,19 +175,27 @@ def start_level():
         # Determine if the wind is blowing and update wind speed
         wind_is_blowing = wind_simulator(wind_timer, wind_duration, wind_speed)
 
-        screen.fill(brown)
-        screen.blit(background_image, (0, 0))
+        screen.blit(static_layer, (0, 0))  # Brown fill and background in one copy
         player.draw(screen)
 
-        for ammo in fired_ammo:
-            ammo.update()
-            ammo.draw(screen)
+        # Move the shots, dropping the ones that left the screen, and draw them
+        fired_ammo.update()
+        fired_ammo.draw(screen)
 
         # Update and draw leaves
-        update_and_draw_leaves(screen, leaves, root_dir, spawn_timer, wind_is_blowing, wind_speed[0], wind_spawn_timer)
+        update_and_draw_leaves(screen, leaves, root_dir, spawn_timer, wind_is_blowing, wind_speed[0], wind_spawn_timer,
+                               governor.tier.weather_density, governor.tier.leaf_rotation)
 
         # Draw the HUD and ammo selection (matching Level 1 HUD)
-        draw_hud(screen, ammo_counts, ammo_sprites, selected_ammo)
+        hud.update("ammo", tuple(ammo_counts), selected_ammo)
+        hud.draw(screen)
+
+        tick += 1
+        if autoplay:
+            autoplay.tick += 1
+            autoplay.count_entities(leaves=len(leaves), ammo=len(fired_ammo))
+            if not autoplay.render_frame(tick):
+                continue  # Drawn, but not shown
 
         pygame.display.flip()
 
@@ -0,0 +1,67 @@
+# manifests.py
+#
+# The images (at the size they are drawn) and sound effects each level needs. Kept apart
+# from the level modules, which open a window when imported, so the menu can start
+# decoding a level's assets in the background before the level itself is imported.
+
+import os
+from assets import ROOT_DIR, cache
+
+root_dir = ROOT_DIR
+art_dir = os.path.join(root_dir, "art")
+sound_dir = os.path.join(root_dir, "sound")
+
+level_images = {
+    "level1": [
+        (os.path.join(art_dir, "background1.png"), (800, 600)),
+        (os.path.join(art_dir, "player1.png"), (60, 60)),
+        (os.path.join(art_dir, "player2.png"), (60, 60)),
+        (os.path.join(art_dir, "carrot.png"), (25, 25)),
+        (os.path.join(art_dir, "berry.png"), (25, 25)),
+        (os.path.join(art_dir, "honey.png"), (25, 25)),
+        (os.path.join(art_dir, "rabbit.png"), (40, 40)),
+        (os.path.join(art_dir, "fox.png"), (60, 60)),
+        (os.path.join(art_dir, "bear.png"), (60, 60)),
+        (os.path.join(art_dir, "bear.png"), (30, 30)),
+        (os.path.join(art_dir, "clock.png"), (40, 40)),
+        (os.path.join(art_dir, "apple.png"), (40, 40)),
+        (os.path.join(art_dir, "banana.png"), (40, 40)),
+        (os.path.join(art_dir, "pineapple.png"), (40, 40)),
+        (os.path.join(art_dir, "apple.png"), (50, 50)),
+        (os.path.join(art_dir, "banana.png"), (50, 50)),
+        (os.path.join(art_dir, "pineapple.png"), (50, 50)),
+        (os.path.join(art_dir, "berry.png"), (50, 50)),
+        (os.path.join(art_dir, "honey.png"), (50, 50)),
+    ],
+    "level2": [
+        (os.path.join(art_dir, "background2.png"), (800, 600)),
+        (os.path.join(art_dir, "player1.png"), (60, 60)),
+        (os.path.join(art_dir, "player2.png"), (60, 60)),
+        (os.path.join(art_dir, "carrot.png"), (25, 25)),
+        (os.path.join(art_dir, "berry.png"), (25, 25)),
+        (os.path.join(art_dir, "honey.png"), (25, 25)),
+        (os.path.join(art_dir, "leaf1.png"), (20, 20)),
+        (os.path.join(art_dir, "leaf2.png"), (20, 20)),
+    ],
+    "level3": [
+        (os.path.join(art_dir, "background3.png"), (800, 600)),
+        (os.path.join(art_dir, "player1.png"), (60, 60)),
+        (os.path.join(art_dir, "player2.png"), (60, 60)),
+        (os.path.join(art_dir, "carrot.png"), (25, 25)),
+        (os.path.join(art_dir, "berry.png"), (25, 25)),
+        (os.path.join(art_dir, "honey.png"), (25, 25)),
+    ],
+}
+
+level_sounds = {
+    "level1": {
+        "eat": os.path.join(sound_dir, "eat.mp3"),  # Rabbit eating, bear teleport
+        "eat2": os.path.join(sound_dir, "eat2.mp3"),  # Fox eating
+        "eat3": os.path.join(sound_dir, "eat3.mp3"),  # Bear hit
+    },
+    "level2": {},
+    "level3": {},
+}
+
+for name, images in level_images.items():
+    cache.register_manifest(name, images)
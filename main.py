@@ -3,6 +3,11 @@ import sys
 import importlib
 import os
 import configparser
+from assets import load_atlas, load_image, load_pack, loader
+from levels.manifests import level_sounds
+from text_cache import text_cache
+from fonts import fit_font, get_font
+from quality import governor
 
 root_dir = os.path.dirname(os.path.abspath(__file__))
 CONFIG_FILE = os.path.join(root_dir, "config.ini")
@@ -23,7 +28,13 @@ default_config = {
     },
     'Settings': {
         'fullscreen': 'False',
-        'music_on': 'True'
+        'music_on': 'True',
+        'dirty_rendering': 'False',
+        'vectorized_creatures': 'False',
+        'adaptive_quality': 'True',
+        'smooth_scaling': 'False',
+        'tick_rate': '60',
+        'record_input': 'False'
     }
 }
 
@@ -62,7 +73,7 @@ def save_config():
 def reload_settings():
     global MOVE_UP, MOVE_DOWN, SELECT_LEFT_AMMO, SELECT_RIGHT_AMMO
     global THROW_CARROT, THROW_BERRY, THROW_HONEY, THROW_SELECTED_AMMO
-    global FULLSCREEN, MUSIC_ON
+    global FULLSCREEN, MUSIC_ON, DIRTY_RENDERING, VECTORIZED_CREATURES, SMOOTH_SCALING, TICK_RATE, RECORD_INPUT
 
     MOVE_UP = config.get('KeyBindings', 'move_up').upper()
     MOVE_DOWN = config.get('KeyBindings', 'move_down').upper()
@@ -75,6 +86,14 @@ def reload_settings():
 
     FULLSCREEN = config.getboolean('Settings', 'fullscreen')
     MUSIC_ON = config.getboolean('Settings', 'music_on')
+    DIRTY_RENDERING = config.getboolean('Settings', 'dirty_rendering')
+    VECTORIZED_CREATURES = config.getboolean('Settings', 'vectorized_creatures')
+    SMOOTH_SCALING = config.getboolean('Settings', 'smooth_scaling')
+    TICK_RATE = config.getint('Settings', 'tick_rate')  # 30, 60 or 120 ticks per second
+    RECORD_INPUT = config.getboolean('Settings', 'record_input')  # For replay.py
+    governor.enabled = config.getboolean('Settings', 'adaptive_quality')
+    if not governor.enabled:
+        governor.reset()
 
 # Load and apply configurations at startup
 load_config()
@@ -95,15 +114,23 @@ else:
     screen = pygame.display.set_mode(window_size)
 pygame.display.set_caption("Food Throw Game")
 
+# Serve pre-decoded images from the build-time pack and atlas when they have been built
+load_pack()
+load_atlas()
+
 # Define FPS and create a clock instance
 FPS = 60
 clock = pygame.time.Clock()
 
+# Function to wait for the next frame, letting the quality governor see how long this one took
+def tick():
+    clock.tick(FPS)
+    governor.record(clock.get_rawtime())
+
 # Load the splash image from the art folder
 splash_image_path = os.path.join(root_dir, "art", "splash.png")
 try:
-    splash_image = pygame.image.load(splash_image_path).convert_alpha()
-    splash_image = pygame.transform.scale(splash_image, window_size)
+    splash_image = load_image(splash_image_path, window_size)
 except pygame.error as e:
     print(f"Unable to load splash image at {splash_image_path}: {e}")
     pygame.quit()
@@ -126,20 +153,17 @@ except pygame.error as e:
     pygame.quit()
     sys.exit()
 
-# Load fruit sprites
+# Load fruit sprites, scaled for better display in controls (smaller size)
 fruit_sprites = {
-    "carrot": pygame.image.load(os.path.join(root_dir, "art", "carrot.png")).convert_alpha(),
-    "berry": pygame.image.load(os.path.join(root_dir, "art", "berry.png")).convert_alpha(),
-    "honey": pygame.image.load(os.path.join(root_dir, "art", "honey.png")).convert_alpha()
+    "carrot": load_image(os.path.join(root_dir, "art", "carrot.png"), (30, 30)),
+    "berry": load_image(os.path.join(root_dir, "art", "berry.png"), (30, 30)),
+    "honey": load_image(os.path.join(root_dir, "art", "honey.png"), (30, 30))
 }
 
-# Scale fruit images for better display in controls (smaller size)
-fruit_sprites = {key: pygame.transform.scale(sprite, (30, 30)) for key, sprite in fruit_sprites.items()}
-
 # Font settings for the menu
 # Replace 'freesansbold.ttf' with your desired font file if you have a specific font
-menu_font = pygame.font.Font(pygame.font.match_font('freesansbold'), 50)  # Larger font for menu options
-controls_font = pygame.font.Font(pygame.font.match_font('freesansbold'), 24)  # Smaller font for controls
+menu_font = get_font('freesansbold', 50)  # Larger font for menu options
+controls_font = get_font('freesansbold', 24)  # Smaller font for controls
 
 # Define menu options
 menu_options = ["START GAME", "OPTIONS", "EXIT"]
@@ -195,37 +219,61 @@ def invert_color(color):
 #          Menus                #
 # ---------------------------- #
 
-# Helper function to render text with outline
-def render_text_with_outline(text, font, color, outline_color, scale_factor=1.0):
-    text_surface = font.render(text, True, color)
-    if scale_factor != 1.0:
-        text_surface = pygame.transform.scale(
-            text_surface,
-            (int(text_surface.get_width() * scale_factor), int(text_surface.get_height() * scale_factor))
-        )
-    outline_surface = font.render(text, True, outline_color)
-    if scale_factor != 1.0:
-        outline_surface = pygame.transform.scale(
-            outline_surface,
-            (int(outline_surface.get_width() * scale_factor), int(outline_surface.get_height() * scale_factor))
-        )
-    return text_surface, outline_surface
+# Helper function to render text with outline (one cached surface with the outline baked in)
+def render_text_with_outline(text, font, color, outline_color, scale_factor=1.0, outline_width=2):
+    if not governor.tier.menu_outlines:
+        outline_color = None  # Plain text at the lowest quality
+    return text_cache.render(text, font, color, outline_color, scale_factor, outline_width)
 
 # Helper function to dynamically adjust font size to fit text within a given rectangle
 def get_fitting_font(text, font_name, max_width, max_height, initial_size=24, min_size=12):
-    font_size = initial_size
-    font = pygame.font.Font(pygame.font.match_font(font_name), font_size)
-    text_surface = font.render(text, True, (255, 255, 255))
-    while (text_surface.get_width() > max_width - 10 or text_surface.get_height() > max_height - 10) and font_size > min_size:
-        font_size -= 1
-        font = pygame.font.Font(pygame.font.match_font(font_name), font_size)
-        text_surface = font.render(text, True, (255, 255, 255))
-    return font
+    # Shared fonts and a memoized binary search; see fonts.fit_font
+    return fit_font(text, font_name, max_width, max_height, initial_size, min_size)
+
+# Function to show a progress bar until a level's assets have finished loading in the background
+def display_loading_screen(job):
+    bar_rect = pygame.Rect(window_size[0] // 2 - 200, int(window_size[1] * 0.8), 400, 30)
+    loading_surface = controls_font.render("LOADING...", True, (255, 255, 255))
+    loading_rect = loading_surface.get_rect(center=(window_size[0] // 2, bar_rect.top - 25))
+
+    while not job.done():
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+
+        progress = job.poll()
+
+        screen.blit(splash_image, (0, 0))
+        screen.blit(loading_surface, loading_rect)
+        pygame.draw.rect(screen, (0, 0, 0), bar_rect)
+        pygame.draw.rect(screen, (30, 144, 255), (bar_rect.x, bar_rect.y, int(bar_rect.width * progress), bar_rect.height))
+        pygame.draw.rect(screen, (255, 255, 255), bar_rect, 2)
+
+        pygame.display.flip()
+        tick()
+
+    job.finish()
+
+# Function to start level 1 once its assets are ready
+def start_game():
+    display_loading_screen(loader.preload("level1", level_sounds["level1"]))
+    level1 = importlib.import_module('levels.level1')  # Import levels/level1.py
+    level1.dirty_rendering = DIRTY_RENDERING
+    level1.vectorized_creatures = VECTORIZED_CREATURES
+    level1.smooth_scaling = SMOOTH_SCALING
+    level1.tick_rate = TICK_RATE
+    level1.record_input = RECORD_INPUT
+    level1.start_level()  # Call the function that starts level 1
 
 # Function to display the start menu
 def display_start_menu():
     global selected_index
     running = True
+
+    # Start decoding level 1 in the background while the player is still in the menu
+    loader.preload("level1", level_sounds["level1"])
+
     flash_timer = 0
     flash_interval = 30  # Frames between color toggles
     blue_shades = [
@@ -249,8 +297,7 @@ def display_start_menu():
                 elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
                     if selected_index == 0:  # Start Game
                         try:
-                            level1 = importlib.import_module('levels.level1')  # Import levels/level1.py
-                            level1.start_level()  # Call the function that starts level 1
+                            start_game()
                         except Exception as e:
                             print(f"Error loading level1 module: {e}")
                             pygame.quit()
@@ -275,8 +322,7 @@ def display_start_menu():
                         selected_index = i
                         if selected_index == 0:  # Start Game
                             try:
-                                level1 = importlib.import_module('levels.level1')
-                                level1.start_level()
+                                start_game()
                             except Exception as e:
                                 print(f"Error loading level1 module: {e}")
                                 pygame.quit()
@@ -310,25 +356,16 @@ def display_start_menu():
                 outline_color = (0, 0, 0)  # Black outline
                 scale_factor = 1.0  # Normal size
 
-            # Render the text with outline
-            text_surface, outline_surface = render_text_with_outline(option, menu_font, color, outline_color, scale_factor)
+            # Render the text with its outline baked in
+            text_surface = render_text_with_outline(option, menu_font, color, outline_color, scale_factor)
 
             # Positioning
             text_rect = text_surface.get_rect(center=(window_size[0] // 2, window_size[1] * 0.65 + i * 60))
-
-            # Draw outline by blitting the outline_surface multiple times with slight offsets
-            for dx in [-2, 0, 2]:
-                for dy in [-2, 0, 2]:
-                    if dx != 0 or dy != 0:
-                        outline_rect = outline_surface.get_rect(center=(text_rect.centerx + dx, text_rect.centery + dy))
-                        screen.blit(outline_surface, outline_rect)
-
-            # Blit the main text on top
             screen.blit(text_surface, text_rect)
 
         # Update the display
         pygame.display.flip()
-        clock.tick(FPS)
+        tick()
 
 # Function to display the options menu
 def display_options_menu():
@@ -408,25 +445,16 @@ def display_options_menu():
                 outline_color = (0, 0, 0)  # Black outline
                 scale_factor = 1.0  # Normal size
 
-            # Render the text with outline
-            text_surface, outline_surface = render_text_with_outline(option, menu_font, color, outline_color, scale_factor)
+            # Render the text with its outline baked in
+            text_surface = render_text_with_outline(option, menu_font, color, outline_color, scale_factor)
 
             # Positioning
             text_rect = text_surface.get_rect(center=(window_size[0] // 2, window_size[1] * 0.65 + i * 60))
-
-            # Draw outline by blitting the outline_surface multiple times with slight offsets
-            for dx in [-2, 0, 2]:
-                for dy in [-2, 0, 2]:
-                    if dx != 0 or dy != 0:
-                        outline_rect = outline_surface.get_rect(center=(text_rect.centerx + dx, text_rect.centery + dy))
-                        screen.blit(outline_surface, outline_rect)
-
-            # Blit the main text on top
             screen.blit(text_surface, text_rect)
 
         # Update the display
         pygame.display.flip()
-        clock.tick(FPS)
+        tick()
 
 # Function to display controls menu
 def display_controls_menu():
@@ -506,25 +534,16 @@ def display_controls_menu():
                 outline_color = (0, 0, 0)  # Black outline
                 scale_factor = 1.0  # Normal size
 
-            # Render the text with outline
-            text_surface, outline_surface = render_text_with_outline(option, menu_font, color, outline_color, scale_factor)
+            # Render the text with its outline baked in
+            text_surface = render_text_with_outline(option, menu_font, color, outline_color, scale_factor)
 
             # Positioning
             text_rect = text_surface.get_rect(center=(window_size[0] // 2, window_size[1] * 0.65 + i * 60))
-
-            # Draw outline by blitting the outline_surface multiple times with slight offsets
-            for dx in [-2, 0, 2]:
-                for dy in [-2, 0, 2]:
-                    if dx != 0 or dy != 0:
-                        outline_rect = outline_surface.get_rect(center=(text_rect.centerx + dx, text_rect.centery + dy))
-                        screen.blit(outline_surface, outline_rect)
-
-            # Blit the main text on top
             screen.blit(text_surface, text_rect)
 
         # Update the display
         pygame.display.flip()
-        clock.tick(FPS)
+        tick()
 
 # Function to view controls
 def view_controls():
@@ -574,7 +593,7 @@ def view_controls():
 
         # Draw the title with beautiful font
         title_color = (255, 255, 255)  # White color for the title
-        title_surface = menu_font.render("KEY BINDINGS", True, title_color)
+        title_surface = text_cache.render("KEY BINDINGS", menu_font, title_color)
         title_rect = title_surface.get_rect(center=(window_size[0] // 2, box_y + 30))
         screen.blit(title_surface, title_rect)
 
@@ -613,7 +632,7 @@ def view_controls():
 
             # Adjust key text size to fit within the button
             fitting_font = get_fitting_font(key, 'freesansbold', key_rect.width, key_rect.height, initial_size=16, min_size=12)
-            key_surface = fitting_font.render(key, True, (255, 255, 255))  # White text
+            key_surface = text_cache.render(key, fitting_font, (255, 255, 255))  # White text
 
             # Center the key text inside the button
             key_text_rect = key_surface.get_rect(center=key_rect.center)
@@ -621,7 +640,7 @@ def view_controls():
 
             # Draw action text in white color next to the button
             action_color = (255, 255, 255)  # White color for actions
-            action_surface = controls_font.render(action, True, action_color)
+            action_surface = text_cache.render(action, controls_font, action_color)
             if i < 4:
                 action_rect = action_surface.get_rect(left=box_x + 100, centery=action_y)  # Close to left column box
             else:
@@ -636,7 +655,7 @@ def view_controls():
 
         # Update the display
         pygame.display.flip()
-        clock.tick(FPS)
+        tick()
 
 # Function to change keybindings menu
 def display_change_controls_menu():
@@ -742,20 +761,11 @@ def display_change_controls_menu():
                 outline_color = (0, 0, 0)  # Black outline
                 scale_factor = 1.0
 
-            # Render the text with outline
-            text_surface, outline_surface = render_text_with_outline(display_text, controls_font, current_color, outline_color, scale_factor)
+            # Render the text with its outline baked in
+            text_surface = render_text_with_outline(display_text, controls_font, current_color, outline_color, scale_factor, outline_width=1)
 
             # Positioning
             text_rect = text_surface.get_rect(center=(window_size[0] // 2, window_size[1] * 0.35 + i * 40))
-
-            # Draw outline by blitting the outline_surface multiple times with slight offsets
-            for dx in [-1, 0, 1]:
-                for dy in [-1, 0, 1]:
-                    if dx != 0 or dy != 0:
-                        outline_rect = outline_surface.get_rect(center=(text_rect.centerx + dx, text_rect.centery + dy))
-                        screen.blit(outline_surface, outline_rect)
-
-            # Blit the main text on top
             screen.blit(text_surface, text_rect)
 
         # Draw the black box for "Reset to Defaults" button
@@ -770,13 +780,13 @@ def display_change_controls_menu():
         # Render the "Reset to Defaults" button text
         reset_text = "Reset to Defaults"
         reset_text_color = (255, 255, 255)  # White color
-        reset_text_surface = controls_font.render(reset_text, True, reset_text_color)
+        reset_text_surface = text_cache.render(reset_text, controls_font, reset_text_color)
         reset_text_rect = reset_text_surface.get_rect(center=(reset_box_x + reset_box_width // 2, reset_box_y + reset_box_height // 2))
         screen.blit(reset_text_surface, reset_text_rect)
 
         # Update the display
         pygame.display.flip()
-        clock.tick(FPS)
+        tick()
 
 # Function to view controls
 def view_controls():
@@ -826,7 +836,7 @@ def view_controls():
 
         # Draw the title with beautiful font
         title_color = (255, 255, 255)  # White color for the title
-        title_surface = menu_font.render("KEY BINDINGS", True, title_color)
+        title_surface = text_cache.render("KEY BINDINGS", menu_font, title_color)
         title_rect = title_surface.get_rect(center=(window_size[0] // 2, box_y + 30))
         screen.blit(title_surface, title_rect)
 
@@ -865,7 +875,7 @@ def view_controls():
 
             # Adjust key text size to fit within the button
             fitting_font = get_fitting_font(key, 'freesansbold', key_rect.width, key_rect.height, initial_size=16, min_size=12)
-            key_surface = fitting_font.render(key, True, (255, 255, 255))  # White text
+            key_surface = text_cache.render(key, fitting_font, (255, 255, 255))  # White text
 
             # Center the key text inside the button
             key_text_rect = key_surface.get_rect(center=key_rect.center)
@@ -873,7 +883,7 @@ def view_controls():
 
             # Draw action text in white color next to the button
             action_color = (255, 255, 255)  # White color for actions
-            action_surface = controls_font.render(action, True, action_color)
+            action_surface = text_cache.render(action, controls_font, action_color)
             if i < 4:
                 action_rect = action_surface.get_rect(left=box_x + 100, centery=action_y)  # Close to left column box
             else:
@@ -888,7 +898,7 @@ def view_controls():
 
         # Update the display
         pygame.display.flip()
-        clock.tick(FPS)
+        tick()
 
 # Function to change keybindings menu with dynamic text resizing
 def display_change_controls_menu():
@@ -994,20 +1004,11 @@ def display_change_controls_menu():
                 outline_color = (0, 0, 0)  # Black outline
                 scale_factor = 1.0
 
-            # Render the text with outline
-            text_surface, outline_surface = render_text_with_outline(display_text, controls_font, current_color, outline_color, scale_factor)
+            # Render the text with its outline baked in
+            text_surface = render_text_with_outline(display_text, controls_font, current_color, outline_color, scale_factor, outline_width=1)
 
             # Positioning
             text_rect = text_surface.get_rect(center=(window_size[0] // 2, window_size[1] * 0.35 + i * 40))
-
-            # Draw outline by blitting the outline_surface multiple times with slight offsets
-            for dx in [-1, 0, 1]:
-                for dy in [-1, 0, 1]:
-                    if dx != 0 or dy != 0:
-                        outline_rect = outline_surface.get_rect(center=(text_rect.centerx + dx, text_rect.centery + dy))
-                        screen.blit(outline_surface, outline_rect)
-
-            # Blit the main text on top
             screen.blit(text_surface, text_rect)
 
         # Draw the black box for "Reset to Defaults" button
@@ -1022,13 +1023,13 @@ def display_change_controls_menu():
         # Render the "Reset to Defaults" button text
         reset_text = "Reset to Defaults"
         reset_text_color = (255, 255, 255)  # White color
-        reset_text_surface = controls_font.render(reset_text, True, reset_text_color)
+        reset_text_surface = text_cache.render(reset_text, controls_font, reset_text_color)
         reset_text_rect = reset_text_surface.get_rect(center=(reset_box_x + reset_box_width // 2, reset_box_y + reset_box_height // 2))
         screen.blit(reset_text_surface, reset_text_rect)
 
         # Update the display
         pygame.display.flip()
-        clock.tick(FPS)
+        tick()
 
 # Function to view controls
 def view_controls():
@@ -1078,7 +1079,7 @@ def view_controls():
 
         # Draw the title with beautiful font
         title_color = (255, 255, 255)  # White color for the title
-        title_surface = menu_font.render("KEY BINDINGS", True, title_color)
+        title_surface = text_cache.render("KEY BINDINGS", menu_font, title_color)
         title_rect = title_surface.get_rect(center=(window_size[0] // 2, box_y + 30))
         screen.blit(title_surface, title_rect)
 
@@ -1117,7 +1118,7 @@ def view_controls():
 
             # Adjust key text size to fit within the button
             fitting_font = get_fitting_font(key, 'freesansbold', key_rect.width, key_rect.height, initial_size=16, min_size=12)
-            key_surface = fitting_font.render(key, True, (255, 255, 255))  # White text
+            key_surface = text_cache.render(key, fitting_font, (255, 255, 255))  # White text
 
             # Center the key text inside the button
             key_text_rect = key_surface.get_rect(center=key_rect.center)
@@ -1125,7 +1126,7 @@ def view_controls():
 
             # Draw action text in white color next to the button
             action_color = (255, 255, 255)  # White color for actions
-            action_surface = controls_font.render(action, True, action_color)
+            action_surface = text_cache.render(action, controls_font, action_color)
             if i < 4:
                 action_rect = action_surface.get_rect(left=box_x + 100, centery=action_y)  # Close to left column box
             else:
@@ -1140,7 +1141,7 @@ def view_controls():
 
         # Update the display
         pygame.display.flip()
-        clock.tick(FPS)
+        tick()
 
 # Function to display change controls menu with dynamic text resizing and black box
 def display_change_controls_menu():
@@ -1246,20 +1247,11 @@ def display_change_controls_menu():
                 outline_color = (0, 0, 0)  # Black outline
                 scale_factor = 1.0
 
-            # Render the text with outline
-            text_surface, outline_surface = render_text_with_outline(display_text, controls_font, current_color, outline_color, scale_factor)
+            # Render the text with its outline baked in
+            text_surface = render_text_with_outline(display_text, controls_font, current_color, outline_color, scale_factor, outline_width=1)
 
             # Positioning
             text_rect = text_surface.get_rect(center=(window_size[0] // 2, window_size[1] * 0.35 + i * 40))
-
-            # Draw outline by blitting the outline_surface multiple times with slight offsets
-            for dx in [-1, 0, 1]:
-                for dy in [-1, 0, 1]:
-                    if dx != 0 or dy != 0:
-                        outline_rect = outline_surface.get_rect(center=(text_rect.centerx + dx, text_rect.centery + dy))
-                        screen.blit(outline_surface, outline_rect)
-
-            # Blit the main text on top
             screen.blit(text_surface, text_rect)
 
         # Draw the black box for "Reset to Defaults" button
@@ -1275,13 +1267,13 @@ def display_change_controls_menu():
         # Render the "Reset to Defaults" button text
         reset_text = "Reset to Defaults"
         reset_text_color = (255, 255, 255)  # White color
-        reset_text_surface = controls_font.render(reset_text, True, reset_text_color)
+        reset_text_surface = text_cache.render(reset_text, controls_font, reset_text_color)
         reset_text_rect = reset_text_surface.get_rect(center=(reset_box_x + reset_box_width // 2, reset_box_y + reset_box_height // 2))
         screen.blit(reset_text_surface, reset_text_rect)
 
         # Update the display
         pygame.display.flip()
-        clock.tick(FPS)
+        tick()
 
 # ---------------------------- #
 #          Main Loop           #
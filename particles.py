@@ -0,0 +1,197 @@
+# particles.py
+#
+# Particle engine behind the level 2 leaves and the level 3 snow. Uses NumPy when it is
+# installed; without it the particles are kept in plain lists and updated one by one.
+
+import math
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Per-particle values, one NumPy array (or list) each
+COLUMNS = {
+    "x": float,
+    "y": float,
+    "speed_y": float,
+    "sway_direction": float,
+    "sway_amount": float,
+    "wind_resistance": float,
+    "variant": int,
+    "frame": int,
+}
+
+
+class ParticleSystem:
+    """
+    Falling particles stored as one array per value instead of one object each, so
+    swaying, falling and wind are a few array operations per frame however many particles
+    there are, and drawing is a single blits() call.
+
+    Live particles are packed at the front of the arrays; particles that fall out of the
+    screen are swap-removed (the last live particle is moved into the hole), so removal
+    never shifts the rest.
+
+    Every particle draws one of a flat list of sprites: variant selects a group of
+    frame_count frames and frame the one within it. Particles with more than one frame
+    step to the next frame every frame they sway (the leaves spin while the wind is still).
+
+    Without NumPy the columns are lists and every method loops over the particles instead,
+    with the same results.
+
+    :param sprites: Surfaces, frame_count per variant.
+    :param offsets: (dx, dy) from a particle's position to the top left of each sprite.
+    :param frame_count: Frames per variant.
+    :param snap: Truncate positions to whole pixels before adding the offsets (where
+                 pygame.draw.circle would have put a circle).
+    :param sway_limit: How far a particle sways to each side before turning back.
+    :param capacity: Initial number of slots; the arrays grow when they run out.
+    """
+
+    def __init__(self, sprites, offsets, frame_count=1, snap=False, sway_limit=15, capacity=256):
+        self.sprites = sprites
+        self.frame_count = frame_count
+        self.snap = snap
+        self.sway_limit = sway_limit
+        self.count = 0
+        if numpy is not None:
+            self.offset_x = numpy.array([dx for dx, dy in offsets], dtype=float)
+            self.offset_y = numpy.array([dy for dx, dy in offsets], dtype=float)
+            self.columns = {name: numpy.zeros(capacity, dtype=dtype) for name, dtype in COLUMNS.items()}
+        else:
+            print("NumPy is not installed; particles are updated one by one.")
+            self.offset_x = [dx for dx, dy in offsets]
+            self.offset_y = [dy for dx, dy in offsets]
+            self.columns = {name: [dtype()] * capacity for name, dtype in COLUMNS.items()}
+
+    def __len__(self):
+        return self.count
+
+    def spawn(self, x, y, speed_y, sway_direction, wind_resistance=1.0, variant=0):
+        """Adds one particle, falling speed_y pixels per frame and swaying towards sway_direction (-1 or 1)."""
+        if self.count == len(self.columns["x"]):
+            for name, column in self.columns.items():
+                if numpy is not None:
+                    self.columns[name] = numpy.concatenate([column, numpy.zeros_like(column)])
+                else:
+                    column.extend([COLUMNS[name]()] * len(column))
+        i = self.count
+        columns = self.columns
+        columns["x"][i] = x
+        columns["y"][i] = y
+        columns["speed_y"][i] = speed_y
+        columns["sway_direction"][i] = sway_direction
+        columns["sway_amount"][i] = 0
+        columns["wind_resistance"][i] = wind_resistance
+        columns["variant"][i] = variant
+        columns["frame"][i] = 0
+        self.count += 1
+
+    def update(self, wind_is_blowing, wind_speed, spin=True):
+        """
+        Moves every particle one frame: blown by the wind, or swaying while it is still.
+
+        :param spin: Step particles with several frames to their next frame while swaying.
+        """
+        if numpy is None:
+            self.update_each(wind_is_blowing, wind_speed, spin)
+            return
+        n = self.count
+        columns = self.columns
+        x = columns["x"][:n]
+        if wind_is_blowing:
+            x += wind_speed * columns["wind_resistance"][:n]
+        else:
+            # Sway up to sway_limit pixels to each side
+            sway_direction = columns["sway_direction"][:n]
+            sway_amount = columns["sway_amount"][:n]
+            sway_amount += sway_direction
+            sway_direction[numpy.abs(sway_amount) > self.sway_limit] *= -1
+            x += sway_direction
+            if spin and self.frame_count > 1:
+                frame = columns["frame"][:n]
+                frame += 1
+                frame[frame >= self.frame_count] = 0
+        columns["y"][:n] += columns["speed_y"][:n]
+
+    def update_each(self, wind_is_blowing, wind_speed, spin):
+        """update() without NumPy, one particle at a time."""
+        columns = self.columns
+        x, y, speed_y = columns["x"], columns["y"], columns["speed_y"]
+        sway_direction, sway_amount, frame = columns["sway_direction"], columns["sway_amount"], columns["frame"]
+        wind_resistance = columns["wind_resistance"]
+        spin = spin and self.frame_count > 1
+        for i in range(self.count):
+            if wind_is_blowing:
+                x[i] += wind_speed * wind_resistance[i]
+            else:
+                sway_amount[i] += sway_direction[i]
+                if abs(sway_amount[i]) > self.sway_limit:
+                    sway_direction[i] *= -1
+                x[i] += sway_direction[i]
+                if spin:
+                    frame[i] = (frame[i] + 1) % self.frame_count
+            y[i] += speed_y[i]
+
+    def draw(self, screen):
+        if numpy is None:
+            self.draw_each(screen)
+            return
+        n = self.count
+        columns = self.columns
+        sprite_index = columns["variant"][:n] * self.frame_count + columns["frame"][:n]
+        x, y = columns["x"][:n], columns["y"][:n]
+        if self.snap:
+            x, y = numpy.trunc(x), numpy.trunc(y)
+        positions = zip((x + self.offset_x[sprite_index]).tolist(), (y + self.offset_y[sprite_index]).tolist())
+        screen.blits(list(zip(map(self.sprites.__getitem__, sprite_index.tolist()), positions)), doreturn=0)
+
+    def draw_each(self, screen):
+        """draw() without NumPy."""
+        columns = self.columns
+        blits = []
+        for i in range(self.count):
+            sprite_index = columns["variant"][i] * self.frame_count + columns["frame"][i]
+            x, y = columns["x"][i], columns["y"][i]
+            if self.snap:
+                x, y = math.trunc(x), math.trunc(y)
+            blits.append((self.sprites[sprite_index], (x + self.offset_x[sprite_index], y + self.offset_y[sprite_index])))
+        screen.blits(blits, doreturn=0)
+
+    def remove_below(self, bottom):
+        """Swap-removes every particle lower than bottom."""
+        if numpy is None:
+            self.remove_below_each(bottom)
+            return
+        n = self.count
+        y = self.columns["y"]
+        fallen = numpy.flatnonzero(y[:n] > bottom)
+        if not fallen.size:
+            return
+        kept = n - fallen.size
+        # Holes left in the part that stays are filled from the live particles past it
+        holes = fallen[fallen < kept]
+        tail = numpy.arange(kept, n)
+        movers = tail[y[kept:n] <= bottom]
+        for column in self.columns.values():
+            column[holes] = column[movers]
+        self.count = kept
+
+    def remove_below_each(self, bottom):
+        """remove_below() without NumPy, moving the same particles into the same holes."""
+        n = self.count
+        y = self.columns["y"]
+        fallen = [i for i in range(n) if y[i] > bottom]
+        if not fallen:
+            return
+        kept = n - len(fallen)
+        holes = [i for i in fallen if i < kept]
+        movers = [i for i in range(kept, n) if y[i] <= bottom]
+        for column in self.columns.values():
+            for hole, mover in zip(holes, movers):
+                column[hole] = column[mover]
+        self.count = kept
+
+    def clear(self):
+        self.count = 0
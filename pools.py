@@ -0,0 +1,66 @@
+# pools.py
+
+# Every pool by name, for reporting
+pools = {}
+
+
+class ObjectPool:
+    """
+    Recycles instances of one class instead of creating a new one for every spawn.
+
+    acquire() hands out a released instance after calling its reinit() with the same
+    arguments the constructor takes, or constructs a new one if none is free. Instances
+    go back with release(); releasing something the pool did not hand out is ignored.
+
+    Stats: hits (acquires served from the free list), misses (new instances created),
+    high_water (most instances in use at once).
+
+    :param cls: Class to pool; must have a reinit() taking the constructor's arguments.
+    :param name: Name to register the pool under (defaults to the class name).
+    """
+
+    def __init__(self, cls, name=None):
+        self.cls = cls
+        self.name = name or cls.__name__
+        self.free = []
+        self.in_use = set()
+        self.hits = 0
+        self.misses = 0
+        self.high_water = 0
+        pools[self.name] = self
+
+    def acquire(self, *args, **kwargs):
+        if self.free:
+            obj = self.free.pop()
+            obj.reinit(*args, **kwargs)
+            self.hits += 1
+        else:
+            obj = self.cls(*args, **kwargs)
+            self.misses += 1
+        self.in_use.add(obj)
+        self.high_water = max(self.high_water, len(self.in_use))
+        return obj
+
+    def release(self, obj):
+        if obj in self.in_use:
+            self.in_use.remove(obj)
+            self.free.append(obj)
+
+    def release_all(self):
+        """Takes back everything, e.g. when a level restarts and drops its sprites."""
+        self.free.extend(self.in_use)
+        self.in_use.clear()
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "high_water": self.high_water,
+            "in_use": len(self.in_use),
+            "free": len(self.free),
+        }
+
+
+# Function to get the stats of every pool
+def pool_stats():
+    return {name: pool.stats() for name, pool in pools.items()}
@@ -0,0 +1,82 @@
+# presentation.py
+
+import pygame
+
+
+class Presenter:
+    """
+    Shows the fixed-size game surface on the window, scaled to fit and letterboxed.
+
+    The letterbox (scale, offset, bars) is only worked out again when the window changes
+    size, and the scaled frame is written into a destination surface allocated once per
+    window size, so full screen and resized windows cost one scale per frame and no
+    allocations.
+
+    :param game_size: Size of the game surface.
+    :param smooth: Use smoothscale instead of nearest-neighbour scaling.
+    :param bar_color: Color of the letterbox bars.
+    """
+
+    def __init__(self, game_size, smooth=False, bar_color=(0, 0, 0)):
+        self.game_size = game_size
+        self.smooth = smooth
+        self.bar_color = bar_color
+        self.display_size = None
+        self.scale = 1
+        self.rect = pygame.Rect((0, 0), game_size)  # Where the game goes on the display
+        self.bars = []
+        self.scaled_surface = None
+
+    def layout(self, display):
+        """Recomputes the letterbox if the display changed size."""
+        display_size = display.get_size()
+        if display_size == self.display_size:
+            return
+        self.display_size = display_size
+        display_width, display_height = display_size
+        game_width, game_height = self.game_size
+
+        # Scale while preserving aspect ratio, centered
+        self.scale = min(display_width / game_width, display_height / game_height)
+        width, height = int(game_width * self.scale), int(game_height * self.scale)
+        self.rect = pygame.Rect((display_width - width) // 2, (display_height - height) // 2, width, height)
+        self.bars = [
+            pygame.Rect(0, 0, display_width, self.rect.top),
+            pygame.Rect(0, self.rect.bottom, display_width, display_height - self.rect.bottom),
+            pygame.Rect(0, self.rect.top, self.rect.left, height),
+            pygame.Rect(self.rect.right, self.rect.top, display_width - self.rect.right, height),
+        ]
+        self.bars = [bar for bar in self.bars if bar.width > 0 and bar.height > 0]
+
+        if self.rect.size == tuple(self.game_size):
+            self.scaled_surface = None
+        else:
+            self.scaled_surface = pygame.Surface(self.rect.size, 0, display)
+
+    def unscaled(self, display):
+        """True when the game surface maps 1:1 onto the display."""
+        self.layout(display)
+        return self.scaled_surface is None and self.rect.topleft == (0, 0)
+
+    def present(self, surface, display):
+        """Draws surface onto display; the caller flips or updates the display."""
+        self.layout(display)
+        for bar in self.bars:
+            display.fill(self.bar_color, bar)
+        if self.scaled_surface is None:
+            display.blit(surface, self.rect)
+            return
+        if self.smooth:
+            pygame.transform.smoothscale(surface, self.rect.size, self.scaled_surface)
+        else:
+            pygame.transform.scale(surface, self.rect.size, self.scaled_surface)
+        display.blit(self.scaled_surface, self.rect)
+
+    def to_game(self, position):
+        """Converts a position on the display to game surface coordinates."""
+        self.layout(pygame.display.get_surface())
+        game_width, game_height = self.game_size
+        x = (position[0] - self.rect.x) / self.scale
+        y = (position[1] - self.rect.y) / self.scale
+        # Keep the position within the game surface
+        return max(0, min(x, game_width)), max(0, min(y, game_height))
@@ -0,0 +1,138 @@
+# projectiles.py
+
+import math
+from timestep import REFERENCE_RATE, Interpolated
+
+
+class Projectile(Interpolated):
+    """
+    A thrown piece of food. Projectiles live in the slots of a ProjectileBuffer and are
+    reused, so everything about a shot is set in fire(), not in __init__.
+    """
+
+    def __init__(self):
+        self.alive = False
+        self.x = self.y = 0
+        self.vx = self.vy = 0
+        self.image = None
+        self.type = None
+        self.rect = None
+
+    def fire(self, x, y, image, ammo_type="carrot", speed=1, angle=0):
+        """
+        :param x: Starting x position (top left corner).
+        :param y: Starting y position.
+        :param image: Image of the shot.
+        :param ammo_type: "carrot", "berry" or "honey".
+        :param speed: Pixels per 1/60 s.
+        :param angle: Degrees above the horizontal.
+        """
+        self.x = x
+        self.y = y
+        self.image = image
+        self.type = ammo_type
+        # Velocity is worked out once per shot instead of every frame
+        angle = math.radians(angle)
+        self.vx = speed * math.cos(angle)
+        self.vy = -speed * math.sin(angle)
+        self.rect = image.get_rect(topleft=(x, y))
+        self.prev_x = self.prev_y = None
+
+    def update(self, dt=1 / REFERENCE_RATE):
+        self.remember_position()
+        self.x += self.vx * dt * REFERENCE_RATE
+        self.y += self.vy * dt * REFERENCE_RATE
+        self.rect.x = self.x
+        self.rect.y = self.y
+
+    def draw(self, screen):
+        screen.blit(self.image, (self.x, self.y))
+
+
+class ProjectileBuffer:
+    """
+    Fixed set of projectile slots shared by every throw in a level.
+
+    Shots that hit something are killed, shots that leave the bounds are dropped during
+    update, and their slots are reused by later throws, so a long session never creates
+    more than capacity projectiles. Update and draw only touch live shots. When every slot
+    is in use, the oldest shot is recycled.
+
+    Iterating over the buffer gives the live shots, oldest first.
+
+    :param capacity: Number of slots.
+    :param bounds: Rect of the play area; shots entirely past any edge of it are dropped.
+    :param projectile_class: Projectile or a subclass, used to create the slots.
+    :param index: Optional spatial index (add/move/remove) kept in sync with the live shots.
+    """
+
+    def __init__(self, capacity, bounds, projectile_class=Projectile, index=None):
+        self.bounds = bounds
+        self.index = index
+        self.slots = [projectile_class() for _ in range(capacity)]
+        self.free = list(reversed(self.slots))
+        self.live = []
+
+    def __iter__(self):
+        return iter(self.live)
+
+    def __len__(self):
+        return len(self.live)
+
+    def fire(self, *args, **kwargs):
+        """Takes a free slot and fires it; arguments are passed on to Projectile.fire."""
+        if self.free:
+            projectile = self.free.pop()
+        else:
+            projectile = self.live.pop(0)
+            if projectile.alive and self.index is not None:
+                self.index.remove(projectile)
+        projectile.fire(*args, **kwargs)
+        projectile.alive = True
+        self.live.append(projectile)
+        if self.index is not None:
+            self.index.add(projectile)
+        return projectile
+
+    def kill(self, projectile):
+        """Takes a shot out of play; its slot is freed on the next update."""
+        if projectile.alive:
+            projectile.alive = False
+            if self.index is not None:
+                self.index.remove(projectile)
+
+    def update(self, dt=1 / REFERENCE_RATE):
+        """Moves every live shot dt seconds and frees the killed and out of bounds ones, in one pass."""
+        left, top, right, bottom = self.bounds.left, self.bounds.top, self.bounds.right, self.bounds.bottom
+        index = self.index
+        live = self.live
+        kept = 0
+        for projectile in live:
+            if projectile.alive:
+                projectile.update(dt)
+                x, y = projectile.x, projectile.y
+                width, height = projectile.rect.size
+                if x <= right and y <= bottom and x + width >= left and y + height >= top:
+                    live[kept] = projectile
+                    kept += 1
+                    if index is not None:
+                        index.move(projectile)
+                    continue
+                projectile.alive = False
+                if index is not None:
+                    index.remove(projectile)
+            self.free.append(projectile)
+        del live[kept:]
+
+    def draw(self, screen, alpha=1.0):
+        """:param alpha: Fraction of the way from each shot's previous position to its current one."""
+        if alpha >= 1:
+            screen.blits([(projectile.image, (projectile.x, projectile.y)) for projectile in self.live if projectile.alive], doreturn=0)
+        else:
+            screen.blits([(projectile.image, projectile.draw_position(alpha)) for projectile in self.live if projectile.alive], doreturn=0)
+
+    def clear(self):
+        for projectile in self.live:
+            self.kill(projectile)
+            self.free.append(projectile)
+        self.live.clear()
@@ -0,0 +1,103 @@
+# quality.py
+
+from collections import deque
+
+
+class QualityTier:
+    """
+    What the game draws at one level of quality.
+
+    :param name: Shown in the log when the governor switches to this tier.
+    :param weather_density: Fraction of the leaves and snowflakes spawned.
+    :param leaf_rotation: Let falling leaves spin.
+    :param menu_outlines: Draw the outline around menu text.
+    :param smooth_scaling: Allow smoothscale when the window is scaled (if it is enabled).
+    :param hud_refresh_interval: Minimum seconds between HUD panel redraws.
+    """
+
+    def __init__(self, name, weather_density=1.0, leaf_rotation=True, menu_outlines=True,
+                 smooth_scaling=True, hud_refresh_interval=0):
+        self.name = name
+        self.weather_density = weather_density
+        self.leaf_rotation = leaf_rotation
+        self.menu_outlines = menu_outlines
+        self.smooth_scaling = smooth_scaling
+        self.hud_refresh_interval = hud_refresh_interval
+
+
+# From best looking to cheapest
+QUALITY_TIERS = [
+    QualityTier("high"),
+    QualityTier("medium", weather_density=0.6, smooth_scaling=False),
+    QualityTier("low", weather_density=0.4, leaf_rotation=False, smooth_scaling=False, hud_refresh_interval=0.1),
+    QualityTier("lowest", weather_density=0.25, leaf_rotation=False, menu_outlines=False, smooth_scaling=False,
+                hud_refresh_interval=0.25),
+]
+
+
+class QualityGovernor:
+    """
+    Watches how long frames take to produce and moves between quality tiers to stay within
+    the frame budget: one tier down when the average over the last frames goes over budget,
+    one tier back up after a longer stretch well under it.
+
+    Feed it clock.get_rawtime() after clock.tick(), the time spent on the frame without the
+    frame cap's sleep, and read the settings of the current tier from tier.
+
+    :param tiers: QualityTier list, best first.
+    :param budget: Milliseconds a frame may take (1000 / FPS).
+    :param window: Number of recent frames averaged.
+    :param headroom: Fraction of the budget the average must stay under to step back up.
+    :param down_after: Frames to wait after a change before stepping down again.
+    :param up_after: Frames to wait after a change before stepping back up.
+    """
+
+    def __init__(self, tiers=QUALITY_TIERS, budget=1000 / 60, window=30, headroom=0.6, down_after=30, up_after=300):
+        self.tiers = tiers
+        self.budget = budget
+        self.headroom = headroom
+        self.down_after = down_after
+        self.up_after = up_after
+        self.frame_times = deque(maxlen=window)
+        self.index = 0
+        self.frames_since_change = 0
+        self.enabled = True
+
+    @property
+    def tier(self):
+        return self.tiers[self.index]
+
+    def record(self, frame_time):
+        """
+        :param frame_time: Milliseconds spent on the last frame.
+        :return: True if the tier changed.
+        """
+        if not self.enabled:
+            return False
+        self.frame_times.append(frame_time)
+        self.frames_since_change += 1
+        if len(self.frame_times) < self.frame_times.maxlen:
+            return False
+
+        average = sum(self.frame_times) / len(self.frame_times)
+        if average > self.budget and self.index < len(self.tiers) - 1 and self.frames_since_change >= self.down_after:
+            self.set_tier(self.index + 1, average)
+            return True
+        if average < self.budget * self.headroom and self.index > 0 and self.frames_since_change >= self.up_after:
+            self.set_tier(self.index - 1, average)
+            return True
+        return False
+
+    def set_tier(self, index, average=None):
+        self.index = index
+        self.frame_times.clear()
+        self.frames_since_change = 0
+        if average is not None:
+            print(f"Quality tier: {self.tier.name} (average frame {average:.1f} ms)")
+
+    def reset(self):
+        self.set_tier(0)
+
+
+# Shared by the menus and every level, so a tier carries over between them
+governor = QualityGovernor()
@@ -0,0 +1,145 @@
+# renderer.py
+
+from contextlib import contextmanager
+import pygame
+
+
+class TrackingSurface(pygame.Surface):
+    """
+    A Surface that remembers where it was blitted to while tracking is on, so the dirty
+    renderer knows which parts of the frame changed without every sprite having to report
+    its own rectangle.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.tracking = False
+        self.drawn = []
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        rect = super().blit(source, dest, area, special_flags)
+        if self.tracking:
+            self.drawn.append(rect)
+        return rect
+
+    def blits(self, blit_sequence, doreturn=1):
+        rects = super().blits(blit_sequence, 1)
+        if self.tracking:
+            self.drawn.extend(rects)
+        return rects if doreturn else None
+
+    @contextmanager
+    def untracked(self):
+        """Draws without marking anything dirty, for content known to be unchanged."""
+        tracking = self.tracking
+        self.tracking = False
+        try:
+            yield self
+        finally:
+            self.tracking = tracking
+
+
+# Function to merge overlapping rectangles so shared areas are only copied once
+def merge_rects(rects):
+    merged = []
+    for rect in rects:
+        if not rect.width or not rect.height:
+            continue
+        for i, other in enumerate(merged):
+            if rect.colliderect(other):
+                merged[i] = other.union(rect)
+                break
+        else:
+            merged.append(rect)
+    return merged
+
+
+# Function to pre-composite everything that never moves into one display-format surface
+def build_static_layer(size, fill_color, images=()):
+    """
+    Builds the layer each frame starts from, so a frame begins with one straight copy
+    instead of a fill plus a blit that converts pixel formats.
+
+    :param size: Size of the layer.
+    :param fill_color: Color under everything (shows through transparent background pixels).
+    :param images: (surface, position) pairs drawn in order on top of the fill.
+    :return: The layer, in the display's pixel format.
+    """
+    layer = pygame.Surface(size).convert()
+    layer.fill(fill_color)
+    for image, position in images:
+        layer.blit(image, position)
+    return layer
+
+
+class DirtyRenderer:
+    """
+    Dirty-rectangle rendering for a game surface that is shown 1:1 on the display.
+
+    Instead of redrawing the background and flipping the whole window every frame, the
+    renderer puts the background back only where something was drawn last frame, and
+    pushes to the display only what was drawn last frame and this frame (so things that
+    moved away get erased too) with pygame.display.update(rects).
+
+    The game surface must be a TrackingSurface. Call begin_frame() before drawing and
+    present() once everything is drawn.
+
+    :param surface: The TrackingSurface the game draws on.
+    :param background: What the surface looks like with nothing drawn on it.
+    """
+
+    def __init__(self, surface, background):
+        self.surface = surface
+        self.background = background
+        self.previous_rects = []
+        self.clear_all = True
+        self.present_all = True
+
+    def invalidate(self):
+        """Redraws and presents the whole frame next time (new window, lost contents...)."""
+        self.clear_all = True
+        self.present_all = True
+
+    def begin_frame(self, restore=()):
+        """
+        Puts the background back where something was drawn last frame.
+
+        :param restore: More rectangles to put the background back under, for things drawn
+                        again every frame without being tracked (an unchanged HUD...).
+        """
+        self.surface.tracking = False
+        if self.clear_all:
+            self.clear_all = False
+            self.surface.blit(self.background, (0, 0))
+        else:
+            for rect in self.previous_rects + list(restore):
+                self.surface.blit(self.background, rect, rect)
+        self.surface.drawn = []
+        self.surface.tracking = True
+
+    def present(self, display):
+        """
+        Copies the changed areas to the display and updates just those.
+
+        :return: The rectangles that were updated.
+        """
+        self.surface.tracking = False
+        drawn = self.surface.drawn
+        if self.present_all:
+            display.blit(self.surface, (0, 0))
+            pygame.display.flip()
+            rects = [self.surface.get_rect()]
+            self.present_all = False
+        else:
+            rects = merge_rects(self.previous_rects + drawn)
+            for rect in rects:
+                display.blit(self.surface, rect, rect)
+            pygame.display.update(rects)
+        self.previous_rects = drawn
+        return rects
+
+    def skip_present(self):
+        """Ends a frame that was presented some other way (e.g. scaled to full screen)."""
+        self.surface.tracking = False
+        self.previous_rects = self.surface.drawn
+        self.present_all = True
@@ -0,0 +1,54 @@
+# replay.py
+#
+# Plays a recorded attempt at level 1 again. Attempts are recorded to recordings/ while
+# record_input = True in config.ini.
+#
+#     python replay.py recordings/level1-20261018-201500.json             # watch it in a window
+#     python replay.py recordings/level1-20261018-201500.json --speed 8   # 8 ticks per drawn frame
+#     python replay.py recordings/level1-20261018-201500.json --headless  # flat out, nothing drawn
+#
+# The replay starts the random streams from the recorded seed and hands the level the same
+# key presses and clicks before the same ticks, so it plays out exactly as the attempt did.
+# The state checksums kept in the recording are compared along the way to prove it.
+
+import sys
+import pygame
+from headless import LevelRun, use_dummy_drivers
+from inputs import Recording, ReplayInput
+
+
+# Function to play a recording again
+def replay(recording, render_interval=1, frame_rate=60):
+    """
+    :param recording: Recording of an attempt at level 1.
+    :param render_interval: Ticks per drawn frame (0 draws nothing).
+    :param frame_rate: Cap on the drawn frames per second (None runs flat out).
+    :return: The finished LevelRun and ReplayInput; the ReplayInput's mismatch is None if
+             every checksum matched.
+    """
+    replay_input = ReplayInput(recording)
+    run = LevelRun(recording.ticks, replay_input, render_interval, frame_rate, seed=recording.seed)
+    run.level.tick_rate = recording.settings["tick_rate"]
+    run.level.vectorized_creatures = recording.settings["vectorized_creatures"]
+    run.run()
+    return run, replay_input
+
+
+if __name__ == "__main__":
+    arguments = sys.argv[1:]
+    if not arguments:
+        print("Usage: python replay.py RECORDING [--speed TICKS_PER_FRAME] [--headless]")
+        sys.exit(1)
+    speed = 1
+    if "--speed" in arguments:
+        speed = int(arguments.pop(arguments.index("--speed") + 1))
+    if "--headless" in arguments:
+        use_dummy_drivers()
+        run, replay_input = replay(Recording.load(arguments[0]), render_interval=0, frame_rate=None)
+    else:
+        run, replay_input = replay(Recording.load(arguments[0]), render_interval=speed)
+    run.report()
+    if replay_input.mismatch is None:
+        print(f"Matched the recording at all {replay_input.checked} checksums")
+    pygame.quit()
+    sys.exit(0 if replay_input.mismatch is None else 1)
@@ -0,0 +1,43 @@
+# rng.py
+#
+# Random numbers for the game, drawn from one stream per part of the game instead of the
+# shared random module. A stream only moves on when its own part rolls, so an extra roll
+# somewhere else (a rabbit dropping a berry) never changes what the spawns or the bear do
+# next, and an attempt at a level can be played again exactly from its seed.
+
+import random
+
+# spawns: which lane and how fast new creatures come in, and whether the bear shows up
+# fox_speed: the speed a fox picks when it appears and again after eating
+# bear: the bear's teleports
+# drops: the powerup rolls of rabbits, foxes and the bear
+# weather: leaves, snow and wind in levels 2 and 3
+STREAM_NAMES = ["spawns", "fox_speed", "bear", "drops", "weather"]
+
+
+class RandomStreams:
+    """
+    One random.Random per name in STREAM_NAMES, as attributes (streams.spawns.choice(...)),
+    all derived from a single seed.
+    """
+
+    def __init__(self, names=STREAM_NAMES):
+        self.names = names
+        self.seed = None
+        self.reseed()
+
+    def reseed(self, seed=None):
+        """
+        :param seed: Integer to derive every stream from; None picks a fresh one.
+        :return: The seed, which is all a recording needs to roll the same numbers again.
+        """
+        if seed is None:
+            seed = random.SystemRandom().randrange(2 ** 32)
+        self.seed = seed
+        for name in self.names:
+            setattr(self, name, random.Random(f"{seed}:{name}"))
+        return seed
+
+
+# Shared by every level and sprite
+streams = RandomStreams()
@@ -0,0 +1,218 @@
+# tests/test_projectiles.py
+
+import math
+import random
+import numpy
+import pygame
+from collisions import AmmoIndex, CREATURE_HITS
+from projectiles import Projectile, ProjectileBuffer
+
+BOUNDS = pygame.Rect(0, 0, 800, 600)
+DT = 1 / 60
+
+
+# Function to make a plain square image for a shot
+def shot_image(color=(255, 128, 0), size=(25, 25)):
+    image = pygame.Surface(size, pygame.SRCALPHA)
+    image.fill(color)
+    return image
+
+# Function to make a buffer whose shots are kept in a collision index
+def indexed_buffer(capacity=8):
+    index = AmmoIndex()
+    return ProjectileBuffer(capacity, BOUNDS, Projectile, index), index
+
+
+def test_full_buffer_recycles_the_oldest_shot():
+    buffer, index = indexed_buffer(capacity=2)
+    image = shot_image()
+    first = buffer.fire(10, 10, image, "carrot")
+    second = buffer.fire(200, 10, image, "carrot")
+    third = buffer.fire(500, 300, image, "carrot")
+
+    assert third is first  # The oldest slot was reused
+    assert list(buffer) == [second, third]
+    assert len(index) == 2
+    # Nothing is left in the index where the recycled shot used to be
+    assert index.hits(pygame.Rect(0, 0, 40, 40), "rabbit") == []
+    assert index.hits(pygame.Rect(490, 290, 40, 40), "rabbit") == [third]
+    # The recycled shot counts as the newest one
+    assert index.hits(pygame.Rect(0, 0, 800, 600), "rabbit") == [second, third]
+
+
+def test_recycling_a_killed_but_not_yet_freed_shot():
+    buffer, index = indexed_buffer(capacity=2)
+    image = shot_image()
+    first = buffer.fire(10, 10, image, "carrot")
+    buffer.fire(200, 10, image, "carrot")
+    buffer.kill(first)
+    third = buffer.fire(500, 300, image, "carrot")
+
+    assert third is first
+    assert len(index) == 2
+    assert third in index
+
+
+def test_shot_killed_between_updates_is_freed_and_its_slot_reused():
+    buffer, index = indexed_buffer(capacity=3)
+    image = shot_image()
+    shots = [buffer.fire(100 * i, 100, image, "carrot", speed=2) for i in range(3)]
+
+    buffer.kill(shots[1])
+    assert shots[1] not in index
+    assert list(buffer) == shots  # Still in its slot until the next update
+
+    buffer.update(DT)
+    assert list(buffer) == [shots[0], shots[2]]
+    assert not shots[1].alive
+    assert shots[1].x == 100  # A killed shot does not move
+    assert buffer.fire(0, 0, image, "berry") is shots[1]
+    assert len(buffer) == 3
+    assert len(index) == 3
+
+
+def test_killing_every_shot_while_iterating():
+    buffer, index = indexed_buffer()
+    image = shot_image()
+    for i in range(5):
+        buffer.fire(50 * i, 100, image, "carrot")
+    for shot in buffer:
+        buffer.kill(shot)
+    buffer.kill(next(iter(buffer)))  # Killing twice is harmless
+    buffer.update(DT)
+    assert len(buffer) == 0
+    assert len(index) == 0
+    assert len(buffer.free) == 8
+
+
+def test_shots_leaving_any_edge_are_dropped():
+    buffer, index = indexed_buffer()
+    image = shot_image()
+    right = buffer.fire(780, 300, image, "carrot", speed=10)
+    left = buffer.fire(5, 300, image, "carrot", speed=10, angle=180)
+    up = buffer.fire(400, 5, image, "carrot", speed=10, angle=90)
+    down = buffer.fire(400, 580, image, "carrot", speed=10, angle=-90)
+    staying = buffer.fire(400, 300, image, "carrot", speed=0)
+
+    buffer.update(DT)  # Everything is still touching the screen
+    assert len(buffer) == 5
+    for _ in range(3):
+        buffer.update(DT)
+    assert list(buffer) == [staying]
+    assert len(index) == 1
+    for shot in (right, left, up, down):
+        assert not shot.alive
+        assert shot not in index
+
+
+def test_shot_touching_the_edge_is_kept():
+    buffer, index = indexed_buffer()
+    shot = buffer.fire(800, 600, shot_image(), "carrot", speed=0)  # Top left corner on the bottom right corner
+    buffer.update(DT)
+    assert list(buffer) == [shot]
+
+
+def test_hits_are_in_fire_order_after_moving_between_cells():
+    buffer, index = indexed_buffer()
+    image = shot_image()
+    # Each shot fired further left and faster than the one before, so they overtake each other
+    # and end up in the grid cells in the opposite order
+    shots = [buffer.fire(60 - 25 * i, 100, image, "carrot", speed=3 * (i + 1)) for i in range(3)]
+    berry = buffer.fire(60, 100, image, "berry", speed=3)
+    for _ in range(40):
+        buffer.update(DT)
+    creature = pygame.Rect(0, 0, 800, 600)
+
+    assert index.hits(creature, "rabbit") == shots
+    assert index.first_hit(creature, "rabbit") is shots[0]
+    assert index.hits(creature, "fox") == [berry]
+    assert index.hits(creature, "bear") == shots + [berry]
+
+    buffer.kill(shots[0])
+    assert index.first_hit(creature, "rabbit") is shots[1]
+
+
+def test_first_hit_matches_a_scan_of_every_shot():
+    rng = random.Random(1)
+    buffer, index = indexed_buffer(capacity=64)
+    image = shot_image(size=(25, 25))
+    fired = []  # Every shot in the order it was fired, for the scan
+    for tick in range(600):
+        if tick % 3 == 0:
+            shot = buffer.fire(rng.randint(0, 780), rng.randint(0, 580), image, rng.choice(["carrot", "berry", "honey"]),
+                               speed=rng.choice([0, 2, 5]), angle=rng.choice([0, 45, -45, 180]))
+            if shot in fired:
+                fired.remove(shot)
+            fired.append(shot)
+        buffer.update(DT)
+        rect = pygame.Rect(rng.randint(0, 760), rng.randint(0, 540), 60, 60)
+        creature = rng.choice(list(CREATURE_HITS))
+        expected = next((shot for shot in fired
+                         if shot.alive and shot.type in CREATURE_HITS[creature] and shot.rect.colliderect(rect)), None)
+        assert index.first_hit(rect, creature) is expected
+        if expected is not None:
+            buffer.kill(expected)
+
+
+class ListShot:
+    """A shot as level 1 kept them before the buffer: in a plain list, turning its angle into a direction every tick."""
+
+    def __init__(self, x, y, image, ammo_type, speed, angle):
+        self.x = x
+        self.y = y
+        self.image = image
+        self.type = ammo_type
+        self.speed = speed
+        self.angle = math.radians(angle)
+        self.rect = image.get_rect(topleft=(x, y))
+
+    def update(self):
+        self.x += self.speed * math.cos(self.angle)
+        self.y -= self.speed * math.sin(self.angle)
+        self.rect.x = self.x
+        self.rect.y = self.y
+
+
+def test_frames_match_a_plain_list_of_shots():
+    """A seeded 3000-tick throwing session draws the same frames with the buffer as with a list of shots."""
+    rng = random.Random(1)
+    images = {"carrot": shot_image((255, 128, 0)), "berry": shot_image((128, 0, 128)), "honey": shot_image((255, 200, 0))}
+    creatures = [(pygame.Rect(400, 90, 40, 40), "rabbit"), (pygame.Rect(600, 230, 60, 60), "fox"),
+                 (pygame.Rect(250, 350, 60, 60), "bear"), (pygame.Rect(700, 500, 40, 40), "rabbit")]
+    buffer, index = indexed_buffer(capacity=64)
+    shots = []
+    eaten = 0
+    frame = pygame.Surface(BOUNDS.size)
+    expected_frame = pygame.Surface(BOUNDS.size)
+
+    for tick in range(3000):
+        if tick % 10 == 0:
+            throw = (40 + rng.randint(0, 3) * 140, rng.randint(50, 550), rng.choice(list(images)),
+                     rng.choice([2, 5]), rng.choice([0, 0, 45, -45]))
+            x, y, ammo_type, speed, angle = throw
+            buffer.fire(x, y, images[ammo_type], ammo_type, speed=speed, angle=angle)
+            shots.append(ListShot(x, y, images[ammo_type], ammo_type, speed, angle))
+            assert len(buffer) < 64  # A full buffer would start recycling, which the list never did
+
+        # Every creature eats the first shot touching it that it can be hit by
+        for rect, creature in creatures:
+            hit = index.first_hit(rect, creature)
+            if hit is not None:
+                buffer.kill(hit)
+            expected = next((shot for shot in shots if shot.type in CREATURE_HITS[creature] and shot.rect.colliderect(rect)), None)
+            if expected is not None:
+                shots.remove(expected)
+                eaten += 1
+
+        buffer.update(DT)
+        for shot in shots:
+            shot.update()
+        shots = [shot for shot in shots if shot.x <= BOUNDS.right]
+
+        frame.fill((0, 0, 0))
+        buffer.draw(frame)
+        expected_frame.fill((0, 0, 0))
+        for shot in shots:
+            expected_frame.blit(shot.image, (shot.x, shot.y))
+        assert numpy.array_equal(pygame.surfarray.pixels2d(frame), pygame.surfarray.pixels2d(expected_frame)), f"tick {tick}"
+    assert eaten > 20  # The creatures really did eat shots along the way
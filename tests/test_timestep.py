@@ -0,0 +1,86 @@
+# tests/test_timestep.py
+
+import math
+import pygame
+import pytest
+from projectiles import Projectile
+from timestep import FixedTimestep, Interpolated
+
+
+class Dot(Interpolated):
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+def test_slow_frame_runs_capped_catch_up_ticks_and_drops_the_rest():
+    timestep = FixedTimestep(tick_rate=60, max_ticks=5)
+    assert timestep.advance(0.5) == 5
+    assert timestep.dropped_time == pytest.approx(0.5 - 5 / 60)
+    assert timestep.accumulator == pytest.approx(0.0)
+    assert timestep.alpha == pytest.approx(0.0)
+    # The dropped time is not caught up later
+    assert timestep.advance(1 / 60) == 1
+
+
+def test_slow_frame_under_the_cap_catches_up_every_tick():
+    timestep = FixedTimestep(tick_rate=60, max_ticks=5)
+    assert timestep.advance(3.5 / 60) == 3
+    assert timestep.dropped_time == 0.0
+    assert timestep.alpha == pytest.approx(0.5)
+
+
+def test_fast_frames_run_no_tick_until_a_whole_tick_has_passed():
+    timestep = FixedTimestep(tick_rate=60)
+    assert timestep.advance(0.004) == 0
+    assert timestep.alpha == pytest.approx(0.004 * 60)
+    assert timestep.advance(0.004) == 0
+    assert timestep.alpha == pytest.approx(0.008 * 60)
+    assert timestep.advance(0.010) == 1
+    assert timestep.alpha == pytest.approx((0.018 - 1 / 60) * 60)
+
+
+def test_frames_at_the_tick_rate_run_one_tick_each():
+    timestep = FixedTimestep(tick_rate=60)
+    for _ in range(600):
+        assert timestep.advance(1 / 60) == 1
+        assert timestep.alpha == pytest.approx(0.0, abs=1e-9)
+    assert timestep.dropped_time == 0.0
+
+
+def test_high_refresh_rate_runs_the_tick_rate():
+    timestep = FixedTimestep(tick_rate=60)
+    ticks = sum(timestep.advance(1 / 144) for _ in range(144 * 10))
+    assert ticks in (599, 600)  # Ten seconds, give or take the tick still in the accumulator
+
+
+def test_draw_position_before_the_first_remember_position():
+    dot = Dot(10, 20)
+    assert dot.draw_position(0.0) == (10, 20)
+    assert dot.draw_position(0.5) == (10, 20)
+
+
+def test_draw_position_between_the_last_two_ticks():
+    dot = Dot(10, 20)
+    dot.remember_position()
+    dot.x, dot.y = 20, 40
+    assert dot.draw_position(0.0) == (10, 20)
+    assert dot.draw_position(0.25) == (12.5, 25)
+    assert dot.draw_position(1.0) == (20, 40)
+    assert dot.draw_position(1.5) == (20, 40)  # Never past the latest tick
+
+
+@pytest.mark.parametrize("speed, angle", [(2, 0), (5, 0), (5, 45), (2, -45)])
+def test_at_60_hz_and_alpha_1_shots_are_drawn_where_the_per_frame_loop_drew_them(speed, angle):
+    timestep = FixedTimestep(tick_rate=60)
+    shot = Projectile()
+    shot.fire(100, 300, pygame.Surface((25, 25)), speed=speed, angle=angle)
+    # Before the fixed timestep, shots moved speed pixels along their angle every frame
+    x, y = 100, 300
+    for _ in range(300):
+        for _ in range(timestep.advance(1 / 60)):
+            shot.update(timestep.step)
+        x += speed * math.cos(math.radians(angle))
+        y -= speed * math.sin(math.radians(angle))
+        draw_x, draw_y = shot.draw_position(1.0)
+        assert (int(draw_x), int(draw_y)) == (int(x), int(y))
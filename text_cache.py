@@ -0,0 +1,59 @@
+# text_cache.py
+
+from collections import OrderedDict
+import pygame
+
+
+class TextCache:
+    """
+    Rendered text surfaces keyed by (text, font, color, outline color, scale, outline width).
+
+    Outlined text is composited once: the outline is stamped at the eight offsets around the
+    text and the text is drawn on top, so callers blit a single surface per label instead of
+    rendering twice and blitting nine times every frame. Cached surfaces are shared and must
+    not be modified.
+    """
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self.surfaces = OrderedDict()
+
+    def render(self, text, font, color, outline_color=None, scale_factor=1.0, outline_width=2):
+        key = (text, font, tuple(color), outline_color and tuple(outline_color), scale_factor, outline_width)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            return surface
+
+        surface = self.scaled(font.render(text, True, color), scale_factor)
+        if outline_color is not None and outline_width > 0:
+            outline_surface = self.scaled(font.render(text, True, outline_color), scale_factor)
+            width, height = surface.get_size()
+            composite = pygame.Surface((width + 2 * outline_width, height + 2 * outline_width), pygame.SRCALPHA)
+            for dx in (-outline_width, 0, outline_width):
+                for dy in (-outline_width, 0, outline_width):
+                    if dx != 0 or dy != 0:
+                        composite.blit(outline_surface, (outline_width + dx, outline_width + dy))
+            composite.blit(surface, (outline_width, outline_width))
+            surface = composite
+
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    @staticmethod
+    def scaled(surface, scale_factor):
+        if scale_factor == 1.0:
+            return surface
+        return pygame.transform.scale(
+            surface,
+            (int(surface.get_width() * scale_factor), int(surface.get_height() * scale_factor))
+        )
+
+    def clear(self):
+        self.surfaces.clear()
+
+
+# Shared by every menu
+text_cache = TextCache()
@@ -0,0 +1,66 @@
+# timestep.py
+
+# Speeds given in pixels per frame were tuned at this many frames per second; movement
+# multiplies them by dt * REFERENCE_RATE so it stays the same at any tick rate
+REFERENCE_RATE = 60
+
+
+class FixedTimestep:
+    """
+    Runs the simulation in ticks of a fixed length, however long the rendered frames take.
+
+    Frame time goes into an accumulator and advance() says how many whole ticks fit in it,
+    so a slow frame is caught up with several ticks before the next render (rendering is
+    skipped, the game does not slow down) and a fast one may run none. What is left over
+    becomes alpha, how far the next tick has progressed, for drawing moving things between
+    their last two positions.
+
+    At most max_ticks run per frame; if the game falls further behind than that, the extra
+    time is dropped and it slows down rather than spiralling into ever longer frames.
+
+    :param tick_rate: Ticks per second.
+    :param max_ticks: Most ticks run for one rendered frame.
+    """
+
+    def __init__(self, tick_rate=60, max_ticks=5):
+        self.tick_rate = tick_rate
+        self.step = 1 / tick_rate
+        self.max_ticks = max_ticks
+        self.accumulator = 0.0
+        self.alpha = 1.0
+        self.dropped_time = 0.0  # Seconds of simulation lost to the max_ticks cap
+
+    def advance(self, frame_time):
+        """
+        :param frame_time: Seconds since the last frame.
+        :return: Number of ticks to run before rendering this frame.
+        """
+        self.accumulator += frame_time
+        ticks = int(self.accumulator // self.step)
+        if ticks > self.max_ticks:
+            self.dropped_time += self.accumulator - self.max_ticks * self.step
+            ticks = self.max_ticks
+            self.accumulator = ticks * self.step
+        self.accumulator -= ticks * self.step
+        self.alpha = self.accumulator / self.step
+        return ticks
+
+
+class Interpolated:
+    """
+    Mixin for sprites that move in ticks but are drawn every frame: update() remembers where
+    the sprite was before the tick, and draw_position() gives the point between that and where
+    it is now for the timestep's alpha.
+    """
+
+    prev_x = None
+    prev_y = None
+
+    def remember_position(self):
+        self.prev_x = self.x
+        self.prev_y = self.y
+
+    def draw_position(self, alpha=1.0):
+        if alpha >= 1 or self.prev_x is None:
+            return self.x, self.y
+        return self.prev_x + (self.x - self.prev_x) * alpha, self.prev_y + (self.y - self.prev_y) * alpha